@@ -0,0 +1,149 @@
+"""
+Ablauf einer Analyse: Signale 1-3 plus Zusatz-Checks, parallel ausgeführt.
+
+Reine Orchestrierung ohne Streamlit — leicht testbar. Die Prüfungen
+blockieren fast nur auf Netzwerk-I/O; auf einem kleinen Thread-Pool
+laufen sie gleichzeitig, die Gesamtdauer liegt damit nahe an der
+langsamsten Prüfung statt an der Summe aller vier.
+
+Abhängigkeit: Signal 2, Signal 3 und check_website() werten denselben
+Startseiten-Snapshot aus — sie starten, sobald die Startseite da ist.
+Signal 1 (robots.txt) läuft von Anfang an parallel dazu; check_website()
+wartet zusätzlich auf Signal 1, weil es dessen Sitemap:-Zeilen nutzt.
+
+Zeitbudget: Alle Prüfungen teilen sich eine Deadline (ANALYSE_BUDGET
+Sekunden ab Start). Jeder Abruf bekommt nur die Restzeit; was danach
+noch fehlt, kommt als UNBEKANNT "Zeitbudget überschritten" zurück.
+Hängt die Startseite oder robots.txt bis dahin, werden die davon
+abhängigen Prüfungen gar nicht mehr gestartet, sondern direkt so markiert.
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+from befund import baue_befund
+from signals import (
+    ZEITBUDGET_UEBERSCHRITTEN, PageSnapshot, RenderingResult, RobotsResult, SchemaResult,
+    check_rendering, check_robots, check_schema, fetch_homepage,
+    protokolliere, submit_mit_kontext,
+)
+from zusatz_checks import check_website
+
+# Obergrenze paralleler Abrufe pro Analyse (robots + Startseite, danach
+# Signal 2, Signal 3 und Zusatz-Checks). Mehr bringt nichts und wäre
+# gegenüber kleinen Hotel-Servern unhöflich.
+MAX_PARALLEL = 4
+
+# Gesamtbudget einer Analyse in Sekunden. Die Prüfungen halten es selbst
+# ein; NACHLAUF ist nur die Sicherung für Arbeit, die danach noch hängt
+# (z. B. Parsen einer sehr großen Seite).
+ANALYSE_BUDGET = float(os.environ.get("GEO_RADAR_ANALYSE_BUDGET", "45"))
+NACHLAUF = 2.0
+
+# Fortschritts-Texte je Prüfung (für die Statuszeile der App).
+FORTSCHRITT = {
+    "s1": "KI-Zugang (robots.txt)",
+    "startseite": "Startseite geladen",
+    "s2": "Strukturierte Betriebsdaten (Schema.org)",
+    "s3": "Maschinenlesbarkeit der Startseite",
+    "facts": "Ergänzende technische Checkpunkte",
+}
+
+
+def _nicht_fertig(schluessel: str, domain: str, website: str):
+    """Platzhalter-Ergebnis für eine Prüfung, die das Zeitbudget gesprengt hat."""
+    grund = f"Prüfung nicht abgeschlossen ({ZEITBUDGET_UEBERSCHRITTEN})"
+    if schluessel == "startseite":
+        return PageSnapshot(url=f"https://{domain}/", error=ZEITBUDGET_UEBERSCHRITTEN,
+                            budget_exceeded=True)
+    if schluessel == "facts":
+        return {"https": website.startswith("https://"), "sitemap_exists": None,
+                "load_time": None, "zeitbudget": ["sitemap", "startseite"]}
+    klasse = {"s1": RobotsResult, "s2": SchemaResult, "s3": RenderingResult}[schluessel]
+    return klasse(domain=domain, fetch_error=grund, overall_status="UNBEKANNT",
+                  reason=ZEITBUDGET_UEBERSCHRITTEN)
+
+
+def fuehre_analyse_durch(
+    domain: str,
+    website: str,
+    melde: Optional[Callable[[str], None]] = None,
+    budget: float = ANALYSE_BUDGET,
+) -> dict:
+    """
+    Führt alle Prüfungen für eine Domain aus und liefert
+    {"s1", "s2", "s3", "facts", "befund", "netz"}.
+
+    netz: Abrufe dieser Analyse inkl. Cache-Treffer/-Fehlschläge
+    (Abrufprotokoll, siehe signals/http_client.py).
+
+    melde: wird nach JEDER abgeschlossenen Prüfung mit einer Statuszeile
+    aufgerufen — immer im aufrufenden Thread (Streamlit-Elemente dürfen
+    nicht aus Worker-Threads beschrieben werden).
+
+    budget: Sekunden für die gesamte Analyse (Standard ANALYSE_BUDGET).
+    """
+    ergebnisse: dict = {}
+    gesamt = len(FORTSCHRITT)
+    deadline = time.monotonic() + budget
+
+    # Kein `with` für den Pool: dessen __exit__ würde auf hängende Prüfungen
+    # warten und das Zeitbudget damit aushebeln.
+    pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL, thread_name_prefix="geo-analyse")
+    try:
+        with protokolliere() as protokoll:
+            def starte(fn, *args, **kwargs):
+                return submit_mit_kontext(pool, fn, *args, deadline=deadline, **kwargs)
+
+            def folge(schluessel, fn, *args, **kwargs):
+                # Nach dem ersten Platzhalter startet keine Folgeprüfung mehr —
+                # die Deadline ist dann ohnehin verstrichen.
+                if platzhalter:
+                    erledigt(schluessel, _nicht_fertig(schluessel, domain, website))
+                else:
+                    laufend[starte(fn, *args, **kwargs)] = schluessel
+
+            def erledigt(schluessel, ergebnis):
+                ergebnisse[schluessel] = ergebnis
+                if melde is not None:
+                    melde(f"🔍 {len(ergebnisse)}/{gesamt} fertig: {FORTSCHRITT[schluessel]} …")
+                if schluessel == "startseite":
+                    folge("s2", check_schema, domain, snapshot=ergebnis)
+                    folge("s3", check_rendering, domain, snapshot=ergebnis)
+                if schluessel in ("startseite", "s1") and \
+                        "startseite" in ergebnisse and "s1" in ergebnisse:
+                    folge("facts", check_website, website, snapshot=ergebnisse["startseite"],
+                          sitemaps=ergebnisse["s1"].sitemaps)
+
+            platzhalter: set = set()
+            laufend = {
+                starte(check_robots, domain): "s1",
+                starte(fetch_homepage, domain): "startseite",
+            }
+            while laufend:
+                rest = deadline + NACHLAUF - time.monotonic()
+                fertig, _ = wait(laufend, timeout=max(rest, 0), return_when=FIRST_COMPLETED)
+                if not fertig:
+                    # Budget samt Nachlauf verbraucht: Offenes wird UNBEKANNT
+                    for future, schluessel in list(laufend.items()):
+                        del laufend[future]
+                        platzhalter.add(schluessel)
+                        erledigt(schluessel, _nicht_fertig(schluessel, domain, website))
+                    continue
+                for future in fertig:
+                    erledigt(laufend.pop(future), future.result())
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    s1, s2, s3 = ergebnisse["s1"], ergebnisse["s2"], ergebnisse["s3"]
+    return {
+        "s1": s1,
+        "s2": s2,
+        "s3": s3,
+        "facts": ergebnisse["facts"],
+        "befund": baue_befund(s1, s2, s3),
+        "netz": protokoll.zusammenfassung(),
+    }
@@ -59,6 +59,12 @@ _EMPFEHLUNGEN = {
 }
 
 
+# Zusatz zur Begründung, wenn ein Signal nur auf dem Anfang einer zu großen
+# Datei beruht (Byte-Limit im Abruf-Layer).
+HINWEIS_GEKUERZT = ("Hinweis: Die Datei war größer als das Prüf-Limit — "
+                    "ausgewertet wurde nur der Anfang.")
+
+
 def baue_befund(s1, s2, s3) -> dict:
     """
     Nimmt RobotsResult, SchemaResult, RenderingResult und liefert ein
@@ -66,11 +72,14 @@ def baue_befund(s1, s2, s3) -> dict:
     """
     signale = []
     for key, res in (("s1", s1), ("s2", s2), ("s3", s3)):
+        grund = res.reason or ""
+        if getattr(res, "truncated", False):
+            grund = f"{grund} ({HINWEIS_GEKUERZT})" if grund else HINWEIS_GEKUERZT
         signale.append({
             "key": key,
             "name": SIGNAL_NAMEN[key],
             "status": res.overall_status,
-            "grund": res.reason or "",
+            "grund": grund,
         })
 
     overall = compute_overall([s["status"] for s in signale])
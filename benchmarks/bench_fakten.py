@@ -0,0 +1,84 @@
+"""
+Benchmark: HTML-Fakten der Zusatz-Checks — Regex-Kaskade gegen einen Durchgang.
+
+Vergleicht zwei Wege vom Startseiten-HTML zu den Fakten für build_checks():
+
+  alt:  die frühere Regex-Kaskade aus check_website() (fakten_regex in
+        tests/fakten_referenz.py, übernommen bis auf sortierte
+        hreflang_langs): gut 20 re.search/re.findall/re.sub über den
+        ganzen dekodierten Text.
+  neu:  zusatz_checks._html_fakten(): Kopfdaten und Seitenstruktur in einem
+        Durchgang über den lxml-Baum (signals/dokument.py), JSON-LD aus
+        demselben Baum. "neu" misst inklusive Parse; in der Analyse teilen
+        sich Signal 2/3 und die Zusatz-Checks diesen Parse, dann zählt nur
+        die Spalte "Durchgang".
+
+Die Testseiten sind synthetisch und WordPress-typisch (Block-Theme, großes
+Inline-CSS, jQuery-Konfiguration, Yoast-Graph, hreflang, viele Bilder und
+Links), aufgebläht auf die gewünschte Größe; Seiten und Kaskade teilt sich der
+Benchmark mit tests/test_zusatz_checks.py.
+
+Aufruf:
+    python benchmarks/bench_fakten.py [--kb 100 500 1500] [--runden 10]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests"))
+
+from fakten_referenz import erzeuge_seite, fakten_regex  # noqa: E402
+from signals import ParsedDocument                 # noqa: E402
+from zusatz_checks import _html_fakten             # noqa: E402
+
+
+def alt(body: bytes) -> dict:
+    return fakten_regex(body.decode("utf-8"), "www.hotel-bergblick.at")
+
+
+def neu(body: bytes) -> dict:
+    return _html_fakten(ParsedDocument(body, "utf-8"), "www.hotel-bergblick.at")
+
+
+def miss(fn, runden: int) -> float:
+    fn()                                               # Aufwärmen
+    t0 = time.perf_counter()
+    for _ in range(runden):
+        fn()
+    return (time.perf_counter() - t0) / runden
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--kb", type=int, nargs="+", default=[100, 500, 1500])
+    ap.add_argument("--runden", type=int, default=10)
+    args = ap.parse_args(argv)
+
+    print("alt = Regex-Kaskade, neu = Parse + Durchgang, Durchgang = bei geteiltem Parse")
+    print(f"{'Größe':>8} {'alt':>10} {'neu':>9} {'Durchgang':>10} {'Faktor':>7}"
+          f" {'geteilt':>8}  gleich")
+    for kb in args.kb:
+        body = erzeuge_seite(kb)
+        geparst = ParsedDocument(body, "utf-8")
+        geparst.wurzel
+
+        def durchgang():
+            geparst._ansichten.pop("_durchlauf", None)
+            return _html_fakten(geparst, "www.hotel-bergblick.at")
+
+        gleich = alt(body) == neu(body)
+        t_alt = miss(lambda: alt(body), args.runden)
+        t_neu = miss(lambda: neu(body), args.runden)
+        t_pass = miss(durchgang, args.runden)
+        print(f"{len(body) // 1024:>6}KB {t_alt * 1000:>7.1f} ms {t_neu * 1000:>6.1f} ms"
+              f" {t_pass * 1000:>7.1f} ms {t_alt / t_neu:>6.1f}x {t_alt / t_pass:>7.1f}x"
+              f"  {'ja' if gleich else 'NEIN'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
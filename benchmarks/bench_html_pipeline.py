@@ -0,0 +1,106 @@
+"""
+Benchmark: HTML-Pipeline auf Seiten OHNE Zeichensatz-Angabe.
+
+Vergleicht zwei Wege vom Rohbody zum Signal-3-Ergebnis:
+
+  alt:  Encoding raten wie requests (Response.text -> apparent_encoding,
+        charset_normalizer), Body als str dekodieren, str an lxml geben
+        (bs4 kodiert ihn dafür wieder), Muster-Suche auf str.
+  neu:  sniff_encoding() (BOM / Content-Type / <meta>, sonst UTF-8-Probe),
+        Rohbytes direkt an lxml, Marker-Suche auf den Bytes.
+
+Die Testseiten sind synthetisch (typische Hotel-Startseite, aufgebläht auf
+die gewünschte Größe), UTF-8 ohne <meta charset> und ohne charset im
+Content-Type — genau der Fall, in dem requests raten muss.
+
+Aufruf:
+    python benchmarks/bench_html_pipeline.py [--kb 300] [--runden 10]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "signals"))
+
+from charset_normalizer import from_bytes       # noqa: E402  (Abhängigkeit von requests)
+
+from http_client import sniff_encoding          # noqa: E402
+from signal3_rendering import evaluate_html     # noqa: E402
+
+_ABSCHNITT = """
+<section class="zimmer"><h2>Doppelzimmer Bergblick</h2>
+<p>Genießen Sie den Blick auf die Kitzbüheler Alpen. Frühstück vom regionalen
+Buffet, Wellness mit Saunalandschaft und Ruheraum, Skibus direkt vor dem Haus.
+Preise ab 149 € pro Person und Nacht — Kinderermäßigung bis 12 Jahre.</p>
+<script>window.dataLayer=window.dataLayer||[];dataLayer.push({"zimmer":"dz"});</script>
+</section>
+"""
+
+_RAHMEN = """<!DOCTYPE html><html lang="de"><head><title>Hotel Bergblick</title>
+<style>body{{font-family:sans-serif}}</style></head><body>
+<header><nav><a href="/zimmer">Zimmer</a><a href="/kontakt">Kontakt</a></nav></header>
+<main>{inhalt}</main>
+<footer>Hotel Bergblick · Hahnenkammstraße 12 · 6370 Kitzbühel · Tel. +43 5356 62222</footer>
+</body></html>"""
+
+
+def erzeuge_seite(kb: int) -> bytes:
+    abschnitt = _ABSCHNITT.encode("utf-8")
+    anzahl = max(1, kb * 1024 // len(abschnitt))
+    return _RAHMEN.format(inhalt=_ABSCHNITT * anzahl).encode("utf-8")
+
+
+def zeichensatz_alt(body: bytes) -> str:
+    encoding = from_bytes(body).best().encoding        # = Response.apparent_encoding
+    return body.decode(encoding, errors="replace")
+
+
+def zeichensatz_neu(body: bytes) -> str:
+    return sniff_encoding(body, "text/html")
+
+
+def alt(body: bytes):
+    return evaluate_html(zeichensatz_alt(body))
+
+
+def neu(body: bytes):
+    return evaluate_html(body, encoding=zeichensatz_neu(body))
+
+
+def miss(fn, body: bytes, runden: int) -> float:
+    fn(body)                                           # Aufwärmen
+    t0 = time.perf_counter()
+    for _ in range(runden):
+        fn(body)
+    return (time.perf_counter() - t0) / runden
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--kb", type=int, nargs="+", default=[50, 300, 1500])
+    ap.add_argument("--runden", type=int, default=10)
+    args = ap.parse_args(argv)
+
+    print("Zeichensatz = Encoding bestimmen (+ dekodieren), gesamt = bis zum RenderingResult")
+    print(f"{'Größe':>8} {'Zeichens. alt':>14} {'neu':>7} {'gesamt alt':>11} {'neu':>7}"
+          f" {'Faktor':>7}  gleich")
+    for kb in args.kb:
+        body = erzeuge_seite(kb)
+        r_alt, r_neu = alt(body), neu(body)
+        gleich = (r_alt.overall_status, r_alt.visible_text_length, r_alt.address_evidence,
+                  r_alt.phone_evidence) == (r_neu.overall_status, r_neu.visible_text_length,
+                                           r_neu.address_evidence, r_neu.phone_evidence)
+        z_alt = miss(zeichensatz_alt, body, args.runden)
+        z_neu = miss(zeichensatz_neu, body, args.runden)
+        t_alt, t_neu = miss(alt, body, args.runden), miss(neu, body, args.runden)
+        print(f"{len(body) // 1024:>6}KB {z_alt * 1000:>11.2f} ms {z_neu * 1000:>7.2f}"
+              f" {t_alt * 1000:>8.1f} ms {t_neu * 1000:>7.1f} {t_alt / t_neu:>6.2f}x"
+              f"  {'ja' if gleich else 'NEIN'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
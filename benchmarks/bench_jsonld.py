@@ -0,0 +1,130 @@
+"""
+Benchmark: JSON-LD-Blöcke parsen (Signal 2) bei großen @graph-Payloads.
+
+Vergleicht die JSON-Backends von _extract_ld_blocks:
+
+  json:    Standardbibliothek (bisher einziger Weg).
+  orjson:  wenn installiert — JSON_BACKEND "orjson".
+
+Die Seiten sind synthetisch, aber nach dem Muster echter Hotel-Websites
+gebaut: ein Yoast-artiger @graph (WebSite, WebPage, Hotel) plus eingebettete
+Event-Kalender bzw. Zimmer-/Paket-Kataloge als Product mit Offers — die
+Blöcke, die auf manchen Seiten mehrere MB erreichen. Gemessen wird ohne
+Größengrenzen und mit den Standardgrenzen (MAX_LD_BLOCK_BYTES,
+MAX_LD_SEITE_BYTES): Blöcke darüber werden gar nicht erst geparst.
+
+Aufruf:
+    python benchmarks/bench_jsonld.py [--kb 50 500 2000 5000] [--runden 5]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "signals"))
+
+import signal2_schema                           # noqa: E402
+from dokument import ParsedDocument             # noqa: E402
+
+_KOPF = {
+    "@context": "https://schema.org",
+    "@graph": [
+        {"@type": "WebSite", "@id": "https://www.hotel-bergblick.at/#website",
+         "url": "https://www.hotel-bergblick.at/", "name": "Hotel Bergblick"},
+        {"@type": "WebPage", "@id": "https://www.hotel-bergblick.at/#webpage",
+         "isPartOf": {"@id": "https://www.hotel-bergblick.at/#website"},
+         "about": {"@id": "https://www.hotel-bergblick.at/#hotel"}},
+        {"@type": "Hotel", "@id": "https://www.hotel-bergblick.at/#hotel",
+         "name": "Hotel Bergblick", "telephone": "+43 5356 62222",
+         "address": {"@type": "PostalAddress", "streetAddress": "Hahnenkammstraße 12",
+                     "postalCode": "6370", "addressLocality": "Kitzbühel"},
+         "geo": {"@type": "GeoCoordinates", "latitude": 47.446, "longitude": 12.392}},
+    ],
+}
+
+
+def _event(i: int) -> dict:
+    return {
+        "@type": "Event", "@id": f"https://www.hotel-bergblick.at/events/{i}#event",
+        "name": f"Hüttenabend mit Live-Musik Nr. {i}",
+        "startDate": f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}T19:00:00+01:00",
+        "location": {"@id": "https://www.hotel-bergblick.at/#hotel"},
+        "description": "Regionale Schmankerl, Zithermusik und Blick auf den Wilden Kaiser. " * 2,
+        "image": [f"https://www.hotel-bergblick.at/media/event-{i}-{g}.jpg" for g in range(3)],
+        "offers": {"@type": "Offer", "price": f"{29 + i % 40}.00", "priceCurrency": "EUR",
+                   "availability": "https://schema.org/InStock"},
+    }
+
+
+def _produkt(i: int) -> dict:
+    return {
+        "@type": "Product", "@id": f"https://www.hotel-bergblick.at/pakete/{i}#product",
+        "name": f"Wellness-Paket {i}", "sku": f"WP-{i:05d}",
+        "brand": {"@type": "Brand", "name": "Hotel Bergblick"},
+        "offers": [{"@type": "Offer", "price": f"{199 + n * 30}.00", "priceCurrency": "EUR",
+                    "validFrom": "2025-01-01", "eligibleQuantity": {"@type": "QuantitativeValue",
+                                                                    "value": n + 2}}
+                   for n in range(4)],
+        "aggregateRating": {"@type": "AggregateRating", "ratingValue": 4.7, "reviewCount": 120 + i},
+    }
+
+
+def erzeuge_seite(kb: int, art: str) -> str:
+    graph = json.loads(json.dumps(_KOPF))
+    eintrag = _event if art == "Events" else _produkt
+    groesse, i = len(json.dumps(graph)), 0
+    while groesse < kb * 1024:
+        graph["@graph"].append(eintrag(i))
+        groesse += len(json.dumps(graph["@graph"][-1], ensure_ascii=False).encode("utf-8"))
+        i += 1
+    block = json.dumps(graph, ensure_ascii=False)
+    return (f'<html><head><script type="application/ld+json">{block}</script></head>'
+            f'<body><p>Hotel Bergblick</p></body></html>')
+
+
+def messen(dokument: ParsedDocument, runden: int) -> tuple[float, list]:
+    bester, bloecke = float("inf"), []
+    for _ in range(runden):
+        start = time.perf_counter()
+        bloecke = signal2_schema._extract_ld_blocks(dokument)
+        bester = min(bester, time.perf_counter() - start)
+    return bester, bloecke
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--kb", type=int, nargs="+", default=[50, 500, 2000, 5000])
+    parser.add_argument("--runden", type=int, default=5)
+    args = parser.parse_args()
+
+    backends = ["json"] + (["orjson"] if signal2_schema.orjson is not None else [])
+    if len(backends) == 1:
+        print("orjson nicht installiert — nur die Standardbibliothek wird gemessen.")
+    grenzen = (signal2_schema.MAX_LD_BLOCK_BYTES, signal2_schema.MAX_LD_SEITE_BYTES)
+
+    print(f"{'Payload':<10}{'KB':>6}" + "".join(f"{b:>10}" for b in backends)
+          + f"{'Grenzen':>12}  Ergebnis mit Grenzen")
+    for art in ("Events", "Produkte"):
+        for kb in args.kb:
+            dokument = ParsedDocument(erzeuge_seite(kb, art))
+            dokument.ld_json                   # Blöcke vorab ziehen, gemessen wird das Parsen
+            zeilen, referenz = [], None
+            signal2_schema.MAX_LD_BLOCK_BYTES = signal2_schema.MAX_LD_SEITE_BYTES = 1 << 40
+            for backend in backends:
+                signal2_schema.JSON_BACKEND = backend
+                dauer, bloecke = messen(dokument, args.runden)
+                referenz = referenz or bloecke
+                assert bloecke == referenz, "Backends liefern verschiedene Blöcke"
+                zeilen.append(f"{dauer * 1000:>8.1f}ms")
+            signal2_schema.MAX_LD_BLOCK_BYTES, signal2_schema.MAX_LD_SEITE_BYTES = grenzen
+            dauer, bloecke = messen(dokument, args.runden)
+            ergebnis = bloecke[0][1] or "geparst"
+            print(f"{art:<10}{kb:>6}" + "".join(f"{z:>10}" for z in zeilen)
+                  + f"{dauer * 1000:>10.1f}ms  {ergebnis}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: Adress-/Telefonsuche (Signal 3) auf bösartigen Eingaben.
+
+Vergleicht zwei Wege:
+
+  alt:  die früheren, unbegrenzten Muster per .search() über das ganze rohe
+        HTML — samt Inline-Scripts und Base64-Blobs.
+  neu:  _find_address/_find_phone über ParsedDocument.kontaktfenster
+        (tel:-Links, <address>, sichtbare Textknoten, JSON-LD) mit begrenzten
+        bzw. possessiven Mustern.
+
+Teil 1 misst die Muster direkt auf einem Fenster wachsender Größe: bleibt
+die Zeit pro KB gleich, ist die Suche linear. Teil 2 misst eine Seite mit
+großem minifiziertem Inline-Script. Der alte Weg läuft nur bis --alt-max-kb,
+die Bindestrich-Kette braucht dort schon bei 40 KB Minuten.
+
+Aufruf:
+    python benchmarks/bench_kontakt.py [--kb 50 100 200 400] [--alt-max-kb 8]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "signals"))
+
+from dokument import ParsedDocument                       # noqa: E402
+from signal3_rendering import _find_address, _find_phone  # noqa: E402
+
+_ALT = [
+    re.compile(r'(?:\+|00)\d{1,3}[\s\-\/\.\(\)]{0,3}\d{1,5}[\s\-\/\.\(\)]{0,3}\d{2,}'
+               r'[\s\-\/\.\(\)]{0,3}\d{2,}'),
+    re.compile(r'\b0\d{2,4}[\s\-\/\.\(\)]{1,3}\d{3,}[\s\-\/\.\(\)]{0,3}\d{0,}'),
+    re.compile(r'\b[A-ZÄÖÜa-zäöüß\-]+(?:straße|strasse|str\.|weg|gasse|platz|allee|ring|ufer)'
+               r'\s+\d{1,4}\b', re.IGNORECASE),
+    re.compile(r'(?:^|[^\d])(\d{4,5})\s+([A-ZÄÖÜ][A-Za-zäöüß\-]{2,30})\b'),
+]
+
+# Bösartige Fenster: Name -> Erzeuger für ungefähr n Zeichen
+_FAELLE = {
+    "Ziffernfolge": lambda n: "4" * n,
+    "Nullen": lambda n: "0" * n,
+    "Plus-Ziffern": lambda n: "+1 " * (n // 3),
+    "Bindestrich-Kette": lambda n: "a-" * (n // 2),
+    "Endungs-Kette": lambda n: "weg" * (n // 3) + " x",
+    "minifiziertes JS": lambda n: ("var a0=b.c-d-e,f=00123;" * (n // 23 + 1))[:n],
+}
+
+
+def alt(text: str) -> None:
+    for muster in _ALT:
+        muster.search(text)
+
+
+def neu(text: str) -> None:
+    _find_address([text])
+    _find_phone([text])
+
+
+def messen(funktion, *args) -> float:
+    start = time.perf_counter()
+    funktion(*args)
+    return time.perf_counter() - start
+
+
+def seite_mit_script(kb: int) -> bytes:
+    script = _FAELLE["minifiziertes JS"](kb * 1024)
+    return (f"<html><head><script>{script}</script></head><body><p>Hotel Bergblick</p>"
+            f"<footer>Hahnenkammstraße 12 · 6370 Kitzbühel · Tel. +43 5356 62222</footer>"
+            f"</body></html>").encode("utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--kb", type=int, nargs="+", default=[50, 100, 200, 400])
+    parser.add_argument("--alt-max-kb", type=int, default=8,
+                        help="alten Weg nur bis zu dieser Fenstergröße messen")
+    args = parser.parse_args()
+
+    print("Teil 1: Muster auf einem Fenster (ms, in Klammern µs pro KB)")
+    print(f"{'Fall':<20}{'KB':>6}{'alt':>16}{'neu':>16}")
+    for name, erzeuge in _FAELLE.items():
+        for kb in [args.alt_max_kb] + args.kb:
+            text = erzeuge(kb * 1024)
+            t_neu = messen(neu, text)
+            spalte_alt = "-"
+            if kb <= args.alt_max_kb:
+                t_alt = messen(alt, text)
+                spalte_alt = f"{t_alt * 1000:.1f} ({t_alt * 1e6 / kb:.0f})"
+            print(f"{name:<20}{kb:>6}{spalte_alt:>16}"
+                  f"{f'{t_neu * 1000:.1f} ({t_neu * 1e6 / kb:.0f})':>16}")
+
+    print("\nTeil 2: Seite mit großem Inline-Script (ms)")
+    print(f"{'KB':>6}{'alt (rohes HTML)':>18}{'neu (Fenster)':>16}")
+    for kb in args.kb:
+        body = seite_mit_script(kb)
+        roh = body.decode("utf-8")
+        t_alt = messen(alt, roh)
+        dokument = ParsedDocument(body, "utf-8")
+        dokument.wurzel                            # Parse gehört nicht zur Suche
+        t_neu = messen(neu, " ".join(dokument.kontaktfenster()))
+        print(f"{kb:>6}{t_alt * 1000:>18.1f}{t_neu * 1000:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
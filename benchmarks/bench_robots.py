@@ -0,0 +1,77 @@
+"""
+Benchmark: Gruppensuche je Bot in der robots.txt-Auswertung (Signal 1).
+
+Vergleicht zwei Wege:
+
+  alt:  je Bot alle Gruppen und alle Agents der robots.txt durchlaufen
+        (Kosten: Bots × Agents).
+  neu:  _gruppen_index einmal je robots.txt, danach ein Dict-Zugriff je Bot
+        (Kosten: Bots + Agents).
+
+Gemessen wird über ein Raster aus Registergröße (Anzahl geprüfter Bots) und
+Anzahl der User-agent-Zeilen in der robots.txt; das Parsen zählt bei beiden
+Wegen nicht mit.
+
+Aufruf:
+    python benchmarks/bench_robots.py [--bots 13 100 1000] [--agents 10 100 1000]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "signals"))
+
+from signal1_robots import _find_group_for_bot, _gruppen_index, _parse_groups  # noqa: E402
+
+
+def erzeuge_robots(agents: int) -> str:
+    """robots.txt mit vielen kleinen Gruppen; die geprüften Bots stehen ganz hinten."""
+    zeilen = ["User-agent: *", "Disallow: /wp-admin/"]
+    for i in range(agents):
+        zeilen += [f"User-agent: Scraper{i}", "Disallow: /"]
+    zeilen += ["User-agent: GPTBot", "User-agent: Bot7", "Disallow: /"]
+    return "\n".join(zeilen)
+
+
+def alt(bots: list[str], groups) -> None:
+    for name in bots:
+        name_lower = name.lower()
+        next((a for agents, _ in groups for a in agents if a.lower() == name_lower), None)
+
+
+def neu(bots: list[str], groups) -> None:
+    index = _gruppen_index(groups)
+    for name in bots:
+        _find_group_for_bot(name, index)
+
+
+def messen(funktion, *args, wiederholungen: int = 5) -> float:
+    beste = float("inf")
+    for _ in range(wiederholungen):
+        start = time.perf_counter()
+        funktion(*args)
+        beste = min(beste, time.perf_counter() - start)
+    return beste
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bots", type=int, nargs="+", default=[13, 100, 1000])
+    parser.add_argument("--agents", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    print(f"{'Bots':>6}{'Agents':>8}{'alt (ms)':>12}{'neu (ms)':>12}")
+    for anzahl_bots in args.bots:
+        bots = ["GPTBot"] + [f"Bot{i}" for i in range(anzahl_bots - 1)]
+        for agents in args.agents:
+            groups = _parse_groups(erzeuge_robots(agents))
+            t_alt = messen(alt, bots, groups)
+            t_neu = messen(neu, bots, groups)
+            print(f"{anzahl_bots:>6}{agents:>8}{t_alt * 1000:>12.2f}{t_neu * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
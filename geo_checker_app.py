@@ -2,17 +2,18 @@ import streamlit as st
 import csv
 import io
 import datetime
-import re
 import time
-import urllib.request
 from urllib.parse import urlparse
 
 # Google-Sheets-Lead-Register (eigenes Modul, testbar ohne Streamlit)
 from sheets import SHEET_ID, get_sheet, schreibe_lead
 
-# Gemeinsame Prüf-Logik (Signale 1-3, übernommen aus geo-radar — siehe signals/__init__.py)
-from signals import check_robots, check_schema, check_rendering
-from befund import baue_befund, signal_kurzzeile, AMPEL_FARBEN, AMPEL_SYMBOL
+# Gemeinsame Prüf-Logik (Signale 1-3, übernommen aus geo-radar — siehe signals/__init__.py),
+# parallel ausgeführt über analyse.py
+from analyse import fuehre_analyse_durch
+from signals import breaker_statistik, cache_statistik, latenz_statistik, redirect_statistik
+from zusatz_checks import build_checks, ANZAHL_ZUSATZ_CHECKS
+from befund import signal_kurzzeile, AMPEL_FARBEN, AMPEL_SYMBOL
 from befund_pdf import erzeuge_kurzbefund_pdf
 from mailer import sende_kurzbefund, smtp_status, sende_testmail
 
@@ -70,6 +71,10 @@ html, body, [class*="css"] { font-family: 'DM Sans', sans-serif; }
     background:#fff3f3; border-left:4px solid #c0392b;
     border-radius:4px; padding:12px 16px; margin:6px 0; font-size:14px;
 }
+.check-neutral {
+    background:#f7f7f7; border-left:4px solid #999;
+    border-radius:4px; padding:12px 16px; margin:6px 0; font-size:14px;
+}
 .check-name { font-weight:600; color:#1a2332; }
 .check-detail { color:#555; font-size:13px; margin-top:3px; }
 
@@ -136,307 +141,6 @@ def write_lead_to_sheet(data: dict) -> bool:
         return False
 
 
-# ══════════════════════════════════════════════════════
-# TECHNISCHE MESSUNG
-# ══════════════════════════════════════════════════════
-
-def check_website(url: str) -> dict:
-    """
-    Misst die ergänzenden technischen Faktoren direkt und verifizierbar.
-    robots.txt/KI-Bots, Schema.org/JSON-LD und Textsubstanz werden NICHT mehr
-    hier geprüft — das übernehmen die Signal-Module 1-3 (Ordner signals/).
-    """
-    parsed = urlparse(url)
-    base   = f"{parsed.scheme}://{parsed.netloc}"
-    facts  = {"https": parsed.scheme == "https"}
-
-    # sitemap.xml
-    try:
-        req = urllib.request.Request(
-            f"{base}/sitemap.xml", headers={"User-Agent": "GEO-Checker/1.0"}
-        )
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            facts["sitemap_exists"] = resp.status == 200
-    except Exception:
-        facts["sitemap_exists"] = False
-
-    # Ladezeit + HTML
-    raw_html = ""
-    try:
-        t0 = time.time()
-        req = urllib.request.Request(
-            url, headers={"User-Agent": "Mozilla/5.0 GEO-Checker/1.0"}
-        )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            raw_html = resp.read().decode("utf-8", errors="ignore")
-        facts["load_time"] = round(time.time() - t0, 2)
-        facts["load_ok"]   = facts["load_time"] < 3.0
-    except Exception:
-        facts["load_time"] = None
-        facts["load_ok"]   = False
-
-    # Meta-Description
-    m = re.search(r'<meta\s+name=["\']description["\']\s+content=["\'](.*?)["\']', raw_html, re.I) or \
-        re.search(r'<meta\s+content=["\'](.*?)["\']\s+name=["\']description["\']', raw_html, re.I)
-    facts["meta_desc"] = m.group(1).strip() if m else ""
-    facts["meta_desc_ok"] = bool(facts["meta_desc"])
-
-    # Viewport
-    facts["viewport"] = bool(re.search(r'<meta[^>]+name=["\']viewport["\']', raw_html, re.I))
-
-    # lang=
-    lm = re.search(r'<html[^>]+lang=["\']([^"\']+)["\']', raw_html, re.I)
-    facts["lang"]    = lm.group(1) if lm else ""
-    facts["lang_ok"] = bool(facts["lang"])
-
-    # Page Title
-    tm = re.search(r'<title[^>]*>(.*?)</title>', raw_html, re.I | re.DOTALL)
-    facts["page_title"] = re.sub(r"\s+", " ", tm.group(1)).strip() if tm else ""
-    facts["title_ok"]   = bool(facts["page_title"])
-
-    # Canonical
-    cm = re.search(r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']', raw_html, re.I)
-    facts["canonical"]    = cm.group(1) if cm else ""
-    facts["canonical_ok"] = bool(facts["canonical"])
-
-    # Schema.org
-    facts["schema_org"] = "schema.org" in raw_html.lower()
-
-    # ─── NEW GEO & KI CHECKS ───
-
-    # Open Graph Tags (og:title, og:description, og:image)
-    og_title = re.search(r'<meta\s+(?:property|name)=["\']og:title["\']\s+content=["\'](.*?)["\']', raw_html, re.I) or \
-               re.search(r'<meta\s+content=["\'](.*?)["\']\s+(?:property|name)=["\']og:title["\']', raw_html, re.I)
-    og_desc = re.search(r'<meta\s+(?:property|name)=["\']og:description["\']\s+content=["\'](.*?)["\']', raw_html, re.I) or \
-              re.search(r'<meta\s+content=["\'](.*?)["\']\s+(?:property|name)=["\']og:description["\']', raw_html, re.I)
-    og_image = re.search(r'<meta\s+(?:property|name)=["\']og:image["\']\s+content=["\'](.*?)["\']', raw_html, re.I) or \
-               re.search(r'<meta\s+content=["\'](.*?)["\']\s+(?:property|name)=["\']og:image["\']', raw_html, re.I)
-    og_parts = []
-    if og_title:  og_parts.append("og:title")
-    if og_desc:   og_parts.append("og:description")
-    if og_image:  og_parts.append("og:image")
-    facts["og_tags_found"] = og_parts
-    facts["og_ok"] = len(og_parts) >= 2  # At least title + description
-
-    # H1 Heading
-    h1_matches = re.findall(r'<h1[^>]*>(.*?)</h1>', raw_html, re.I | re.DOTALL)
-    facts["h1_count"] = len(h1_matches)
-    facts["h1_text"] = re.sub(r'<[^>]+>', '', h1_matches[0]).strip() if h1_matches else ""
-    facts["h1_ok"] = len(h1_matches) == 1 and bool(facts["h1_text"])
-
-    # Image Alt Texts
-    all_images = re.findall(r'<img\b[^>]*>', raw_html, re.I)
-    images_with_alt = [img for img in all_images if re.search(r'\balt=["\'][^"\']+["\']', img, re.I)]
-    facts["img_total"] = len(all_images)
-    facts["img_with_alt"] = len(images_with_alt)
-    facts["img_alt_pct"] = round(len(images_with_alt) / len(all_images) * 100) if all_images else 100
-    facts["img_alt_ok"] = facts["img_alt_pct"] >= 80
-
-    # JSON-LD Structured Data (preferred by AI engines over microdata/RDFa)
-    jsonld_blocks = re.findall(r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', raw_html, re.I | re.DOTALL)
-    facts["jsonld_count"] = len(jsonld_blocks)
-    facts["jsonld_ok"] = len(jsonld_blocks) > 0
-    # Detect schema types in JSON-LD
-    jsonld_types = []
-    for block in jsonld_blocks:
-        types = re.findall(r'"@type"\s*:\s*"([^"]+)"', block)
-        jsonld_types.extend(types)
-    facts["jsonld_types"] = jsonld_types
-
-    # Sufficient Text Content (word count)
-    text_only = re.sub(r'<script[^>]*>.*?</script>', '', raw_html, flags=re.I | re.DOTALL)
-    text_only = re.sub(r'<style[^>]*>.*?</style>', '', text_only, flags=re.I | re.DOTALL)
-    text_only = re.sub(r'<[^>]+>', ' ', text_only)
-    text_only = re.sub(r'\s+', ' ', text_only).strip()
-    words = [w for w in text_only.split() if len(w) > 1]
-    facts["word_count"] = len(words)
-    facts["content_ok"] = len(words) >= 300
-
-    # Meta Robots / Indexability
-    meta_robots = re.search(r'<meta\s+name=["\']robots["\']\s+content=["\'](.*?)["\']', raw_html, re.I) or \
-                  re.search(r'<meta\s+content=["\'](.*?)["\']\s+name=["\']robots["\']', raw_html, re.I)
-    robots_content = meta_robots.group(1).lower() if meta_robots else ""
-    facts["meta_robots"] = robots_content
-    facts["noindex"] = "noindex" in robots_content
-    facts["nofollow"] = "nofollow" in robots_content
-    facts["indexable_ok"] = not facts["noindex"]
-
-    # Hreflang Tags (multilingual / international targeting)
-    hreflang_matches = re.findall(r'<link[^>]+hreflang=["\']([^"\']+)["\']', raw_html, re.I)
-    facts["hreflang_langs"] = list(set(hreflang_matches))
-    facts["hreflang_ok"] = len(hreflang_matches) > 0
-
-    # Internal Links
-    all_links = re.findall(r'<a\b[^>]+href=["\']([^"\'#]+)["\']', raw_html, re.I)
-    internal_links = [l for l in all_links if l.startswith("/") or parsed.netloc in l]
-    facts["internal_link_count"] = len(internal_links)
-    facts["internal_links_ok"] = len(internal_links) >= 3
-
-    return facts
-
-
-def build_checks(facts: dict) -> list:
-    """
-    Erstellt die 14 ergänzenden Checkpunkte mit Ergebnis und Quick-Win-Hinweis.
-
-    Die Kernprüfungen (robots.txt/KI-Bots, Schema.org/JSON-LD, Textsubstanz)
-    laufen NICHT mehr hier, sondern über die gemeinsamen Signal-Module 1-3
-    aus dem geo-radar (Ordner signals/) — mit Ampel-Logik statt Punkten.
-    """
-    # Image alt text detail
-    img_total = facts.get("img_total", 0)
-    img_alt   = facts.get("img_with_alt", 0)
-    img_pct   = facts.get("img_alt_pct", 100)
-
-    # OG tags detail
-    og_found = facts.get("og_tags_found", [])
-
-    return [
-        # ── SECTION: Technische Basis ──
-        {
-            "name":     "HTTPS-Verschlüsselung",
-            "ok":       facts.get("https", False),
-            "detail":   "Aktiv" if facts.get("https") else "Nicht aktiv",
-            "quickwin": "HTTPS aktivieren — Pflicht für jede moderne Website und Vertrauenssignal für KI-Systeme.",
-            "howto":    "Kontaktieren Sie Ihren Webhoster (z.B. World4You, All-Inkl, Strato) und fragen Sie nach einem kostenlosen SSL-Zertifikat (Let's Encrypt). Die meisten Hoster aktivieren das per Klick im Kundenmenü. Bei WordPress-Seiten danach unter Einstellungen → Allgemein die URL auf https:// ändern.",
-            "impact":   "Sicherheit & Vertrauen",
-            "category": "Technische Basis",
-        },
-        {
-            "name":     "Ladezeit unter 3 Sekunden",
-            "ok":       facts.get("load_ok", False),
-            "detail":   (f"{facts['load_time']}s" if facts.get("load_time") else "Nicht messbar"),
-            "quickwin": f"Ladezeit optimieren (aktuell {facts.get('load_time','?')}s) — KI-Crawler bevorzugen schnell ladende Seiten.",
-            "howto":    "Die häufigsten Ursachen für langsame Seiten: (1) Bilder komprimieren — laden Sie Ihre Bilder auf tinypng.com hoch und ersetzen Sie die Originale. (2) Bei WordPress: ein Caching-Plugin installieren (z.B. WP Super Cache oder LiteSpeed Cache). (3) Prüfen Sie, ob Ihr Hosting-Paket ausreichend Leistung hat — bei sehr günstigen Paketen kann ein Upgrade auf SSD-Hosting helfen.",
-            "impact":   "Crawlbarkeit & User Experience",
-            "category": "Technische Basis",
-        },
-        {
-            "name":     "Mobile Viewport-Tag",
-            "ok":       facts.get("viewport", False),
-            "detail":   "Vorhanden" if facts.get("viewport") else "Fehlt",
-            "quickwin": "Viewport-Tag fehlt — Ihre Seite wird auf Smartphones nicht korrekt dargestellt.",
-            "howto":    "Ihr Webentwickler muss eine Zeile im HTML-Kopfbereich (Head) ergänzen: <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">. Bei WordPress-Themes ist das normalerweise automatisch enthalten — prüfen Sie, ob Ihr Theme aktuell ist. Falls Sie einen Baukastensystem wie Jimdo oder Wix nutzen, ist es meist automatisch gesetzt.",
-            "impact":   "Mobile Sichtbarkeit",
-            "category": "Technische Basis",
-        },
-        {
-            "name":     "Indexierbarkeit (Meta Robots)",
-            "ok":       facts.get("indexable_ok", True),
-            "detail":   "Indexierung erlaubt" if facts.get("indexable_ok", True) else f"BLOCKIERT — {facts.get('meta_robots', '')}",
-            "quickwin": "ACHTUNG: Ihre Seite blockiert aktiv die Indexierung! Suchmaschinen UND KI-Systeme dürfen Ihre Seite nicht anzeigen.",
-            "howto":    "Das passiert oft, wenn die Website nach einem Relaunch versehentlich auf 'noindex' steht. Bei WordPress: Gehen Sie zu Einstellungen → Lesen und deaktivieren Sie 'Suchmaschinen davon abhalten, diese Website zu indexieren'. Bei anderen Systemen: Bitten Sie Ihren Webentwickler, den noindex-Tag aus dem HTML-Head zu entfernen. Das ist die wichtigste Maßnahme — ohne diese Änderung sind alle anderen Optimierungen wirkungslos!",
-            "impact":   "Sichtbarkeit — kritisch",
-            "category": "Technische Basis",
-        },
-        # ── SECTION: Crawlbarkeit & Indexierung ──
-        # (robots.txt/KI-Bots wird jetzt von Signal 1 geprüft — siehe Ampel oben)
-        {
-            "name":     "sitemap.xml vorhanden",
-            "ok":       facts.get("sitemap_exists", False),
-            "detail":   "Gefunden" if facts.get("sitemap_exists") else "Nicht gefunden",
-            "quickwin": "sitemap.xml erstellen — das ist wie ein Inhaltsverzeichnis Ihrer Website für KI-Crawler.",
-            "howto":    "Bei WordPress: Installieren Sie das Plugin 'Yoast SEO' oder 'Rank Math' — beide erstellen automatisch eine Sitemap unter IhreWebsite.at/sitemap.xml. Bei anderen Systemen: Nutzen Sie xml-sitemaps.com, um kostenlos eine Sitemap zu erzeugen, und laden Sie die Datei ins Hauptverzeichnis Ihrer Website hoch. Danach in der robots.txt ergänzen: Sitemap: https://www.ihre-website.at/sitemap.xml",
-            "impact":   "Vollständige Indexierung",
-            "category": "Crawlbarkeit & Indexierung",
-        },
-        {
-            "name":     "Canonical Tag gesetzt",
-            "ok":       facts.get("canonical_ok", False),
-            "detail":   "Vorhanden" if facts.get("canonical_ok") else "Fehlt",
-            "quickwin": "Canonical Tag ergänzen — das verhindert, dass KI-Systeme Ihre Inhalte doppelt oder falsch zuordnen.",
-            "howto":    "Der Canonical Tag sagt Suchmaschinen und KI: 'Das ist die Original-Adresse dieser Seite.' Bei WordPress: Yoast SEO oder Rank Math setzen diesen Tag automatisch. Bei anderen Systemen: Ihr Webentwickler muss im HTML-Head jeder Seite ergänzen: <link rel=\"canonical\" href=\"https://www.ihre-website.at/aktuelle-seite/\">. Die URL muss jeweils die aktuelle Seitenadresse sein.",
-            "impact":   "Technische SEO & KI-Indexierung",
-            "category": "Crawlbarkeit & Indexierung",
-        },
-        {
-            "name":     "Interne Verlinkung (min. 3 Links)",
-            "ok":       facts.get("internal_links_ok", False),
-            "detail":   f'{facts.get("internal_link_count", 0)} interne Links gefunden' if facts.get("internal_links_ok") else f'Nur {facts.get("internal_link_count", 0)} interne Links',
-            "quickwin": "Mehr interne Links setzen — KI-Crawler folgen diesen Links, um Ihren Betrieb besser zu verstehen.",
-            "howto":    "Verlinken Sie auf Ihrer Startseite zu den wichtigsten Unterseiten: Zimmer/Wohnungen, Preise, Lage/Anreise, Aktivitäten, Kontakt. Jeder Link hilft KI-Systemen, mehr über Ihr Angebot zu erfahren. Konkret: Schreiben Sie z.B. 'Entdecken Sie unsere Zimmer' und verlinken Sie den Text auf die Zimmer-Seite. Mindestens 3-5 interne Links auf der Startseite sind empfohlen.",
-            "impact":   "Crawl-Tiefe & Kontext",
-            "category": "Crawlbarkeit & Indexierung",
-        },
-        # ── SECTION: KI-Zitierbarkeit & Inhalte ──
-        {
-            "name":     "Meta-Description vorhanden",
-            "ok":       facts.get("meta_desc_ok", False),
-            "detail":   f'"{facts["meta_desc"][:60]}…"' if facts.get("meta_desc_ok") else "Fehlt",
-            "quickwin": "Meta-Description fehlt — das ist der kurze Vorschautext, den KI-Systeme als Zusammenfassung nutzen.",
-            "howto":    "Schreiben Sie eine kurze, ansprechende Beschreibung Ihres Betriebs in max. 155 Zeichen. Beispiel: '4-Sterne Wellnesshotel in Kitzbühel mit Panorama-Spa, regionaler Küche und direktem Zugang zu 170 km Skipisten.' Bei WordPress: Im Yoast SEO Plugin unter jeder Seite die 'Meta-Beschreibung' ausfüllen. Bei anderen Systemen: Ihr Webentwickler fügt im HTML-Head ein: <meta name=\"description\" content=\"Ihr Text hier\">",
-            "impact":   "KI-Zitierbarkeit & Klickrate",
-            "category": "KI-Zitierbarkeit & Inhalte",
-        },
-        {
-            "name":     "Page Title vorhanden",
-            "ok":       facts.get("title_ok", False),
-            "detail":   f'"{facts["page_title"][:50]}…"' if facts.get("title_ok") else "Fehlt",
-            "quickwin": "Page Title fehlt oder ist unzureichend — der Seitentitel ist Ihre 'Visitenkarte' für KI-Systeme.",
-            "howto":    "Der Seitentitel sollte Ihren Betriebsnamen, den Ort und Ihr Alleinstellungsmerkmal enthalten. Beispiel: 'Hotel Alpenstern Kitzbühel | 4-Sterne Wellness & Ski'. Maximum 60 Zeichen. Bei WordPress: Den Titel im Yoast SEO Plugin bearbeiten. Bei anderen Systemen: Im HTML-Head den <title>-Tag anpassen. Jede Seite braucht einen eigenen, einzigartigen Titel!",
-            "impact":   "KI-Zitierbarkeit & Auffindbarkeit",
-            "category": "KI-Zitierbarkeit & Inhalte",
-        },
-        {
-            "name":     "H1-Überschrift vorhanden",
-            "ok":       facts.get("h1_ok", False),
-            "detail":   (f'"{facts["h1_text"][:50]}…"' if facts.get("h1_ok")
-                         else (f'{facts.get("h1_count", 0)} H1-Tags gefunden (genau 1 empfohlen)' if facts.get("h1_count", 0) > 1
-                               else "Keine H1-Überschrift gefunden")),
-            "quickwin": "Die H1-Überschrift ist die 'Hauptüberschrift' Ihrer Seite — KI-Systeme nutzen sie, um den Kerninhalt zu erkennen.",
-            "howto":    "Jede Seite braucht genau eine H1-Überschrift (die größte Überschrift). Sie sollte klar beschreiben, worum es auf der Seite geht. Beispiel für die Startseite: 'Willkommen im Hotel Alpenstern — Ihr 4-Sterne Wellnesshotel in Kitzbühel'. Bei WordPress: Die erste Überschrift im Editor als 'Überschrift 1' formatieren. Wichtig: Nur EINE H1 pro Seite, weitere Überschriften als H2 oder H3.",
-            "impact":   "Inhaltsstruktur & KI-Verständnis",
-            "category": "KI-Zitierbarkeit & Inhalte",
-        },
-        # (Textsubstanz der Startseite wird jetzt von Signal 3 geprüft,
-        #  Schema.org/JSON-LD inkl. Lodging-Entität von Signal 2 — siehe Ampel oben)
-        # ── SECTION: Social & Sharing ──
-        {
-            "name":     "Open Graph Tags (og:title, og:description, og:image)",
-            "ok":       facts.get("og_ok", False),
-            "detail":   f'Gefunden: {", ".join(og_found)}' if og_found else "Keine OG-Tags gefunden",
-            "quickwin": "Open Graph Tags fehlen — diese steuern, wie Ihr Betrieb auf Social Media UND in KI-Systemen dargestellt wird.",
-            "howto":    "Open Graph Tags bestimmen Titel, Beschreibung und Vorschaubild, wenn jemand Ihre Website auf Facebook, WhatsApp oder LinkedIn teilt — und KI-Systeme nutzen sie ebenfalls. Bei WordPress: Yoast SEO → unter jeder Seite den Tab 'Social' öffnen und Titel, Beschreibung und Bild eintragen. Ohne WordPress: Ihr Webentwickler fügt im HTML-Head ein: og:title (Betriebsname), og:description (kurze Beschreibung), og:image (ein ansprechendes Foto, mind. 1200×630 Pixel).",
-            "impact":   "KI-Kontext & Social Sharing",
-            "category": "Social & Sharing",
-        },
-        # ── SECTION: Sprache & International ──
-        {
-            "name":     "Sprach-Attribut (lang=)",
-            "ok":       facts.get("lang_ok", False),
-            "detail":   f'lang="{facts["lang"]}"' if facts.get("lang_ok") else "Fehlt",
-            "quickwin": "Sprach-Attribut fehlt — KI-Systeme wissen nicht, in welcher Sprache Ihre Seite geschrieben ist.",
-            "howto":    "Das Sprach-Attribut ist eine kleine Ergänzung ganz am Anfang Ihres HTML-Codes. Ihr Webentwickler muss nur sicherstellen, dass der HTML-Tag so aussieht: <html lang=\"de\"> (für Deutsch) oder <html lang=\"de-AT\"> (für österreichisches Deutsch). Bei WordPress: Die meisten Themes setzen das automatisch — prüfen Sie unter Einstellungen → Allgemein, ob die richtige Sprache eingestellt ist.",
-            "impact":   "Sprachliche Einordnung",
-            "category": "Sprache & International",
-        },
-        {
-            "name":     "Hreflang-Tags (Mehrsprachigkeit)",
-            "ok":       facts.get("hreflang_ok", False),
-            "detail":   f'Sprachen: {", ".join(facts.get("hreflang_langs", []))}' if facts.get("hreflang_ok") else "Keine Hreflang-Tags — nur einsprachig",
-            "quickwin": "Hreflang-Tags fehlen — für internationale Gäste wissen KI-Systeme nicht, ob es Ihre Seite in anderen Sprachen gibt.",
-            "howto":    "Hreflang-Tags sind relevant, wenn Sie Ihre Website in mehreren Sprachen anbieten (z.B. Deutsch + Englisch). Sie signalisieren KI-Systemen: 'Diese Seite gibt es auch auf Englisch unter dieser URL.' Bei WordPress: Das Plugin 'WPML' oder 'Polylang' setzt Hreflang-Tags automatisch. Falls Ihre Website nur auf Deutsch existiert und Sie keine internationalen Gäste ansprechen, ist dieser Punkt weniger wichtig — aber für Tourismusbetriebe mit internationaler Kundschaft sehr empfohlen.",
-            "impact":   "Internationale KI-Sichtbarkeit",
-            "category": "Sprache & International",
-        },
-        # ── SECTION: Barrierefreiheit & Medien ──
-        {
-            "name":     "Bilder mit Alt-Texten (min. 80%)",
-            "ok":       facts.get("img_alt_ok", True),
-            "detail":   f'{img_alt} von {img_total} Bildern mit Alt-Text ({img_pct}%)' if img_total > 0 else "Keine Bilder gefunden",
-            "quickwin": f"Alt-Texte für Bilder ergänzen ({img_pct}% vorhanden) — KI-Systeme können Bilder ohne Beschreibung nicht 'sehen'.",
-            "howto":    "Alt-Texte sind kurze Beschreibungen, die jedem Bild zugeordnet werden. Beispiel: Statt leer → 'Panoramablick vom Balkon des Hotel Alpenstern auf die Kitzbüheler Alpen'. Bei WordPress: Klicken Sie auf ein Bild in der Mediathek und füllen Sie das Feld 'Alternativer Text' aus. Beschreiben Sie, was auf dem Bild zu sehen ist — kurz, sachlich, mit Ortsbezug. Das hilft nicht nur KI-Systemen, sondern auch sehbehinderten Gästen und verbessert Ihre Barrierefreiheit.",
-            "impact":   "KI-Bildverständnis & Barrierefreiheit",
-            "category": "Barrierefreiheit & Medien",
-        },
-    ]
-
-
-# Bewertet wird mit der Ampel der Signal-Module (GRÜN/GELB/ROT/UNBEKANNT),
-# nicht mehr mit einem Punkte-Score. Logik: signals/__init__.py + befund.py.
-ANZAHL_ZUSATZ_CHECKS = 14
-
-
 # ══════════════════════════════════════════════════════
 # HEADER
 # ══════════════════════════════════════════════════════
@@ -494,17 +198,13 @@ if not st.session_state["analyse_done"]:
             status = st.empty()
             domain = urlparse(website).netloc or website
 
-            status.info("🔍 Signal 1/3: KI-Zugang (robots.txt) wird geprüft…")
-            s1 = check_robots(domain)
-            status.info("🔍 Signal 2/3: Strukturierte Betriebsdaten (Schema.org)…")
-            s2 = check_schema(domain)
-            status.info("🔍 Signal 3/3: Maschinenlesbarkeit der Startseite…")
-            s3 = check_rendering(domain)
-            befund = baue_befund(s1, s2, s3)
-
-            status.info("🔍 Ergänzende technische Checkpunkte…")
-            facts  = check_website(website)
-            checks = build_checks(facts)
+            # Signale 1-3 und Zusatz-Checks laufen parallel (analyse.py);
+            # die Statuszeile meldet jede fertige Prüfung.
+            status.info("🔍 KI-Zugang, Schema.org und Startseite werden geprüft…")
+            analyse = fuehre_analyse_durch(domain, website, melde=status.info)
+            s1     = analyse["s1"]
+            befund = analyse["befund"]
+            checks = build_checks(analyse["facts"])
 
             status.info("📄 Kurz-Befund-PDF wird erstellt…")
             lead = {
@@ -539,6 +239,7 @@ if not st.session_state["analyse_done"]:
                 "pdf_bytes": pdf_bytes,
                 "mail_ok":   mail_ok,
                 "mail_info": mail_info,
+                "netz":      analyse["netz"],
             }
             st.session_state["lead_data"]    = lead
             st.session_state["analyse_done"] = True
@@ -598,7 +299,7 @@ if st.session_state["analyse_done"] and st.session_state["result"]:
         mime="application/pdf",
     )
 
-    # Die 14 ergänzenden Checkpunkte und das KI-Bot-Detail werden hier nur
+    # Die 15 ergänzenden Checkpunkte und das KI-Bot-Detail werden hier nur
     # VORBEREITET — angezeigt werden sie gesammelt im zugeklappten Bereich
     # "Technische Details" weiter unten, damit die Ampel-Botschaft dominiert.
     passed = sum(1 for c in checks if c["ok"])
@@ -610,8 +311,9 @@ if st.session_state["analyse_done"] and st.session_state["result"]:
         if cat and cat not in categories_seen:
             categories_seen.append(cat)
             checks_html_parts.append(f'<div class="category-header">{cat}</div>')
-        css  = "check-ok" if c["ok"] else "check-fail"
-        icon = "✅" if c["ok"] else "❌"
+        # ok=None: nicht messbar / nicht geprüft — weder bestanden noch offen
+        css  = "check-neutral" if c["ok"] is None else "check-ok" if c["ok"] else "check-fail"
+        icon = "➖" if c["ok"] is None else "✅" if c["ok"] else "❌"
         checks_html_parts.append(
             f'<div class="{css}">'
             f'<div class="check-name">{icon} {c["name"]}</div>'
@@ -630,7 +332,7 @@ if st.session_state["analyse_done"] and st.session_state["result"]:
     # ══════════════════════════════════════════════════════
     # HANDLUNGSEMPFEHLUNGEN — actionable recommendations
     # ══════════════════════════════════════════════════════
-    failed = [c for c in checks if not c["ok"]]
+    failed = [c for c in checks if c["ok"] is not None and not c["ok"]]
 
     if befund["empfehlungen"] or failed:
         st.subheader("📋 Handlungsempfehlungen für Ihren Betrieb")
@@ -816,6 +518,33 @@ with st.expander("🔒 Admin-Bereich"):
             else:
                 st.error(info)
 
+        st.markdown("---")
+        st.markdown("**🗄️ Abruf-Cache (robots.txt, Startseite, Sitemap)**")
+        cache = cache_statistik()
+        if cache:
+            st.write(f"Seit Start: {cache['treffer']} Treffer (304) · "
+                     f"{cache['fehlschlaege']} Fehlschläge · "
+                     f"{cache['eintraege']} Einträge, {cache['belegt_mb']} / {cache['max_mb']} MB")
+        else:
+            st.write("Cache abgeschaltet (GEO_RADAR_CACHE_MB=0) oder Verzeichnis nicht anlegbar.")
+        letzte = (st.session_state.get("result") or {}).get("netz")
+        if letzte:
+            st.write(f"Letzte Analyse: {letzte['abrufe']} Abrufe · "
+                     f"{letzte['cache_treffer']} aus dem Cache · "
+                     f"{letzte['cache_fehlschlaege']} neu geladen · "
+                     f"{letzte['bytes_leitung'] // 1024} KB übertragen "
+                     f"({letzte['bytes'] // 1024} KB entpackt)")
+        sperre = breaker_statistik()
+        st.write(f"Host-Sicherung: {sperre['gesperrt']} Host(s) gerade gesperrt · "
+                 f"{sperre['kurzschluesse']} Abrufe ohne Warten auf Timeout beendet")
+        latenz = latenz_statistik()
+        if latenz["hosts"]:
+            st.write(f"Gelernte Timeouts: {latenz['hosts']} Host(s) vermessen · "
+                     f"typische Antwortzeit (TTFB) {latenz['ttfb_median']} s")
+        umleitung = redirect_statistik()
+        st.write(f"Redirect-Cache: {umleitung['umleitungen']} Umleitung(en) gemerkt · "
+                 f"{umleitung['treffer']} Ketten übersprungen")
+
         st.markdown("---")
         st.markdown(f"🔗 [Alle Leads im Google Sheet öffnen](https://docs.google.com/spreadsheets/d/{SHEET_ID}/edit)")
 
@@ -27,7 +27,9 @@ import base64
 import os
 import smtplib
 import ssl
+import threading
 from email.message import EmailMessage
+from typing import Optional
 
 import requests
 
@@ -35,6 +37,12 @@ DEFAULT_NOTIFY = "kontakt@gernot-riedel.com"
 BREVO_URL = "https://api.brevo.com/v3/smtp/email"
 ABSENDER_NAME = "Gernot Riedel Tourism Consulting"
 
+# Eigene, schlichte Session für den Mailversand — bewusst NICHT die
+# Crawler-Session aus signals (deren User-Agent, DNS-Cache samt Negativ-
+# Einträgen und Sicherung je Origin gelten nur für geprüfte Websites).
+_brevo_session: Optional[requests.Session] = None
+_brevo_lock = threading.Lock()
+
 
 def _conf(secrets, key: str, default: str = "") -> str:
     """
@@ -92,9 +100,23 @@ def smtp_status(secrets=None) -> dict:
     }
 
 
+def _brevo() -> requests.Session:
+    """Session für api.brevo.com (beim ersten Versand angelegt)."""
+    global _brevo_session
+    if _brevo_session is None:
+        with _brevo_lock:
+            if _brevo_session is None:
+                _brevo_session = requests.Session()
+    return _brevo_session
+
+
 def _sende_brevo(secrets, empfaenger: str, betreff: str, text: str,
                  anhaenge: list | None = None) -> None:
-    """Versand ueber die Brevo-Web-API (HTTPS) — kein SMTP-Port noetig."""
+    """
+    Versand ueber die Brevo-Web-API (HTTPS) — kein SMTP-Port noetig.
+    Laeuft ueber eine eigene Session (_brevo): Betriebs-Mail und
+    Benachrichtigung teilen sich eine Keep-Alive-Verbindung zu api.brevo.com.
+    """
     payload = {
         "sender": {"email": _absender(secrets), "name": ABSENDER_NAME},
         "to": [{"email": empfaenger}],
@@ -106,7 +128,7 @@ def _sende_brevo(secrets, empfaenger: str, betreff: str, text: str,
             {"name": name, "content": base64.b64encode(daten).decode("ascii")}
             for name, daten in anhaenge
         ]
-    r = requests.post(
+    r = _brevo().post(
         BREVO_URL, json=payload, timeout=30,
         headers={"api-key": _conf(secrets, "BREVO_API_KEY"),
                  "accept": "application/json"},
@@ -12,6 +12,13 @@ Repos zugreifen kann. Änderungen an der Prüf-Logik gehören ins geo-radar-Repo
 danach die drei Dateien hierher nachkopieren und den Commit-Stand oben
 aktualisieren.
 
+Ausnahme: http_client.py, http_cache.py, dns_cache.py, circuit_breaker.py,
+host_latenz.py, redirect_cache.py und dokument.py sind checker-eigen
+(gemeinsamer Abruf-Layer). Die Signal-Module holen die Startseite darüber
+bzw. nehmen einen bereits geholten PageSnapshot entgegen (Parameter
+`snapshot=`) und lesen dessen einmal geparstes Dokument (`dokument=`) —
+beim Nachkopieren aus geo-radar diese Anbindung wieder herstellen.
+
 Ampel-Konvention (aus geo-radar CLAUDE.md):
     GRÜN / GELB / ROT / UNBEKANNT — "Null Halluzination: UNBEKANNT statt raten".
     Gesamt-Ampel: ein ROT -> ROT; sonst GELB, wenn GELB oder UNBEKANNT dabei;
@@ -24,6 +31,12 @@ _HERE = str(Path(__file__).parent)
 if _HERE not in sys.path:
     sys.path.insert(0, _HERE)
 
+from dokument import Kopfdaten, ParsedDocument  # noqa: E402,F401
+from http_client import (  # noqa: E402,F401
+    ZEITBUDGET_UEBERSCHRITTEN, PageSnapshot, Zeitmessung, breaker_statistik, cache_statistik,
+    fetch_homepage, fetch_url, get_session, latenz_statistik, protokolliere,
+    redirect_statistik, submit_mit_kontext,
+)
 from signal1_robots import check_robots, RobotsResult      # noqa: E402,F401
 from signal2_schema import check_schema, SchemaResult      # noqa: E402,F401
 from signal3_rendering import check_rendering, RenderingResult  # noqa: E402,F401
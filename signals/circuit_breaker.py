@@ -0,0 +1,137 @@
+"""
+Sicherung je Origin (Circuit Breaker) für den Abruf-Layer.
+
+Checker-eigen wie http_client.py. Hängt ein Host, wartet ohne Sicherung
+jede Prüfung ihren eigenen Timeout ab: robots.txt auf beiden Schemata,
+danach Startseite, Sitemap, FAQ-Unterseiten — eine tote Website kostet so
+Minuten. Hier zählt jede Zeitüberschreitung (Verbindungsaufbau oder Lesen)
+gegen die Origin (Schema, Host, Port — siehe origin()); ab SCHWELLE
+Fehlschlägen in Folge ist sie SPERRDAUER Sekunden gesperrt. Abrufe an eine
+gesperrte Origin schlagen sofort fehl — mit dem ursprünglichen Fehler als
+Beleg.
+
+Je Origin, nicht je Host: Ein toter TLS-Port (https hängt, http antwortet)
+sperrt nur https://host:443. Der Hedge-Verlierer zählt so allein gegen
+sein eigenes Schema, die funktionierende http-Origin bleibt offen.
+host_gesperrt() meldet eine Domain erst, wenn beide Schemata gesperrt sind.
+
+Nach Ablauf der Sperre darf wieder abgerufen werden; schon die nächste
+Zeitüberschreitung sperrt erneut (halboffen), eine Antwort setzt den Zähler
+zurück. Schnelle Fehler (Verbindung abgelehnt, DNS) zählen nicht — die
+kosten keine Wartezeit, DNS hat seinen eigenen Negativ-Cache.
+
+Konfiguration:
+    GEO_RADAR_BREAKER_SCHWELLE   Zeitüberschreitungen bis zur Sperre (Standard 2)
+    GEO_RADAR_BREAKER_SPERRDAUER Sekunden, die ein Host gesperrt bleibt (Standard 120)
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlsplit
+
+BREAKER_SCHWELLE = int(os.environ.get("GEO_RADAR_BREAKER_SCHWELLE", "2"))
+BREAKER_SPERRDAUER = float(os.environ.get("GEO_RADAR_BREAKER_SPERRDAUER", "120"))
+
+
+_STANDARD_PORT = {"https": 443, "http": 80}
+
+
+def origin(url: str) -> str:
+    """Schlüssel der Sicherung: "https://example.at:443" (Host klein, Port explizit)."""
+    teile = urlsplit(url)
+    schema = teile.scheme.lower()
+    try:
+        port = teile.port
+    except ValueError:
+        port = None
+    return f"{schema}://{(teile.hostname or '').lower()}:{port or _STANDARD_PORT.get(schema, 0)}"
+
+
+@dataclass
+class _Zustand:
+    fehlschlaege: int = 0               # Zeitüberschreitungen in Folge
+    fehler: Optional[str] = None        # erster Fehler der Serie (Beleg)
+    gesperrt_bis: float = 0.0           # time.monotonic(); 0 = nicht gesperrt
+
+
+class CircuitBreaker:
+    """Zählt Zeitüberschreitungen je Origin und sperrt ab der Schwelle (thread-sicher)."""
+
+    def __init__(self, schwelle: int = BREAKER_SCHWELLE,
+                 sperrdauer: float = BREAKER_SPERRDAUER):
+        self.schwelle = schwelle
+        self.sperrdauer = sperrdauer
+        self._lock = threading.Lock()
+        self._origins: dict[str, _Zustand] = {}
+        self.kurzschluesse = 0          # Abrufe, die die Sperre erspart hat
+
+    def gesperrt(self, origin: str) -> Optional[str]:
+        """Beleg-Text, wenn die Origin gerade gesperrt ist — sonst None."""
+        with self._lock:
+            zustand = self._origins.get(origin.lower())
+            if zustand is None or zustand.gesperrt_bis <= time.monotonic():
+                return None
+            return (f"Host gesperrt nach {zustand.fehlschlaege} Zeitüberschreitungen"
+                    f" — {zustand.fehler}")
+
+    def kurzschluss(self, origin: str) -> Optional[str]:
+        """Wie gesperrt(), zählt einen ersparten Abruf für die Statistik."""
+        beleg = self.gesperrt(origin)
+        if beleg is not None:
+            with self._lock:
+                self.kurzschluesse += 1
+        return beleg
+
+    def fehlschlag(self, origin: str, fehler: str) -> None:
+        """Eine Zeitüberschreitung gegen die Origin verbuchen."""
+        with self._lock:
+            zustand = self._origins.setdefault(origin.lower(), _Zustand())
+            zustand.fehlschlaege += 1
+            if zustand.fehler is None:
+                zustand.fehler = fehler
+            if zustand.fehlschlaege >= self.schwelle:
+                zustand.gesperrt_bis = time.monotonic() + self.sperrdauer
+
+    def erfolg(self, origin: str) -> None:
+        """Die Origin hat geantwortet (egal mit welchem Status): Zähler zurück."""
+        with self._lock:
+            self._origins.pop(origin.lower(), None)
+
+    def statistik(self) -> dict:
+        """Für den Admin-Bereich: gerade gesperrte Origins und ersparte Abrufe."""
+        jetzt = time.monotonic()
+        with self._lock:
+            return {
+                "gesperrt": sum(1 for z in self._origins.values() if z.gesperrt_bis > jetzt),
+                "kurzschluesse": self.kurzschluesse,
+            }
+
+
+_breaker: Optional[CircuitBreaker] = None
+_breaker_lock = threading.Lock()
+
+
+def get_breaker() -> CircuitBreaker:
+    """Prozessweite Sicherung (lazy, thread-sicher) — gilt auch über Batch-Läufe."""
+    global _breaker
+    if _breaker is None:
+        with _breaker_lock:
+            if _breaker is None:
+                _breaker = CircuitBreaker()
+    return _breaker
+
+
+def host_gesperrt(domain: str) -> Optional[str]:
+    """
+    Für die Signal-Module: Beleg-Text, wenn die Domain auf https UND http
+    gerade gesperrt ist — dann gleich UNBEKANNT statt erneut auf den Timeout
+    zu warten. Ist nur ein Schema gesperrt, darf der Hedge das andere nehmen.
+    """
+    host = domain.split("/", 1)[0].split(":", 1)[0]
+    breaker = get_breaker()
+    belege = [breaker.gesperrt(origin(f"{schema}://{host}/")) for schema in ("https", "http")]
+    return belege[0] if all(belege) else None
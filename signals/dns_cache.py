@@ -0,0 +1,196 @@
+"""
+DNS-Cache für den Abruf-Layer — inklusive Negativ-Cache für tote Domains.
+
+Checker-eigen wie http_client.py. Ohne Cache löst jede Prüfung und jedes
+Schema (https/http) den Hostnamen neu auf: mindestens sechs Lookups pro
+Analyse, und bei einer vertippten oder abgelaufenen Domain kann jeder davon
+hängen. Hier wird ein Hostname pro Prozess nur einmal aufgelöst:
+
+- Erfolg:   Adressen werden DNS_TTL Sekunden gehalten. getaddrinfo()
+            liefert die TTL des Records nicht mit — daher ein fester Wert.
+- NXDOMAIN / Zeitüberschreitung / sonstiger Auflösungsfehler:
+            der Fehler wird DNS_NEGATIV_TTL Sekunden gehalten; in dieser
+            Zeit geht für den Host kein einziges Paket mehr raus.
+- Gleichzeitige Lookups desselben Hosts (robots + Startseite, beide
+  Schemata) teilen sich eine Auflösung.
+- DNS_TIMEOUT zählt erst ab dem Start des Lookups, nicht ab dem Einreihen
+  in den Pool: Sind alle Worker belegt (parallele Analysen, Batch-Lauf),
+  wartet der Aufrufer bis zu DNS_WARTESCHLANGE Sekunden auf einen freien
+  Worker. Reicht das nicht, scheitert nur dieser Abruf — ohne Eintrag im
+  Negativ-Cache, der Host ist ja nicht tot.
+
+Konfiguration:
+    GEO_RADAR_DNS_TTL          Sekunden für erfolgreiche Lookups (Standard 300)
+    GEO_RADAR_DNS_NEGATIV_TTL  Sekunden für Fehlschläge (Standard 60)
+    GEO_RADAR_DNS_TIMEOUT      Obergrenze je Lookup in Sekunden (Standard 5)
+    GEO_RADAR_DNS_WARTESCHLANGE  Wartezeit auf einen freien Worker (Standard 30)
+"""
+from __future__ import annotations
+
+import ipaddress
+import os
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+DNS_TTL = float(os.environ.get("GEO_RADAR_DNS_TTL", "300"))
+DNS_NEGATIV_TTL = float(os.environ.get("GEO_RADAR_DNS_NEGATIV_TTL", "60"))
+DNS_TIMEOUT = float(os.environ.get("GEO_RADAR_DNS_TIMEOUT", "5"))
+DNS_WARTESCHLANGE = float(os.environ.get("GEO_RADAR_DNS_WARTESCHLANGE", "30"))
+
+
+@dataclass
+class _Eintrag:
+    adressen: list[str] = field(default_factory=list)
+    fehler: Optional[str] = None        # gesetzt = Host gilt als tot
+    ablauf: float = 0.0                 # time.monotonic()
+
+
+@dataclass
+class _Lookup:
+    """Ein laufender Lookup: Future plus Startsignal des Workers."""
+    future: Future = field(default_factory=Future)
+    gestartet: threading.Event = field(default_factory=threading.Event)
+    beginn: float = 0.0                 # time.monotonic(), sobald gestartet
+
+
+def _getaddrinfo(host: str) -> list[str]:
+    """IP-Adressen in der Reihenfolge des Systems (IPv6/IPv4 gemischt)."""
+    adressen: list[str] = []
+    for *_rest, sockaddr in socket.getaddrinfo(host, None, type=socket.SOCK_STREAM):
+        if sockaddr[0] not in adressen:
+            adressen.append(sockaddr[0])
+    return adressen
+
+
+class DnsCache:
+    """Auflösung mit Positiv-/Negativ-Cache und Zusammenlegen paralleler Lookups."""
+
+    def __init__(
+        self,
+        ttl: float = DNS_TTL,
+        negativ_ttl: float = DNS_NEGATIV_TTL,
+        timeout: float = DNS_TIMEOUT,
+        aufloeser: Callable[[str], list[str]] = _getaddrinfo,
+        warteschlange: float = DNS_WARTESCHLANGE,
+        worker: int = 4,
+    ):
+        self.ttl = ttl
+        self.negativ_ttl = negativ_ttl
+        self.timeout = timeout
+        self.warteschlange = warteschlange
+        self._aufloeser = aufloeser
+        self._lock = threading.Lock()
+        self._eintraege: dict[str, _Eintrag] = {}
+        self._laufend: dict[str, _Lookup] = {}
+        # getaddrinfo() kennt keinen Timeout — Lookups laufen daher in einem
+        # eigenen Pool, der Aufrufer wartet höchstens `timeout` Sekunden ab
+        # Start des Lookups.
+        self._pool = ThreadPoolExecutor(max_workers=worker, thread_name_prefix="geo-dns")
+        self.lookups = 0
+
+    def _gueltig(self, host: str) -> Optional[_Eintrag]:
+        eintrag = self._eintraege.get(host)
+        if eintrag is not None and eintrag.ablauf > time.monotonic():
+            return eintrag
+        return None
+
+    def bekannt_tot(self, host: str) -> Optional[str]:
+        """Fehlertext, wenn der Host laut Cache nicht auflösbar ist — ohne Lookup."""
+        with self._lock:
+            eintrag = self._gueltig(host.lower())
+        return eintrag.fehler if eintrag is not None else None
+
+    def aufloesen(self, host: str) -> list[str]:
+        """
+        Adressen zum Host. Wirft socket.gaierror, wenn der Host nicht
+        auflösbar ist (auch aus dem Negativ-Cache).
+        """
+        host = host.lower().rstrip(".")
+        try:
+            ipaddress.ip_address(host.strip("[]"))
+            return [host.strip("[]")]
+        except ValueError:
+            pass
+
+        with self._lock:
+            eintrag = self._gueltig(host)
+            if eintrag is None:
+                lookup = self._laufend.get(host)
+                if lookup is None:
+                    lookup = _Lookup()
+                    lookup.future = self._pool.submit(self._loese, host, lookup)
+                    self._laufend[host] = lookup
+                    self.lookups += 1
+        if eintrag is None:
+            eintrag = self._warte(host, lookup)
+        if eintrag.fehler:
+            raise socket.gaierror(socket.EAI_NONAME, eintrag.fehler)
+        return list(eintrag.adressen)
+
+    def _loese(self, host: str, lookup: _Lookup) -> list[str]:
+        lookup.beginn = time.monotonic()
+        lookup.gestartet.set()
+        return self._aufloeser(host)
+
+    def _warte(self, host: str, lookup: _Lookup) -> _Eintrag:
+        if not lookup.gestartet.wait(self.warteschlange):
+            # Pool ausgelastet — sagt nichts über den Host, nicht cachen
+            raise socket.gaierror(
+                socket.EAI_AGAIN,
+                f"DNS-Lookup nicht gestartet (alle Worker belegt, {self.warteschlange:g} s)")
+        future = lookup.future
+        try:
+            rest = lookup.beginn + self.timeout - time.monotonic()
+            adressen = future.result(timeout=max(rest, 0))
+            eintrag = (_Eintrag(adressen=adressen, ablauf=time.monotonic() + self.ttl)
+                       if adressen else
+                       _Eintrag(fehler="keine Adresse", ablauf=time.monotonic() + self.negativ_ttl))
+        except FutureTimeout:
+            eintrag = _Eintrag(fehler=f"Zeitüberschreitung nach {self.timeout:g} s",
+                               ablauf=time.monotonic() + self.negativ_ttl)
+        except OSError as exc:                      # socket.gaierror: NXDOMAIN u. a.
+            eintrag = _Eintrag(fehler=str(exc.strerror or exc),
+                               ablauf=time.monotonic() + self.negativ_ttl)
+        with self._lock:
+            # Der erste wartende Thread trägt ein, alle weiteren sehen denselben Wert
+            if self._laufend.get(host) is lookup:
+                del self._laufend[host]
+                self._eintraege[host] = eintrag
+            return self._eintraege.get(host, eintrag)
+
+    def statistik(self) -> dict:
+        """Für den Admin-Bereich: gehaltene Hosts und echte Lookups seit Start."""
+        with self._lock:
+            gueltig = [e for h in self._eintraege if (e := self._gueltig(h)) is not None]
+        return {
+            "hosts": len(gueltig),
+            "tot": sum(1 for e in gueltig if e.fehler),
+            "lookups": self.lookups,
+        }
+
+
+_resolver: Optional[DnsCache] = None
+_resolver_lock = threading.Lock()
+
+
+def get_dns_cache() -> DnsCache:
+    """Prozessweiter DNS-Cache (lazy, thread-sicher)."""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = DnsCache()
+    return _resolver
+
+
+def domain_tot(domain: str) -> Optional[str]:
+    """
+    Für die Signal-Module: Fehlertext, wenn die Domain laut Cache nicht
+    auflösbar ist — dann gleich UNBEKANNT statt erneut abzurufen.
+    """
+    return get_dns_cache().bekannt_tot(domain.split("/", 1)[0].split(":", 1)[0])
@@ -0,0 +1,395 @@
+"""
+Einmal geparste Startseite für alle Prüfungen.
+
+Checker-eigen wie http_client.py. Signal 2 (JSON-LD, FAQ-Links), Signal 3
+(sichtbarer Text) und die Zusatz-Checks (Kopfdaten) lesen dieselbe Seite —
+früher baute jede Prüfung ihren eigenen BeautifulSoup-Baum, pro Analyse
+also drei vollständige Parses derselben Bytes. Parsen ist der größte
+CPU-Posten einer Analyse.
+
+ParsedDocument parst einmal mit lxml (libxml2, derselbe Parser, den
+BeautifulSoup mit "lxml" benutzt — ohne dessen Python-Objektbaum) und
+liefert daraus die Ansichten, die die Prüfungen brauchen:
+
+- ld_json:          Rohtext der <script type="application/ld+json">-Blöcke
+- anker:            (href, Ankertext) aller <a href>
+- sichtbarer_umfang: Länge und Anfang des Texts ohne <script>/<style>/
+                    <noscript>/<template>/Kommentare (gestreamt, s. u.)
+- kontaktfenster(): begrenzte Fenster für die Adress-/Telefonsuche
+- kopf:             Titel, lang, <meta name/property>, Canonical
+- struktur:         H1, Bilder/alt, Links, hreflang, Wortzahl
+
+kopf und struktur entstehen in einem gemeinsamen Durchgang über den Baum
+(lxml filtert die Tags in C, Python sieht nur die gesuchten Elemente).
+
+Sichtbarer Text wird nie als Ganzes gebaut: _sichtbare_stuecke() läuft
+ereignisgesteuert (iterwalk, wie iterparse über den fertigen Baum) durch
+das Dokument, überspringt die unsichtbaren Teilbäume samt Kommentaren und
+liefert Stück für Stück — Signal 3 zählt nur die Länge und behält eine
+kurze Textprobe, auch bei 2-5 MB großen Page-Builder-Startseiten.
+
+Geparst wird erst beim ersten Zugriff, jede Ansicht einmal berechnet —
+thread-sicher, weil die Prüfungen einer Analyse parallel laufen und sich
+den PageSnapshot (PageSnapshot.dokument) teilen. Der Baum wird nie
+verändert.
+"""
+from __future__ import annotations
+
+import codecs
+import functools
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+from urllib.parse import unquote
+
+import lxml.html
+from lxml import etree
+
+# Text in diesen Elementen ist nicht sichtbar (Signal 3). <nav>, <header>,
+# <footer> zählen mit — dort steht oft der Kontakt.
+UNSICHTBAR = ("script", "style", "noscript", "template")
+
+# Zusatz-Checks: diese Tags liest ParsedDocument._durchlauf; für die
+# Wortzahl zählt aller Text außer Script und Style (Kommentare nie)
+_STRUKTUR_TAGS = ("a", "img", "h1", "meta", "link", "title")
+_ALLE_TEXTE = etree.XPath("//text()", smart_strings=False)
+_SKRIPT_TEXTE = etree.XPath("//script/text() | //style/text()", smart_strings=False)
+
+# Signal 3 behält vom sichtbaren Text nur so viele Zeichen als Beleg
+TEXTPROBE_ZEICHEN = 300
+
+# Ankertext wie BeautifulSoup get_text(): ohne Script-/Style-/Template-Inhalt
+_ANKER_TEXT = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+
+# Kontaktfenster: Text der Inline-Elemente gehört zum umgebenden Block
+# ("Tel: +43 5356 <span>62222</span>"), jedes andere Element beginnt ein
+# neues Fenster. Längere Blöcke werden an Textknoten geteilt.
+_INLINE = frozenset((
+    "a", "abbr", "b", "bdi", "bdo", "br", "cite", "code", "data", "dfn", "em", "font",
+    "i", "kbd", "label", "mark", "q", "s", "samp", "small", "span", "strong", "sub",
+    "sup", "time", "u", "var", "wbr",
+))
+KONTAKTFENSTER_ZEICHEN = 2000
+
+
+# --- Zeichensatz erkennen (ohne Dekodieren des ganzen Bodys) ---------------
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_CT_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:\-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:\-]+)', re.I)
+_XML_ENCODING = re.compile(rb'^\s*<\?xml[^>]+encoding\s*=\s*["\']([\w.:\-]+)', re.I)
+# So weit sucht der HTML-Standard nach <meta charset> (Prescan) — etwas großzügiger.
+_SNIFF_BYTES = 4096
+# Für die UTF-8-Plausibilitätsprüfung reicht der Anfang der Seite.
+_UTF8_PROBE = 64 * 1024
+
+
+def _codec(name: str) -> Optional[str]:
+    """Normalisierter Codec-Name oder None, wenn Python ihn nicht kennt."""
+    try:
+        name = codecs.lookup(name.strip()).name
+    except LookupError:
+        return None
+    # HTML-Standard: latin-1 / ascii als windows-1252 lesen (Browser-Verhalten)
+    return "cp1252" if name in ("latin-1", "iso8859-1", "ascii") else name
+
+
+def _ist_utf8(body: bytes) -> bool:
+    probe = body[:_UTF8_PROBE]
+    try:
+        probe.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        # am Probe-Ende angeschnittenes Mehrbyte-Zeichen ist kein Fehler
+        return len(probe) == _UTF8_PROBE and exc.start >= len(probe) - 3
+    return True
+
+
+def sniff_encoding(body: bytes, content_type: str = "") -> str:
+    """
+    Zeichensatz einer Antwort — in der Reihenfolge des HTML-Standards:
+    BOM, charset im Content-Type, <meta charset> bzw. XML-Deklaration.
+    Fehlt alles, UTF-8, wenn der Anfang gültiges UTF-8 ist, sonst
+    windows-1252. Kein chardet: Aufwand unabhängig von der Seitengröße.
+    """
+    for bom, name in _BOMS:
+        if body.startswith(bom):
+            return name
+    for treffer in (_CT_CHARSET.search(content_type or ""),
+                    _META_CHARSET.search(body[:_SNIFF_BYTES]),
+                    _XML_ENCODING.search(body[:_SNIFF_BYTES])):
+        if treffer:
+            name = treffer.group(1)
+            codec = _codec(name if isinstance(name, str) else name.decode("ascii", "ignore"))
+            if codec:
+                return codec
+    return "utf-8" if _ist_utf8(body) else "cp1252"
+
+
+def ist_utf8_kompatibel(encoding: Optional[str]) -> bool:
+    """True, wenn Rohbytes direkt mit UTF-8-Byte-Mustern durchsucht werden dürfen."""
+    return encoding is None or _codec(encoding) in ("utf-8", "utf-8-sig")
+
+
+def _verbinde(texte: list[str]) -> str:
+    """Wie get_text(" ", strip=True): jedes Stück getrimmt, leere weg."""
+    return " ".join(t for t in (s.strip() for s in texte) if t)
+
+
+def _sichtbare_stuecke(wurzel: etree._Element) -> Iterator[str]:
+    """
+    Sichtbare Textstücke (getrimmt, nicht leer) in Dokument-Reihenfolge, wie
+    get_text(" ", strip=True) sie verbinden würde. Teilbäume der UNSICHTBAR-
+    Tags werden übersprungen, von Kommentaren und Processing Instructions
+    zählt nur der Text danach (tail). Der Baum bleibt unverändert.
+    """
+    gang = etree.iterwalk(wurzel, events=("start", "end", "comment", "pi"))
+    for ereignis, el in gang:
+        if ereignis == "start":
+            if el.tag in UNSICHTBAR:
+                gang.skip_subtree()
+                continue
+            text = el.text
+        else:
+            text = el.tail
+        if text:
+            text = text.strip()
+            if text:
+                yield text
+
+
+def _blockfenster(wurzel: etree._Element) -> Iterator[str]:
+    """
+    Sichtbarer Text je Block-Element, Leerraum zusammengefasst: Text und
+    Tail der Inline-Kinder werden ohne Trenner angehängt wie im Browser,
+    <br> wird zu Leerraum. Teilbäume der UNSICHTBAR-Tags fehlen. Erreicht
+    ein Fenster KONTAKTFENSTER_ZEICHEN, beginnt das nächste mit dem letzten
+    Textknoten des vorigen — kein Knoten wird öfter als zweimal gelesen.
+    """
+    stuecke: list[str] = []
+    laenge = 0
+    gang = etree.iterwalk(wurzel, events=("start", "end", "comment", "pi"))
+    for ereignis, el in gang:
+        if ereignis == "start" and el.tag in UNSICHTBAR:
+            gang.skip_subtree()
+            continue
+        grenze = ereignis in ("start", "end") and el.tag not in _INLINE \
+            and el.tag not in UNSICHTBAR
+        if ereignis == "start":
+            text = " " if el.tag == "br" else el.text
+        else:
+            text = el.tail
+        if grenze or (text and stuecke and laenge + len(text) > KONTAKTFENSTER_ZEICHEN):
+            fenster = " ".join("".join(stuecke).split())
+            if fenster:
+                yield fenster
+            stuecke = [] if grenze else stuecke[-1:]
+            laenge = sum(map(len, stuecke))
+        if text:
+            stuecke.append(text)
+            laenge += len(text)
+    fenster = " ".join("".join(stuecke).split())
+    if fenster:
+        yield fenster
+
+
+def _woerter(texte: list[str]) -> int:
+    """Wörter ab zwei Zeichen (durch Leerraum getrennt)."""
+    return sum(1 for w in " ".join(texte).split() if len(w) > 1)
+
+
+def _parse(body: bytes | str, encoding: Optional[str]) -> Optional[etree._Element]:
+    """
+    lxml-Wurzel oder None (leeres Dokument). Rohbytes dekodiert libxml2
+    selbst; kennt es den Zeichensatz nicht (etwa utf-8-sig), dekodiert
+    Python und libxml2 bekommt UTF-8.
+    """
+    if isinstance(body, str):
+        body, encoding = body.encode("utf-8", errors="replace"), "utf-8"
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding)
+    except LookupError:
+        body = body.decode(encoding, errors="replace").encode("utf-8")
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+    try:
+        return lxml.html.document_fromstring(body, parser=parser)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _einmal(berechne):
+    """Ansicht beim ersten Zugriff berechnen und am Dokument merken."""
+    name = berechne.__name__
+
+    @functools.wraps(berechne)
+    def ansicht(self):
+        with self._lock:
+            if name not in self._ansichten:
+                self._ansichten[name] = berechne(self)
+            return self._ansichten[name]
+    return property(ansicht)
+
+
+@dataclass
+class Kopfdaten:
+    """Was die Zusatz-Checks aus dem <head> lesen."""
+    titel: str = ""                             # <title>, Leerraum zusammengefasst
+    sprache: str = ""                           # <html lang>
+    meta: dict[str, str] = field(default_factory=dict)  # name/property (klein) -> content
+    canonical: str = ""                         # <link rel="canonical" href>
+
+
+@dataclass
+class Textumfang:
+    """Sichtbarer Text (Signal 3), ohne ihn als Ganzes zu bauen."""
+    laenge: int = 0                             # len() des mit Leerzeichen verbundenen Texts
+    probe: str = ""                             # dessen erste TEXTPROBE_ZEICHEN Zeichen
+
+
+@dataclass
+class Seitenstruktur:
+    """Was die Zusatz-Checks aus dem <body> zählen."""
+    h1: list[str] = field(default_factory=list)         # Text je <h1>
+    bilder: int = 0                                     # <img>
+    bilder_mit_alt: int = 0                             # <img> mit nicht-leerem alt
+    links: list[str] = field(default_factory=list)      # href je <a href>
+    hreflang: list[str] = field(default_factory=list)   # hreflang je <link>
+    woerter: int = 0                                    # Wörter ab 2 Zeichen, ohne Script/Style
+
+
+class ParsedDocument:
+    """Ein HTML-Dokument, einmal geparst; Ansichten lazy und gecacht (thread-sicher)."""
+
+    def __init__(self, body: bytes | str, encoding: Optional[str] = None):
+        self.body = body
+        # Rohbytes ohne Zeichensatz: selbst erkennen statt libxml2 raten
+        # lassen (das nähme Latin-1 und zerlegte UTF-8-Umlaute)
+        if isinstance(body, bytes) and not encoding:
+            encoding = sniff_encoding(body)
+        self.encoding = encoding
+        self._lock = threading.RLock()
+        self._ansichten: dict[str, object] = {}
+
+    @_einmal
+    def wurzel(self) -> Optional[etree._Element]:
+        """lxml-Wurzel (<html>) oder None bei leerem Dokument."""
+        return _parse(self.body, self.encoding)
+
+    @_einmal
+    def ld_json(self) -> list[str]:
+        """Rohtext der JSON-LD-Blöcke in Dokument-Reihenfolge; leere übersprungen."""
+        if self.wurzel is None:
+            return []
+        bloecke = []
+        for script in self.wurzel.iter("script"):
+            if "application/ld+json" not in (script.get("type") or "").lower():
+                continue
+            roh = (script.text or "").strip()
+            if roh:
+                bloecke.append(roh)
+        return bloecke
+
+    @_einmal
+    def anker(self) -> list[tuple[str, str]]:
+        """(href, Ankertext) aller Links mit href-Attribut."""
+        if self.wurzel is None:
+            return []
+        return [(a.get("href"), _verbinde(_ANKER_TEXT(a)))
+                for a in self.wurzel.iter("a") if a.get("href") is not None]
+
+    @_einmal
+    def sichtbarer_umfang(self) -> Textumfang:
+        """Länge des sichtbaren Texts (Stücke mit einem Leerzeichen verbunden) und Textprobe."""
+        umfang = Textumfang()
+        if self.wurzel is None:
+            return umfang
+        probe: list[str] = []
+        rest = TEXTPROBE_ZEICHEN
+        for stueck in _sichtbare_stuecke(self.wurzel):
+            if umfang.laenge:
+                stueck = " " + stueck
+            umfang.laenge += len(stueck)
+            if rest > 0:
+                probe.append(stueck[:rest])
+                rest -= len(probe[-1])
+        umfang.probe = "".join(probe)
+        return umfang
+
+    def kontaktfenster(self) -> Iterator[str]:
+        """
+        Begrenzte Fenster für die Adress- und Telefonsuche (Signal 3), in
+        dieser Reihenfolge: Nummern der tel:-Links, Text der <address>-
+        Elemente, sichtbarer Text je Block-Element (_blockfenster), JSON-LD-
+        Blöcke. Inline-Scripts, Styles und Attributwerte (Base64-Blobs)
+        liegen in keinem Fenster. Lazy — die Suche hört beim ersten Treffer
+        auf.
+        """
+        if self.wurzel is None:
+            return
+        for a in self.wurzel.iter("a"):
+            href = (a.get("href") or "").strip()
+            if href[:4].lower() == "tel:":
+                nummer = unquote(href[4:]).strip()
+                if nummer:
+                    yield nummer
+        for el in self.wurzel.iter("address"):
+            yield from _blockfenster(el)
+        yield from _blockfenster(self.wurzel)
+        yield from self.ld_json
+
+    @_einmal
+    def _durchlauf(self) -> tuple[Kopfdaten, Seitenstruktur]:
+        """
+        Kopfdaten und Seitenstruktur: EIN Durchgang (in C) über die Tags, die
+        die Zusatz-Checks brauchen, dazu die Textknoten für die Wortzahl.
+        """
+        kopf, struktur = Kopfdaten(), Seitenstruktur()
+        if self.wurzel is None:
+            return kopf, struktur
+        kopf.sprache = (self.wurzel.get("lang") or "").strip()
+        titel_gesehen = canonical_gesehen = False
+        for el in self.wurzel.iter(*_STRUKTUR_TAGS):
+            tag = el.tag
+            if tag == "a":
+                href = el.get("href")
+                if href is not None:
+                    struktur.links.append(href)
+            elif tag == "img":
+                struktur.bilder += 1
+                if el.get("alt"):
+                    struktur.bilder_mit_alt += 1
+            elif tag == "h1":
+                struktur.h1.append(el.text_content().strip())
+            elif tag == "meta":
+                schluessel = (el.get("name") or el.get("property") or "").strip().lower()
+                if schluessel and schluessel not in kopf.meta:
+                    kopf.meta[schluessel] = (el.get("content") or "").strip()
+            elif tag == "link":
+                if el.get("hreflang"):
+                    struktur.hreflang.append(el.get("hreflang"))
+                if (not canonical_gesehen and el.get("href")
+                        and "canonical" in (el.get("rel") or "").lower().split()):
+                    kopf.canonical, canonical_gesehen = el.get("href").strip(), True
+            elif not titel_gesehen:                 # title
+                kopf.titel, titel_gesehen = " ".join(el.text_content().split()), True
+        # Wörter trennen nie über Textknoten hinweg — also alle minus Script/Style
+        struktur.woerter = (_woerter(_ALLE_TEXTE(self.wurzel))
+                            - _woerter(_SKRIPT_TEXTE(self.wurzel)))
+        return kopf, struktur
+
+    @property
+    def kopf(self) -> Kopfdaten:
+        """Titel, Sprache, Meta-Angaben und Canonical (jeweils die erste Angabe)."""
+        return self._durchlauf[0]
+
+    @property
+    def struktur(self) -> Seitenstruktur:
+        """Überschriften, Bilder, Links, hreflang und Wortzahl."""
+        return self._durchlauf[1]
@@ -0,0 +1,125 @@
+"""
+Gelernte Timeouts je Host für den Abruf-Layer.
+
+Checker-eigen wie http_client.py. Ein fester Timeout (GEO_RADAR_HTTP_TIMEOUT)
+ist für ein CDN viel zu großzügig und für einen langsamen Shared-Host
+manchmal zu knapp. Hier merkt sich der Prozess je Host und Abruf-Klasse
+(robots, html, sitemap, head — eine winzige robots.txt sagt nichts über
+die Denkzeit einer CMS-Seite), wie schnell er tatsächlich antwortet:
+
+- TTFB (Request bis Header, inkl. Verbindungsaufbau): geglätteter Mittelwert
+  und Schwankung wie bei TCP (RFC 6298, SRTT/RTTVAR).
+- Übertragungsrate (Bytes/s des Bodys), nur aus Antworten ab MIN_RATE_BYTES —
+  kleine Bodys messen vor allem die Latenz.
+
+Spätere Abrufe derselben Klasse (FAQ-Unterseiten nach der Startseite,
+erneute Analyse) bekommen daraus ihren Timeout. Gelernt wird nur nach
+unten: nie mehr als der Timeout des Aufrufers (ein langsamer Host wartet
+also nie länger als ohne Messung) und nie unter TIMEOUT_MIN. Ohne
+Messwert gilt der Timeout des Aufrufers unverändert.
+
+Ein knapper gelernter Timeout kann auf langsamen, aber gesunden Hosts
+Zeitüberschreitungen erzeugen. Solche Zeitüberschreitungen zählt
+fetch_url() nicht für die Host-Sicherung (circuit_breaker.py), sonst
+sperrt die eine Schätzung über die andere.
+
+Konfiguration:
+    GEO_RADAR_TIMEOUT_MIN  Untergrenze in Sekunden (Standard 5)
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+TIMEOUT_MIN = float(os.environ.get("GEO_RADAR_TIMEOUT_MIN", "5"))
+
+# Erst ab dieser Body-Größe wird die Übertragungsrate gemessen.
+MIN_RATE_BYTES = 16 * 1024
+# So viele (Host, Klasse)-Paare werden gehalten (älteste fliegen zuerst).
+MAX_HOSTS = 2048
+
+# Gewichte aus RFC 6298
+_ALPHA, _BETA = 1 / 8, 1 / 4
+
+
+@dataclass
+class _Messung:
+    srtt: float                         # geglättete TTFB (s)
+    rttvar: float                       # geglättete Schwankung (s)
+    rate: Optional[float] = None        # geglättete Übertragungsrate (Bytes/s)
+    proben: int = 1
+
+
+class LatenzStatistik:
+    """TTFB und Übertragungsrate je Host und Klasse, daraus abgeleitete Timeouts (thread-sicher)."""
+
+    def __init__(self, minimum: float = TIMEOUT_MIN, max_hosts: int = MAX_HOSTS):
+        self.minimum = minimum
+        self.max_hosts = max_hosts
+        self._lock = threading.Lock()
+        self._hosts: OrderedDict[tuple[str, str], _Messung] = OrderedDict()
+
+    def erfasse(self, host: str, ttfb: float, body_bytes: int = 0,
+                download: float = 0.0, klasse: str = "html") -> None:
+        """Eine beantwortete Anfrage verbuchen (beliebiger HTTP-Status)."""
+        schluessel = (host.lower(), klasse)
+        rate = body_bytes / download if body_bytes >= MIN_RATE_BYTES and download > 0 else None
+        with self._lock:
+            m = self._hosts.get(schluessel)
+            if m is None:
+                m = _Messung(srtt=ttfb, rttvar=ttfb / 2, rate=rate)
+                self._hosts[schluessel] = m
+                while len(self._hosts) > self.max_hosts:
+                    self._hosts.popitem(last=False)
+                return
+            self._hosts.move_to_end(schluessel)
+            m.rttvar = (1 - _BETA) * m.rttvar + _BETA * abs(m.srtt - ttfb)
+            m.srtt = (1 - _ALPHA) * m.srtt + _ALPHA * ttfb
+            if rate is not None:
+                m.rate = rate if m.rate is None else (1 - _ALPHA) * m.rate + _ALPHA * rate
+            m.proben += 1
+
+    def timeout(self, host: str, standard: float, chunk: int = 64 * 1024,
+                klasse: str = "html") -> float:
+        """
+        Timeout für den nächsten Abruf der Klasse: ohne Messwert `standard`,
+        sonst max(3 × TTFB, TTFB + 4 × Schwankung, 4 × Zeit für einen Chunk) —
+        höchstens `standard`, mindestens min(standard, minimum). requests
+        wendet den Wert auf Verbindungsaufbau und jede Lesepause an, daher
+        zählt die Zeit je Chunk und nicht die für den ganzen Body.
+        """
+        with self._lock:
+            m = self._hosts.get((host.lower(), klasse))
+            if m is None:
+                return standard
+            kandidaten = [3 * m.srtt, m.srtt + 4 * m.rttvar]
+            if m.rate:
+                kandidaten.append(4 * chunk / m.rate)
+        return min(standard, max(self.minimum, *kandidaten))
+
+    def statistik(self) -> dict:
+        """Für den Admin-Bereich: vermessene Hosts und deren mittlere TTFB."""
+        with self._lock:
+            werte = [m.srtt for m in self._hosts.values()]
+            hosts = {host for host, _ in self._hosts}
+        return {
+            "hosts": len(hosts),
+            "ttfb_median": round(sorted(werte)[len(werte) // 2], 2) if werte else None,
+        }
+
+
+_latenz: Optional[LatenzStatistik] = None
+_latenz_lock = threading.Lock()
+
+
+def get_latenz() -> LatenzStatistik:
+    """Prozessweite Latenz-Statistik (lazy, thread-sicher)."""
+    global _latenz
+    if _latenz is None:
+        with _latenz_lock:
+            if _latenz is None:
+                _latenz = LatenzStatistik()
+    return _latenz
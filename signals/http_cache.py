@@ -0,0 +1,178 @@
+"""
+Persistenter HTTP-Validator-Cache (ETag / Last-Modified) für den Abruf-Layer.
+
+Checker-eigen wie http_client.py. Hotels prüfen nach jeder Korrektur erneut,
+Leads werden nachgescannt — robots.txt, Startseite und Sitemap ändern sich
+dazwischen meist nicht. Gespeichert werden nur Antworten mit Validator
+(ETag oder Last-Modified). Beim nächsten Abruf schickt der Abruf-Layer
+If-None-Match / If-Modified-Since; antwortet der Server mit 304, kommt der
+Body von der Platte. Das Abrufprotokoll einer Analyse (protokolliere() in
+http_client.py) zählt Treffer und Fehlschläge mit.
+
+Ablage: je URL zwei Dateien im Cache-Verzeichnis — <key>.json (Metadaten,
+Validatoren) und <key>.body (Rohbytes). Größenbegrenzung über max_bytes;
+verdrängt wird nach LRU (Zugriffszeit = mtime der .json-Datei).
+
+Konfiguration:
+    GEO_RADAR_CACHE_DIR   Verzeichnis (Standard: <tmp>/geo-checker-cache)
+    GEO_RADAR_CACHE_MB    Obergrenze in MB (Standard 50; 0 = Cache aus)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "GEO_RADAR_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "geo-checker-cache"),
+)
+DEFAULT_CACHE_MB = float(os.environ.get("GEO_RADAR_CACHE_MB", "50"))
+
+
+@dataclass
+class CacheEintrag:
+    """Metadaten einer gespeicherten Antwort (Body liegt separat)."""
+    url: str
+    final_url: str
+    status: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    encoding: Optional[str] = None
+    headers: dict[str, str] = field(default_factory=dict)
+    dauer: Optional[float] = None   # Sekunden des vollständigen Abrufs (Ladezeit)
+    gespeichert: float = 0.0        # time.time() beim Speichern
+
+
+class ResponseCache:
+    """Dateibasierter Cache mit LRU-Verdrängung. Thread-sicher im Prozess."""
+
+    def __init__(self, verzeichnis: str | Path, max_bytes: int):
+        self.verzeichnis = Path(verzeichnis)
+        self.max_bytes = max_bytes
+        self.treffer = 0
+        self.fehlschlaege = 0
+        self._lock = threading.Lock()
+        self.verzeichnis.mkdir(parents=True, exist_ok=True)
+
+    # -- Pfade ----------------------------------------------------------------
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+    def _pfade(self, url: str) -> tuple[Path, Path]:
+        key = self._key(url)
+        return self.verzeichnis / f"{key}.json", self.verzeichnis / f"{key}.body"
+
+    # -- Lesen ----------------------------------------------------------------
+
+    def lookup(self, url: str) -> Optional[CacheEintrag]:
+        """Metadaten zur URL oder None (kein Eintrag / kaputte Datei)."""
+        meta_pfad, body_pfad = self._pfade(url)
+        try:
+            daten = json.loads(meta_pfad.read_text(encoding="utf-8"))
+            if not body_pfad.exists():
+                return None
+            return CacheEintrag(**daten)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def body(self, url: str) -> Optional[bytes]:
+        """Gespeicherte Rohbytes; markiert den Eintrag als zuletzt benutzt."""
+        meta_pfad, body_pfad = self._pfade(url)
+        try:
+            daten = body_pfad.read_bytes()
+            os.utime(meta_pfad)
+            return daten
+        except OSError:
+            return None
+
+    # -- Schreiben ------------------------------------------------------------
+
+    def store(self, eintrag: CacheEintrag, body: bytes) -> None:
+        """Speichert eine Antwort (atomar per os.replace) und verdrängt nach LRU."""
+        if len(body) > self.max_bytes:
+            return
+        meta_pfad, body_pfad = self._pfade(eintrag.url)
+        eintrag.gespeichert = time.time()
+        with self._lock:
+            try:
+                tmp_body = body_pfad.with_suffix(".body.tmp")
+                tmp_body.write_bytes(body)
+                os.replace(tmp_body, body_pfad)
+                tmp_meta = meta_pfad.with_suffix(".json.tmp")
+                tmp_meta.write_text(json.dumps(eintrag.__dict__), encoding="utf-8")
+                os.replace(tmp_meta, meta_pfad)
+            except OSError:
+                return  # Cache ist Beiwerk — ein Schreibfehler bricht keine Analyse
+            self._verdraenge()
+
+    def _eintraege(self) -> list[tuple[float, int, Path]]:
+        """(letzter Zugriff, Größe in Bytes, meta_pfad) je Eintrag."""
+        liste = []
+        for meta_pfad in self.verzeichnis.glob("*.json"):
+            body_pfad = meta_pfad.with_suffix(".body")
+            try:
+                groesse = meta_pfad.stat().st_size + body_pfad.stat().st_size
+                liste.append((meta_pfad.stat().st_mtime, groesse, meta_pfad))
+            except OSError:
+                continue
+        return liste
+
+    def _verdraenge(self) -> None:
+        eintraege = self._eintraege()
+        gesamt = sum(g for _, g, _ in eintraege)
+        for _, groesse, meta_pfad in sorted(eintraege):
+            if gesamt <= self.max_bytes:
+                break
+            for pfad in (meta_pfad, meta_pfad.with_suffix(".body")):
+                try:
+                    pfad.unlink()
+                except OSError:
+                    pass
+            gesamt -= groesse
+
+    # -- Diagnose -------------------------------------------------------------
+
+    def zaehle(self, treffer: bool) -> None:
+        with self._lock:
+            if treffer:
+                self.treffer += 1
+            else:
+                self.fehlschlaege += 1
+
+    def statistik(self) -> dict:
+        """Für den Admin-Bereich: Belegung und Treffer seit Prozessstart."""
+        eintraege = self._eintraege()
+        return {
+            "eintraege": len(eintraege),
+            "belegt_mb": round(sum(g for _, g, _ in eintraege) / 1_000_000, 2),
+            "max_mb": round(self.max_bytes / 1_000_000, 2),
+            "treffer": self.treffer,
+            "fehlschlaege": self.fehlschlaege,
+        }
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """Prozessweiter Cache; None, wenn abgeschaltet oder nicht anlegbar."""
+    global _cache
+    if DEFAULT_CACHE_MB <= 0:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = ResponseCache(DEFAULT_CACHE_DIR, int(DEFAULT_CACHE_MB * 1_000_000))
+                except OSError:
+                    return None
+    return _cache
@@ -0,0 +1,842 @@
+"""
+Gemeinsamer Abruf-Layer für die Signal-Module und die Zusatz-Checks.
+
+Anders als die drei Signal-Module ist diese Datei checker-eigen (nicht aus
+geo-radar übernommen). Die Startseite wird pro Analyse nur einmal geholt
+(fetch_homepage, https bevorzugt mit http als Fallback); Signal 2, Signal 3
+und check_website() werten denselben PageSnapshot aus. Alle ausgehenden
+Aufrufe laufen über eine prozessweite Session (get_session) und fetch_url(),
+das Zeitbudget, Byte-Limits und Zeitmessung je Abruf durchsetzt.
+
+Die Bausteine dahinter stehen in eigenen Modulen: dns_cache.py,
+http_cache.py (Validator-Cache), redirect_cache.py, circuit_breaker.py
+(Sicherung je Origin), host_latenz.py (gelernte Timeouts) und dokument.py
+(gemeinsamer Parse).
+
+Nutzung:
+    from http_client import fetch_homepage
+    startseite = fetch_homepage("hotel-example.at")
+    check_schema("hotel-example.at", snapshot=startseite)
+"""
+from __future__ import annotations
+
+import contextvars
+import os
+import socket
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Iterator, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import (
+    ConnectTimeoutError, NameResolutionError, NewConnectionError, ReadTimeoutError,
+)
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from circuit_breaker import get_breaker, origin
+from dns_cache import get_dns_cache
+from dokument import ParsedDocument, ist_utf8_kompatibel, sniff_encoding  # noqa: F401
+from host_latenz import get_latenz
+from redirect_cache import get_redirect_cache
+from http_cache import CacheEintrag, get_cache
+
+
+# -----------------------------------------------------------------------------
+# Konfiguration (gleiche Environment-Schlüssel wie die Signal-Module)
+# -----------------------------------------------------------------------------
+
+DEFAULT_USER_AGENT = os.environ.get(
+    "GEO_RADAR_USER_AGENT",
+    "GEO-Radar/0.1 (+contact: gernotriedel@gmx.at)",
+)
+DEFAULT_TIMEOUT = int(os.environ.get("GEO_RADAR_HTTP_TIMEOUT", "15"))
+
+# Connection-Pools: wie viele Hosts gleichzeitig gepoolt werden und wie viele
+# offene Verbindungen je Host (parallele Abrufe desselben Hosts).
+POOL_HOSTS = int(os.environ.get("GEO_RADAR_HTTP_POOL_HOSTS", "32"))
+POOL_PRO_HOST = int(os.environ.get("GEO_RADAR_HTTP_POOL_PRO_HOST", "6"))
+
+# Retry nur für Verbindungsaufbau (Reset/DNS-Wackler) und nur für GET/HEAD —
+# ein POST (Mailversand) darf nie doppelt rausgehen. Lese-Timeouts und
+# HTTP-Status werden NICHT wiederholt: das würde die Wartezeit auf toten
+# Hosts vervielfachen, und 4xx/5xx sind Befunde, keine Störungen.
+RETRY_POLICY = Retry(
+    total=2,
+    connect=1,
+    read=0,
+    status=0,
+    backoff_factor=0.2,
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    raise_on_status=False,
+)
+
+# Hedge: so lange bekommt https Vorsprung, bevor http parallel startet.
+# Leer gesetzt (GEO_RADAR_HEDGE_DELAY=) = alter, rein serieller Fallback.
+_hedge_env = os.environ.get("GEO_RADAR_HEDGE_DELAY", "1.5").strip()
+HEDGE_DELAY: Optional[float] = float(_hedge_env) if _hedge_env else None
+
+# Obergrenze je Ressourcen-Art (dekomprimierte Bytes). Größere Antworten
+# werden nach dem Limit abgebrochen; ausgewertet wird der Anfang, der
+# Snapshot trägt truncated=True. robots.txt: Google liest ebenfalls nur
+# die ersten 500 KiB.
+MAX_BYTES = {
+    "robots": int(os.environ.get("GEO_RADAR_MAX_ROBOTS_KB", "500")) * 1024,
+    "html": int(os.environ.get("GEO_RADAR_MAX_HTML_KB", "5120")) * 1024,
+    "sitemap": int(os.environ.get("GEO_RADAR_MAX_SITEMAP_KB", "10240")) * 1024,
+}
+_CHUNK = 64 * 1024
+
+HTML_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "de-AT,de;q=0.9,en;q=0.7",
+    # urllib3 ergänzt br (brotli) bzw. zstd nur, wenn das Paket importierbar
+    # ist — angeboten wird also nie etwas, das nicht dekodiert werden kann.
+    "Accept-Encoding": ACCEPT_ENCODING.replace(",", ", "),
+}
+
+
+T = TypeVar("T")
+
+
+# -----------------------------------------------------------------------------
+# Prozessweite Session (Keep-Alive-Pools je Host)
+# -----------------------------------------------------------------------------
+
+class _Abbruch(threading.Event):
+    """
+    Abbruch-Signal eines Hedge-Versuchs. set() trennt zusätzlich die Sockets,
+    auf denen der Versuch gerade wartet (Verbindungsaufbau, TLS, Antwort) —
+    der Verlierer gibt seinen Worker so sofort frei statt erst nach seinem
+    Timeout. fetch_url meldet die Sockets an und nach dem Abruf wieder ab.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._sockets: list[socket.socket] = []
+
+    def melde(self, sock: socket.socket) -> None:
+        with self._lock:
+            if not self.is_set():
+                self._sockets.append(sock)
+                return
+        _trenne(sock)
+
+    def loese(self) -> None:
+        """Abruf fertig: Verbindungen gehören wieder dem Pool."""
+        with self._lock:
+            self._sockets.clear()
+
+    def set(self) -> None:
+        with self._lock:
+            super().set()
+            sockets, self._sockets = self._sockets, []
+        for sock in sockets:
+            _trenne(sock)
+
+
+def _trenne(sock: socket.socket) -> None:
+    # shutdown() weckt einen in connect()/recv() blockierten Thread, close() nicht
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+_abbruch: contextvars.ContextVar[Optional[_Abbruch]] = contextvars.ContextVar(
+    "geo_abbruch", default=None)
+
+
+class _DnsCacheVerbindung:
+    """
+    Mixin für urllib3-Verbindungen: Adressen kommen aus dem DNS-Cache.
+    Verbunden wird mit der IP, TLS (SNI, Zertifikatsprüfung) läuft weiter
+    gegen self.host — nur der Socket nutzt _dns_host.
+
+    Nebenbei: Dauer von Auflösung und TCP-Aufbau landen in der
+    Zeitmessung des laufenden Abrufs (siehe fetch_url).
+    """
+
+    def _new_conn(self):
+        host = self._dns_host
+        messung = _messung.get()
+        t0 = time.monotonic()
+        try:
+            adressen = get_dns_cache().aufloesen(host)
+        except socket.gaierror as exc:
+            raise NameResolutionError(self.host, self, exc) from exc
+        t1 = time.monotonic()
+        try:
+            for i, ip in enumerate(adressen):
+                self._dns_host = ip
+                try:
+                    return self._verbinde()
+                except (ConnectTimeoutError, NewConnectionError):
+                    if i == len(adressen) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+            if messung is not None:
+                messung.dns += t1 - t0
+                messung.verbindung += time.monotonic() - t1
+
+
+    def _verbinde(self):
+        # Ohne Abbruch-Signal der Weg von urllib3; sonst derselbe Aufbau mit
+        # eigenem Socket, den ein Hedge-Abbruch schon während connect() trennt
+        abbruch = _abbruch.get()
+        if abbruch is None:
+            return super()._new_conn()
+        sock = socket.socket(socket.AF_INET6 if ":" in self._dns_host else socket.AF_INET,
+                             socket.SOCK_STREAM)
+        try:
+            for opt in self.socket_options or ():
+                sock.setsockopt(*opt)
+            if isinstance(self.timeout, (int, float)):
+                sock.settimeout(self.timeout)
+            if self.source_address:
+                sock.bind(self.source_address)
+            abbruch.melde(sock)
+            sock.connect((self._dns_host, self.port))
+        except socket.timeout as exc:
+            sock.close()
+            raise ConnectTimeoutError(
+                self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+            ) from exc
+        except OSError as exc:
+            sock.close()
+            raise NewConnectionError(self, f"Failed to establish a new connection: {exc}") from exc
+        return sock
+
+    def request(self, *args, **kwargs):
+        # Wiederverwendete Keep-Alive-Verbindung: auch sie gehört dem Versuch
+        abbruch = _abbruch.get()
+        if abbruch is not None and self.sock is not None:
+            abbruch.melde(self.sock)
+        return super().request(*args, **kwargs)
+
+
+class _HTTPVerbindung(_DnsCacheVerbindung, HTTPConnection):
+    pass
+
+
+class _HTTPSVerbindung(_DnsCacheVerbindung, HTTPSConnection):
+    def connect(self):
+        # connect() = _new_conn() (DNS + TCP, selbst gemessen) + TLS-Handshake
+        messung = _messung.get()
+        if messung is None:
+            return super().connect()
+        vorher, t0 = messung.dns + messung.verbindung, time.monotonic()
+        try:
+            return super().connect()
+        finally:
+            messung.tls += time.monotonic() - t0 - (messung.dns + messung.verbindung - vorher)
+
+
+class _HTTPPool(HTTPConnectionPool):
+    ConnectionCls = _HTTPVerbindung
+
+
+class _HTTPSPool(HTTPSConnectionPool):
+    ConnectionCls = _HTTPSVerbindung
+
+
+class _DnsCacheAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _HTTPPool, "https": _HTTPSPool}
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _neue_session() -> requests.Session:
+    session = requests.Session()
+    adapter = _DnsCacheAdapter(
+        pool_connections=POOL_HOSTS,
+        pool_maxsize=POOL_PRO_HOST,
+        max_retries=RETRY_POLICY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": DEFAULT_USER_AGENT,
+        "Accept-Language": HTML_HEADERS["Accept-Language"],
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Liefert die prozessweite Session (beim ersten Aufruf angelegt). Ihr
+    Connection-Pool hält Keep-Alive-Verbindungen je Host offen — robots.txt,
+    Startseite und Unterseiten desselben Hosts zahlen den TCP/TLS-Handshake
+    nur einmal; Namen löst sie über den DNS-Cache auf (dns_cache.py).
+
+    Thread-sicher: das Anlegen ist per Lock geschützt, und die Pools von
+    urllib3 vergeben Verbindungen thread-sicher. Aufrufer übergeben ihre
+    Header pro Request und verändern die Session selbst nie.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _neue_session()
+    return _session
+
+
+# -----------------------------------------------------------------------------
+# Datentyp: eine geholte Seite
+# -----------------------------------------------------------------------------
+
+@dataclass
+class Zeitmessung:
+    """
+    Aufschlüsselung EINES Abrufs in Sekunden. dns/verbindung/tls bleiben 0,
+    wenn eine offene Keep-Alive-Verbindung wiederverwendet wurde.
+    """
+    dns: float = 0.0                            # Namensauflösung (DNS-Cache)
+    verbindung: float = 0.0                     # TCP-Verbindungsaufbau
+    tls: float = 0.0                            # TLS-Handshake
+    ttfb: float = 0.0                           # Request-Start bis Antwort-Header (alles davor inkl.)
+    download: float = 0.0                       # Antwort-Header bis letztes Byte
+    bytes: int = 0                              # Body-Bytes (dekomprimiert)
+    bytes_leitung: int = 0                      # tatsächlich übertragene Body-Bytes
+    kodierung: str = ""                         # Content-Encoding ("gzip", "br", "" = keine)
+    redirects: list[dict] = field(default_factory=list)  # je Hop: url, status, dauer (+ cache)
+
+    @property
+    def warten(self) -> float:
+        """Wartezeit auf den Server (inkl. Redirect-Hops), ohne DNS/TCP/TLS."""
+        return max(0.0, self.ttfb - self.dns - self.verbindung - self.tls)
+
+    def als_dict(self) -> dict:
+        """Gerundet, für facts und Analyse-Ergebnis."""
+        werte = {k: round(getattr(self, k), 3)
+                 for k in ("dns", "verbindung", "tls", "ttfb", "warten", "download")}
+        return {**werte, "bytes": self.bytes, "bytes_leitung": self.bytes_leitung,
+                "kodierung": self.kodierung, "redirects": list(self.redirects)}
+
+
+_messung: contextvars.ContextVar[Optional[Zeitmessung]] = contextvars.ContextVar(
+    "geo_zeitmessung", default=None)
+
+
+# Schützt nur das Anlegen von PageSnapshot.dokument (das Parsen selbst ist lazy)
+_dokument_lock = threading.Lock()
+
+
+@dataclass
+class PageSnapshot:
+    """Ergebnis EINES Seitenabrufs — Rohdaten, keine Bewertung."""
+    url: str                                    # angefragte URL
+    final_url: Optional[str] = None             # nach Redirects; None = nicht abrufbar
+    status: Optional[int] = None                # letzter HTTP-Status (auch bei Fehler)
+    headers: CaseInsensitiveDict = field(default_factory=CaseInsensitiveDict)
+    body: bytes = b""
+    encoding: Optional[str] = None              # sniff_encoding(): BOM > Content-Type > <meta>
+    elapsed: Optional[float] = None             # Sekunden vom Request bis zum letzten Byte
+    error: Optional[str] = None                 # Netzwerk-Fehler im Klartext
+    cache: Optional[str] = None                 # "hit" (304, Body von Platte) | "miss" | None
+    truncated: bool = False                     # Body nach MAX_BYTES abgeschnitten
+    budget_exceeded: bool = False               # Zeitbudget (deadline) vor Abschluss verbraucht
+    host_gesperrt: bool = False                 # nicht abgerufen: Host-Sicherung offen
+    timing: Optional[Zeitmessung] = None        # nur bei empfangener Antwort
+    _dokument: Optional[ParsedDocument] = field(default=None, init=False, repr=False,
+                                                compare=False)
+
+    @property
+    def ok(self) -> bool:
+        """True, wenn die Seite mit 2xx geliefert wurde."""
+        return (
+            self.final_url is not None
+            and self.status is not None
+            and 200 <= self.status < 300
+        )
+
+    @cached_property
+    def text(self) -> str:
+        """Body als str (einmal dekodiert, danach gecacht)."""
+        try:
+            return self.body.decode(self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            # Unbekanntes Encoding im Content-Type -> UTF-8 ist der ehrlichste Versuch
+            return self.body.decode("utf-8", errors="replace")
+
+    @property
+    def dokument(self) -> ParsedDocument:
+        """Body als geparstes Dokument — einmal je Snapshot, von allen Prüfungen geteilt."""
+        with _dokument_lock:
+            if self._dokument is None:
+                self._dokument = ParsedDocument(self.body, self.encoding)
+        return self._dokument
+
+
+# -----------------------------------------------------------------------------
+# Zeitbudget
+# -----------------------------------------------------------------------------
+
+# Begründung für alles, was bis zur deadline nicht fertig wurde — die
+# Aufrufer melden dann UNBEKANNT (Grundregel: UNBEKANNT statt raten).
+ZEITBUDGET_UEBERSCHRITTEN = "Zeitbudget überschritten"
+
+
+def restzeit(deadline: Optional[float]) -> Optional[float]:
+    """Sekunden bis zur deadline (time.monotonic()-Wert); None = kein Budget."""
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def zeitbudget_erschoepft(deadline: Optional[float]) -> bool:
+    rest = restzeit(deadline)
+    return rest is not None and rest <= 0
+
+
+class _BudgetAbbruch(Exception):
+    """Intern: Body-Download an der deadline abgebrochen."""
+
+
+# -----------------------------------------------------------------------------
+# Abrufprotokoll je Analyse
+# -----------------------------------------------------------------------------
+
+class Abrufprotokoll:
+    """Sammelt alle Abrufe einer Analyse (thread-sicher)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.abrufe: list[PageSnapshot] = []
+
+    def erfasse(self, snap: PageSnapshot) -> None:
+        with self._lock:
+            self.abrufe.append(snap)
+
+    def zusammenfassung(self) -> dict:
+        """
+        Kennzahlen für Ergebnis und Admin-Bereich. zeiten: Summe je Phase
+        über alle Abrufe (parallele Abrufe zählen einzeln).
+        """
+        with self._lock:
+            abrufe = list(self.abrufe)
+        zeiten = {k: 0.0 for k in ("dns", "verbindung", "tls", "warten", "download")}
+        for a in abrufe:
+            if a.timing is not None:
+                for k in zeiten:
+                    zeiten[k] += getattr(a.timing, k)
+        return {
+            "abrufe": len(abrufe),
+            "cache_treffer": sum(1 for a in abrufe if a.cache == "hit"),
+            "cache_fehlschlaege": sum(1 for a in abrufe if a.cache == "miss"),
+            "zeiten": {k: round(v, 3) for k, v in zeiten.items()},
+            "bytes": sum(a.timing.bytes for a in abrufe if a.timing is not None),
+            "bytes_leitung": sum(a.timing.bytes_leitung for a in abrufe if a.timing is not None),
+        }
+
+
+_protokoll: contextvars.ContextVar[Optional[Abrufprotokoll]] = contextvars.ContextVar(
+    "geo_abrufprotokoll", default=None)
+
+
+@contextmanager
+def protokolliere() -> Iterator[Abrufprotokoll]:
+    """Alle Abrufe innerhalb des with-Blocks landen im gelieferten Protokoll."""
+    protokoll = Abrufprotokoll()
+    token = _protokoll.set(protokoll)
+    try:
+        yield protokoll
+    finally:
+        _protokoll.reset(token)
+
+
+def submit_mit_kontext(pool: Executor, fn: Callable[..., T], *args, **kwargs) -> Future:
+    """pool.submit, aber mit dem Kontext des Aufrufers (Abrufprotokoll)."""
+    ctx = contextvars.copy_context()
+    return pool.submit(ctx.run, fn, *args, **kwargs)
+
+
+def cache_statistik() -> dict:
+    """Diagnose für den Admin-Bereich (leer, wenn der Cache aus ist)."""
+    cache = get_cache()
+    return cache.statistik() if cache is not None else {}
+
+
+def breaker_statistik() -> dict:
+    """Diagnose für den Admin-Bereich: gesperrte Hosts, ersparte Abrufe."""
+    return get_breaker().statistik()
+
+
+def redirect_statistik() -> dict:
+    """Diagnose für den Admin-Bereich: gemerkte Umleitungen, ersparte Ketten."""
+    return get_redirect_cache().statistik()
+
+
+def latenz_statistik() -> dict:
+    """Diagnose für den Admin-Bereich: vermessene Hosts, mittlere TTFB."""
+    return get_latenz().statistik()
+
+
+# -----------------------------------------------------------------------------
+# Abruf
+# -----------------------------------------------------------------------------
+
+def fetch_url(
+    url: str,
+    user_agent: str = DEFAULT_USER_AGENT,
+    timeout: int = DEFAULT_TIMEOUT,
+    accept: str = HTML_HEADERS["Accept"],
+    abbruch: Optional[threading.Event] = None,
+    cache: bool = False,
+    art: str = "html",
+    deadline: Optional[float] = None,
+    methode: str = "GET",
+    bereich: Optional[int] = None,
+    _bedingt: bool = True,
+) -> PageSnapshot:
+    """
+    Holt genau eine URL (Redirects folgen). Wirft nie — Netzwerk-Fehler
+    landen in PageSnapshot.error, final_url bleibt dann None.
+
+    art: "robots" | "html" | "sitemap" — bestimmt das Byte-Limit (MAX_BYTES).
+    Der Body wird gestreamt; ab dem Limit bricht der Download ab.
+
+    methode="HEAD": nur Status und Header (Existenz-Probe).
+    bereich: nur die ersten `bereich` Bytes anfragen (Range, unkomprimiert)
+    und höchstens so viele lesen — für Proben, die den Anfang sehen müssen.
+
+    abbruch: wird das Event gesetzt (z. B. weil das andere Schema schon
+    gewonnen hat), wird der Body gar nicht erst geladen.
+    cache: Validator-Cache nutzen (robots.txt, Startseite, Sitemap) —
+    bedingter Request, 304 wird aus dem Cache beantwortet. Fehlt der
+    gespeicherte Body beim 304 (verdrängt, unlesbar), wird einmal ohne
+    Validatoren neu geholt.
+    deadline: Ende des Zeitbudgets (time.monotonic()). Der Abruf bekommt
+    höchstens die Restzeit als Timeout; wird sie überschritten, ist das
+    Ergebnis ein Fehler-Snapshot mit budget_exceeded=True.
+
+    Ist die Origin (Schema, Host, Port) nach wiederholten
+    Zeitüberschreitungen gesperrt (circuit_breaker.py), kommt sofort ein
+    Fehler-Snapshot mit host_gesperrt=True und dem ursprünglichen Fehler zurück.
+
+    timeout gilt nur, solange Host und Abruf-Klasse (art, bzw. "head") noch
+    nicht vermessen sind — danach zählt der gelernte Wert (host_latenz.py).
+    """
+    headers = {"User-Agent": user_agent, **HTML_HEADERS, "Accept": accept}
+    if bereich is not None:
+        # Range zählt auf den übertragenen Bytes — komprimiert wäre der
+        # Anfang nicht dekodierbar
+        headers["Range"] = f"bytes=0-{bereich - 1}"
+        headers["Accept-Encoding"] = "identity"
+    snap = PageSnapshot(url=url)
+    umleitungen = get_redirect_cache()
+    ziel_url, umleitung = umleitungen.aufloesen(url)
+    host = urlsplit(ziel_url).hostname or ""
+    schluessel = origin(ziel_url)
+    latenz = get_latenz()
+    klasse = "head" if methode == "HEAD" else art
+    vorgabe = timeout
+    gelernt = latenz.timeout(host, timeout, _CHUNK, klasse)
+    # Unter einem gelernten Timeout, der knapper ist als die Vorgabe, sagt eine
+    # Zeitüberschreitung nichts Sicheres über den Host — nicht für die Sperre
+    verkuerzt = gelernt < timeout
+    timeout = gelernt
+    rest = restzeit(deadline)
+    gekappt = False
+    if rest is not None:
+        if rest <= 0:
+            return _ueber_budget(snap)
+        gekappt = rest < timeout
+        timeout = min(timeout, rest)
+    breaker = get_breaker()
+    beleg = breaker.kurzschluss(schluessel)
+    if beleg is not None:
+        snap.error = beleg
+        snap.host_gesperrt = True
+        _erfasse(snap)
+        return snap
+    speicher = get_cache() if cache else None
+    eintrag = speicher.lookup(url) if speicher is not None and _bedingt else None
+    if eintrag is not None:
+        if eintrag.etag:
+            headers["If-None-Match"] = eintrag.etag
+        if eintrag.last_modified:
+            headers["If-Modified-Since"] = eintrag.last_modified
+
+    messung = Zeitmessung()
+    token = _messung.set(messung)
+    token_abbruch = _abbruch.set(abbruch if isinstance(abbruch, _Abbruch) else None)
+    t0 = time.monotonic()
+    try:
+        senden = get_session().head if methode == "HEAD" else get_session().get
+        r = senden(ziel_url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+        t_header = time.monotonic()
+        if abbruch is not None and abbruch.is_set():
+            r.close()
+            snap.error = "abgebrochen (anderes Schema war schneller)"
+            return snap
+        body, snap.truncated = _lies_begrenzt(r, bereich or MAX_BYTES[art], deadline)
+        if abbruch is not None and abbruch.is_set():
+            # Body womöglich mitten drin getrennt — weder werten noch cachen
+            snap.error = "abgebrochen (anderes Schema war schneller)"
+            return snap
+    except _BudgetAbbruch:
+        return _ueber_budget(snap)
+    except requests.RequestException as exc:
+        if abbruch is not None and abbruch.is_set():
+            snap.error = "abgebrochen (anderes Schema war schneller)"
+            return snap
+        if zeitbudget_erschoepft(deadline):
+            return _ueber_budget(snap)
+        snap.error = f"{exc.__class__.__name__}: {exc}"
+        if umleitung is not None:
+            umleitungen.vergiss(url)
+        # Ein vom Zeitbudget oder vom Lernen verkürzter Timeout sagt nichts
+        # über den Host
+        if _ist_zeitueberschreitung(exc) and not (gekappt or verkuerzt):
+            breaker.fehlschlag(schluessel, snap.error)
+        _erfasse(snap)
+        return snap
+    finally:
+        _messung.reset(token)
+        _abbruch.reset(token_abbruch)
+        if isinstance(abbruch, _Abbruch):
+            abbruch.loese()
+    if umleitung is not None and not umleitung.bestaetigt(r.status_code, r.url):
+        # Gemerktes Ziel trägt nicht mehr: vergessen, einmal der echten Kette folgen
+        r.close()
+        umleitungen.vergiss(url)
+        return fetch_url(url, user_agent=user_agent, timeout=vorgabe, accept=accept,
+                         abbruch=abbruch, cache=cache, art=art, deadline=deadline,
+                         methode=methode, bereich=bereich, _bedingt=_bedingt)
+    t_ende = time.monotonic()
+    snap.elapsed = round(t_ende - t0, 2)
+    messung.ttfb, messung.download, messung.bytes = t_header - t0, t_ende - t_header, len(body)
+    messung.kodierung = r.headers.get("Content-Encoding", "").strip().lower()
+    messung.bytes_leitung = _leitungsbytes(r, len(body))
+    hops = [
+        {"url": hop.url, "status": hop.status_code,
+         "dauer": round(hop.elapsed.total_seconds(), 3)}
+        for hop in getattr(r, "history", ())
+    ]
+    # Übersprungene Kette als Beleg voran (ohne Dauer — sie lief nicht)
+    gespart = [{**hop, "dauer": 0.0, "cache": True} for hop in umleitung.kette] if umleitung else []
+    messung.redirects = gespart + hops
+    if hops:
+        umleitungen.merke(url, r.url, [{"url": h["url"], "status": h["status"]}
+                                       for h in gespart + hops])
+    snap.timing = messung
+    breaker.erfolg(schluessel)
+    latenz.erfasse(host, messung.ttfb, messung.bytes, messung.download, klasse)
+
+    if r.status_code == 304 and eintrag is not None:
+        gespeichert = speicher.body(url)
+        if gespeichert is not None:
+            snap.final_url = eintrag.final_url
+            snap.status = eintrag.status
+            snap.headers = CaseInsensitiveDict(eintrag.headers)
+            snap.body = gespeichert
+            snap.encoding = sniff_encoding(gespeichert, snap.headers.get("Content-Type", ""))
+            # Ladezeit: ein 304 ohne Body ist immer schnell — maßgeblich bleibt
+            # die Dauer des letzten vollständigen Abrufs.
+            snap.elapsed = max(snap.elapsed, eintrag.dauer or 0.0)
+            snap.cache = "hit"
+            speicher.zaehle(treffer=True)
+            _erfasse(snap)
+            return snap
+        # 304, aber der Body ist weg: ein leerer Snapshot wäre eine leere
+        # Startseite — also einmal unbedingt nachholen
+        return fetch_url(url, user_agent=user_agent, timeout=vorgabe, accept=accept,
+                         abbruch=abbruch, cache=cache, art=art, deadline=deadline,
+                         methode=methode, bereich=bereich, _bedingt=False)
+
+    snap.final_url = r.url
+    snap.status = r.status_code
+    snap.headers = CaseInsensitiveDict(r.headers)
+    snap.body = body
+    snap.encoding = sniff_encoding(body, r.headers.get("Content-Type", ""))
+    if speicher is not None:
+        snap.cache = "miss"
+        speicher.zaehle(treffer=False)
+        etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+        if r.status_code == 200 and (etag or last_modified) and not snap.truncated:
+            speicher.store(CacheEintrag(
+                url=url, final_url=r.url, status=200,
+                etag=etag, last_modified=last_modified, encoding=snap.encoding,
+                headers=dict(r.headers), dauer=snap.elapsed,
+            ), body)
+    _erfasse(snap)
+    return snap
+
+
+def _leitungsbytes(r, entpackt: int) -> int:
+    """Vom Socket gelesene Body-Bytes (vor dem Entpacken); urllib3 zählt mit."""
+    tell = getattr(getattr(r, "raw", None), "tell", None)
+    try:
+        return int(tell()) if tell is not None else entpackt
+    except (TypeError, ValueError, OSError):
+        return entpackt
+
+
+def _ist_zeitueberschreitung(exc: requests.RequestException) -> bool:
+    """Connect- oder Read-Timeout — auch der beim Body-Streamen, den requests
+    als ConnectionError(ReadTimeoutError) weiterreicht."""
+    return isinstance(exc, requests.Timeout) or any(
+        isinstance(arg, ReadTimeoutError) for arg in exc.args)
+
+
+def _ueber_budget(snap: PageSnapshot) -> PageSnapshot:
+    snap.error = ZEITBUDGET_UEBERSCHRITTEN
+    snap.budget_exceeded = True
+    _erfasse(snap)
+    return snap
+
+
+def _lies_begrenzt(r, max_bytes: int, deadline: Optional[float] = None) -> tuple[bytes, bool]:
+    """
+    (Body, abgeschnitten?) — liest höchstens max_bytes, dann Verbindung zu.
+    Wirft _BudgetAbbruch, wenn die deadline mitten im Body abläuft.
+    """
+    teile: list[bytes] = []
+    rest = max_bytes
+    for chunk in r.iter_content(_CHUNK):
+        if zeitbudget_erschoepft(deadline):
+            r.close()
+            raise _BudgetAbbruch()
+        if len(chunk) > rest:
+            teile.append(chunk[:rest])
+            r.close()
+            return b"".join(teile), True
+        teile.append(chunk)
+        rest -= len(chunk)
+    return b"".join(teile), False
+
+
+def _erfasse(snap: PageSnapshot) -> None:
+    protokoll = _protokoll.get()
+    if protokoll is not None:
+        protokoll.erfasse(snap)
+
+
+# -----------------------------------------------------------------------------
+# https/http-Hedge
+# -----------------------------------------------------------------------------
+
+# Eigener kleiner Pool für Hedge-Versuche. Ein verlorener Versuch belegt
+# seinen Worker nicht bis zum Timeout: sein _Abbruch trennt die Verbindung.
+_hedge_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="geo-hedge")
+
+
+def hedge_schemes(
+    versuch: Callable[[str, threading.Event], T],
+    endgueltig: Callable[[T], bool],
+    delay: Optional[float] = HEDGE_DELAY,
+) -> tuple[Optional[T], list[T]]:
+    """
+    Führt versuch("https", abbruch) und versuch("http", abbruch) aus —
+    https bevorzugt, http als Fallback (gleiche Semantik wie die frühere
+    Schleife `for scheme in ("https", "http")`).
+
+    Unterschied: Antwortet https nicht binnen `delay` Sekunden, startet http
+    schon parallel. Kommt http zuerst mit einem endgültigen Ergebnis, bekommt
+    https noch einmal `delay` Sekunden Nachfrist — gewinnt es darin, gilt
+    weiterhin das https-Ergebnis. Der Verlierer bekommt sein abbruch-Event
+    gesetzt; läuft er über fetch_url, trennt das auch seine Verbindung.
+
+    Rückgabe: (endgültiges Ergebnis oder None, alle fertigen Ergebnisse in
+    Schema-Reihenfolge https, http — für "letzter Status"-Auswertungen).
+    """
+    if delay is None:
+        alle: list[T] = []
+        for scheme in ("https", "http"):
+            r = versuch(scheme, threading.Event())
+            alle.append(r)
+            if endgueltig(r):
+                return r, alle
+        return None, alle
+
+    abbruch = {"https": _Abbruch(), "http": _Abbruch()}
+    f_https = submit_mit_kontext(_hedge_pool, versuch, "https", abbruch["https"])
+    try:
+        r_https = f_https.result(timeout=delay)
+    except FutureTimeout:
+        pass
+    else:
+        # https hat rechtzeitig geantwortet: klassischer Ablauf
+        if endgueltig(r_https):
+            return r_https, [r_https]
+        r_http = versuch("http", abbruch["http"])
+        return (r_http if endgueltig(r_http) else None), [r_https, r_http]
+
+    # https hängt -> http parallel starten
+    f_http = submit_mit_kontext(_hedge_pool, versuch, "http", abbruch["http"])
+    wait([f_https, f_http], return_when=FIRST_COMPLETED)
+
+    if not f_https.done():
+        r_http = f_http.result()
+        if endgueltig(r_http):
+            try:
+                r_https = f_https.result(timeout=delay)
+            except FutureTimeout:
+                abbruch["https"].set()
+                return r_http, [r_http]
+            if endgueltig(r_https):
+                return r_https, [r_https, r_http]
+            return r_http, [r_https, r_http]
+        # http nicht brauchbar -> auf https warten (Ergebnis zählt dann allein)
+
+    r_https = f_https.result()
+    if endgueltig(r_https):
+        abbruch["http"].set()
+        done = [r_https]
+        if f_http.done():
+            done.append(f_http.result())
+        return r_https, done
+    r_http = f_http.result()
+    return (r_http if endgueltig(r_http) else None), [r_https, r_http]
+
+
+def fetch_homepage(
+    domain: str,
+    user_agent: str = DEFAULT_USER_AGENT,
+    timeout: int = DEFAULT_TIMEOUT,
+    deadline: Optional[float] = None,
+) -> PageSnapshot:
+    """
+    Holt die Startseite der Domain — https bevorzugt, http als Fallback
+    (gehedged, siehe hedge_schemes), innerhalb des Zeitbudgets `deadline`.
+
+    Rückgabe bei 2xx: der Snapshot des erfolgreichen Schemas.
+    Sonst: Snapshot mit final_url=None und dem letzten Status/Fehler
+    -> die Aufrufer werten das als UNBEKANNT.
+    """
+    def _versuch(scheme: str, abbruch: threading.Event) -> PageSnapshot:
+        return fetch_url(f"{scheme}://{domain}/", user_agent=user_agent,
+                         timeout=timeout, abbruch=abbruch, cache=True, deadline=deadline)
+
+    snap, alle = hedge_schemes(_versuch, lambda s: s.ok)
+    if snap is not None:
+        return snap
+
+    failed = PageSnapshot(url=f"https://{domain}/", status=letzter_status(alle))
+    failed.error = alle[-1].error if alle else None
+    failed.budget_exceeded = any(s.budget_exceeded for s in alle)
+    failed.host_gesperrt = all(s.host_gesperrt for s in alle) if alle else False
+    return failed
+
+
+def letzter_status(snaps: list[PageSnapshot]) -> Optional[int]:
+    """Letzter tatsächlich empfangene HTTP-Status (http vor https)."""
+    for snap in reversed(snaps):
+        if snap.status is not None:
+            return snap.status
+    return None
@@ -0,0 +1,158 @@
+"""
+Redirect-Cache für den Abruf-Layer: angefragter Origin -> finaler Origin.
+
+Checker-eigen wie http_client.py. Fast jede Hotel-Website leitet
+`example.at` auf `https://www.example.at/` um — ohne Cache folgt jeder der
+sechs und mehr Abrufe einer Analyse dieser Kette aufs Neue (je Hop ein
+Round-Trip, oft eine eigene TLS-Verbindung). Hier merkt sich der Abruf-Layer
+pro Origin (Schema + Host + Port), wohin er umgeleitet wurde; spätere
+Abrufe gehen direkt dorthin. Die ursprüngliche Kette bleibt als Beleg in
+der Zeitmessung (Hops mit "cache": True).
+
+Gemerkt wird nur eine reine Origin-Umleitung — der Pfad bleibt gleich
+(`http://example.at/robots.txt` -> `https://www.example.at/robots.txt`).
+Leitet eine Seite auf einen anderen Pfad um (Startseite -> /de/), gilt das
+nur für diese URL und wird nicht verallgemeinert.
+
+Antwortet das gemerkte Ziel mit einem Fehler-Status oder leitet es auf einen
+anderen Origin weiter, ist die Umleitung veraltet: fetch_url() vergisst sie
+und fragt die ursprüngliche URL einmal neu an.
+
+Ablage: eine JSON-Datei im Verzeichnis des Validator-Caches (überlebt
+Neustarts); ist der Cache abgeschaltet, nur im Speicher.
+
+Konfiguration:
+    GEO_RADAR_REDIRECT_TTL  Sekunden, die eine Umleitung gilt (Standard 86400)
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from http_cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_MB
+
+REDIRECT_TTL = float(os.environ.get("GEO_RADAR_REDIRECT_TTL", "86400"))
+# Obergrenze gehaltener Origins (älteste fliegen zuerst)
+MAX_EINTRAEGE = 5000
+
+
+@dataclass
+class Umleitung:
+    ziel: str                                   # finaler Origin, z. B. "https://www.example.at"
+    kette: list[dict] = field(default_factory=list)  # ursprüngliche Hops: url, status
+    ablauf: float = 0.0                         # time.time()
+
+    def bestaetigt(self, status: int, final_url: str) -> bool:
+        """Trägt die Umleitung noch? Antwort 2xx/304 und am gemerkten Ziel-Origin."""
+        return (200 <= status < 300 or status == 304) and origin(final_url) == self.ziel
+
+
+def origin(url: str) -> str:
+    """Schema + Host (+ Port) einer URL, klein geschrieben."""
+    teile = urlsplit(url)
+    return f"{teile.scheme.lower()}://{teile.netloc.lower()}"
+
+
+def _pfad(url: str) -> tuple[str, str]:
+    teile = urlsplit(url)
+    return teile.path or "/", teile.query
+
+
+class RedirectCache:
+    """Origin-Umleitungen mit TTL, optional in einer JSON-Datei (thread-sicher)."""
+
+    def __init__(self, datei: Optional[str | Path] = None, ttl: float = REDIRECT_TTL,
+                 max_eintraege: int = MAX_EINTRAEGE):
+        self.datei = Path(datei) if datei is not None else None
+        self.ttl = ttl
+        self.max_eintraege = max_eintraege
+        self._lock = threading.Lock()
+        self._eintraege: dict[str, Umleitung] = self._lade()
+        self.treffer = 0
+
+    def _lade(self) -> dict[str, Umleitung]:
+        if self.datei is None:
+            return {}
+        try:
+            roh = json.loads(self.datei.read_text(encoding="utf-8"))
+            return {k: Umleitung(**v) for k, v in roh.items()}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def _speichere(self) -> None:
+        if self.datei is None:
+            return
+        try:
+            tmp = self.datei.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps({k: asdict(v) for k, v in self._eintraege.items()}),
+                           encoding="utf-8")
+            os.replace(tmp, self.datei)
+        except OSError:
+            pass  # Cache ist Beiwerk — ein Schreibfehler bricht keine Analyse
+
+    def aufloesen(self, url: str) -> tuple[str, Optional[Umleitung]]:
+        """(URL, die tatsächlich angefragt wird; angewandte Umleitung oder None)."""
+        quelle = origin(url)
+        with self._lock:
+            eintrag = self._eintraege.get(quelle)
+            if eintrag is None or eintrag.ablauf <= time.time():
+                return url, None
+            self.treffer += 1
+        teile = urlsplit(url)
+        ziel = urlsplit(eintrag.ziel)
+        return urlunsplit((ziel.scheme, ziel.netloc, teile.path, teile.query, "")), eintrag
+
+    def merke(self, url: str, final_url: str, kette: list[dict]) -> None:
+        """Nach einem Abruf mit Redirects: reine Origin-Umleitung merken."""
+        quelle, ziel = origin(url), origin(final_url)
+        if quelle == ziel or _pfad(url) != _pfad(final_url):
+            return
+        with self._lock:
+            self._eintraege.pop(quelle, None)
+            self._eintraege[quelle] = Umleitung(ziel=ziel, kette=kette,
+                                                ablauf=time.time() + self.ttl)
+            while len(self._eintraege) > self.max_eintraege:
+                del self._eintraege[next(iter(self._eintraege))]
+            self._speichere()
+
+    def vergiss(self, url: str) -> None:
+        """Umleitung hat nicht (mehr) funktioniert — beim nächsten Mal der Kette folgen."""
+        with self._lock:
+            if self._eintraege.pop(origin(url), None) is not None:
+                self._speichere()
+
+    def statistik(self) -> dict:
+        """Für den Admin-Bereich: gültige Umleitungen und ersparte Ketten."""
+        jetzt = time.time()
+        with self._lock:
+            return {
+                "umleitungen": sum(1 for e in self._eintraege.values() if e.ablauf > jetzt),
+                "treffer": self.treffer,
+            }
+
+
+_redirects: Optional[RedirectCache] = None
+_redirects_lock = threading.Lock()
+
+
+def get_redirect_cache() -> RedirectCache:
+    """Prozessweiter Redirect-Cache; persistent, solange der Validator-Cache an ist."""
+    global _redirects
+    if _redirects is None:
+        with _redirects_lock:
+            if _redirects is None:
+                datei = None
+                if DEFAULT_CACHE_MB > 0:
+                    try:
+                        Path(DEFAULT_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+                        datei = Path(DEFAULT_CACHE_DIR) / "redirects.json"
+                    except OSError:
+                        pass
+                _redirects = RedirectCache(datei)
+    return _redirects
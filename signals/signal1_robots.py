@@ -17,13 +17,20 @@ Nutzung als Bibliothek:
 """
 from __future__ import annotations
 
+import json
 import os
 import re
 import sys
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional
 
-import requests
+from circuit_breaker import host_gesperrt
+from dns_cache import domain_tot
+from http_client import (
+    ZEITBUDGET_UEBERSCHRITTEN, PageSnapshot, fetch_url, hedge_schemes, letzter_status,
+    zeitbudget_erschoepft,
+)
 
 
 # -----------------------------------------------------------------------------
@@ -55,6 +62,41 @@ KLASSE_B_BOTS = [
 ]
 
 
+def lade_bot_klassen(pfad: str | Path) -> tuple[list[str], list[str]]:
+    """
+    Liest die Bot-Klassen aus einer JSON-Datei: {"A": [...], "B": [...]}
+    (Beispiel mit weiteren KI-Agenten: signals/bots.json).
+
+    Wirft ValueError bei falschem Aufbau, leeren Namen oder einem Bot, der
+    mehrfach bzw. in beiden Klassen steht — eine kaputte Liste soll beim
+    Start auffallen, nicht still zu weniger geprüften Bots führen.
+    """
+    with open(pfad, encoding="utf-8") as f:
+        daten = json.load(f)
+    if not isinstance(daten, dict):
+        raise ValueError(f"{pfad}: erwartet ein Objekt mit den Klassen \"A\" und \"B\"")
+    klassen = []
+    gesehen: set[str] = set()
+    for klasse in ("A", "B"):
+        namen = daten.get(klasse)
+        if not isinstance(namen, list) or not all(
+                isinstance(n, str) and n.strip() for n in namen):
+            raise ValueError(f"{pfad}: Klasse {klasse} muss eine Liste von Bot-Namen sein")
+        for name in namen:
+            if name.strip().casefold() in gesehen:
+                raise ValueError(f"{pfad}: Bot {name!r} mehrfach eingetragen")
+            gesehen.add(name.strip().casefold())
+        klassen.append([n.strip() for n in namen])
+    return klassen[0], klassen[1]
+
+
+# Eigene Bot-Liste statt der obigen Vorgabe: GEO_RADAR_BOTS_DATEI=signals/bots.json
+# (dort u. a. Meta-ExternalAgent, Amazonbot, DuckAssistBot, MistralAI-User).
+# Achtung: Jeder zusätzliche Bot kann die Ampel kippen (A -> ROT, B -> GELB).
+if os.environ.get("GEO_RADAR_BOTS_DATEI"):
+    KLASSE_A_BOTS, KLASSE_B_BOTS = lade_bot_klassen(os.environ["GEO_RADAR_BOTS_DATEI"])
+
+
 # -----------------------------------------------------------------------------
 # Konfiguration mit Fallback auf Environment (.env wird von scanner.py geladen)
 # -----------------------------------------------------------------------------
@@ -92,6 +134,8 @@ class RobotsResult:
     bots: list[BotResult] = field(default_factory=list)
     overall_status: str = "UNBEKANNT"  # GRÜN | GELB | ROT | UNBEKANNT
     reason: str = ""                    # Kurzbegruendung für die Ampel
+    truncated: bool = False             # robots.txt über dem Byte-Limit, nur Anfang geprüft
+    sitemaps: list[str] = field(default_factory=list)  # Sitemap:-Zeilen (absolute URLs)
 
 
 # -----------------------------------------------------------------------------
@@ -102,42 +146,51 @@ def _fetch_robots(
     domain: str,
     user_agent: str = DEFAULT_USER_AGENT,
     timeout: int = DEFAULT_TIMEOUT,
-) -> tuple[str, str, int] | tuple[None, None, Optional[int]]:
+    deadline: Optional[float] = None,
+) -> tuple[str, str, int, bool] | tuple[None, None, Optional[int], bool]:
     """
     Holt robots.txt am finalen Host (Redirects folgen).
 
-    Rückgabe bei Erfolg (Status 200):  (final_url, text, 200)
-    Rückgabe bei 404 / anderem 4xx:    (final_url, "", status_code)
+    Rückgabe bei Erfolg (Status 200):  (final_url, text, 200, truncated)
+    Rückgabe bei 404 / anderem 4xx:    (final_url, "", status_code, False)
                                         -> "keine robots.txt" = alles erlaubt
-    Rückgabe bei Netzwerk-Fehler/5xx:  (None, None, status_code_or_None)
+    Rückgabe bei Netzwerk-Fehler/5xx:  (None, None, status_code_or_None, False)
                                         -> UNBEKANNT
-    """
-    headers = {"User-Agent": user_agent, "Accept": "text/plain, */*;q=0.1"}
-    last_status = None
 
+    truncated: Datei größer als MAX_BYTES["robots"] — ausgewertet wird der
+    Anfang ohne die angeschnittene letzte Zeile.
+    """
     # Nur 404 und 410 werden als "robots.txt existiert nicht" ausgelegt
     # (siehe HTTP-Spec: 404 = Not Found, 410 = Gone). Andere 4xx wie 401/403
     # bedeuten "Zugriff verweigert" — das kann alles sein (Bot-Blocker,
     # Rate-Limit, Zwischen-Proxy) — nicht "keine robots.txt". -> UNBEKANNT.
     ABSENT_STATUS = (404, 410)
 
-    for scheme in ("https", "http"):
-        url = f"{scheme}://{domain}/robots.txt"
-        try:
-            r = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-            last_status = r.status_code
-            if r.status_code == 200:
-                return r.url, r.text, 200
-            if r.status_code in ABSENT_STATUS:
-                # Klarer "existiert nicht" -> nach robots.txt-Spec: alles erlaubt.
-                return r.url, "", r.status_code
-            # Alles andere (401, 403, sonstiges 4xx, 5xx): unklarer Zugriff.
-            # Naechstes Schema probieren, sonst am Ende -> UNBEKANNT.
-        except requests.RequestException:
-            # Timeout, DNS-Fehler, Connection-Reset -> nächstes Schema probieren
-            continue
-
-    return None, None, last_status
+    def _versuch(scheme: str, abbruch) -> PageSnapshot:
+        # Timeout, DNS-Fehler, Connection-Reset landen im Snapshot (status None)
+        return fetch_url(f"{scheme}://{domain}/robots.txt", user_agent=user_agent,
+                         timeout=timeout, accept="text/plain, */*;q=0.1",
+                         abbruch=abbruch, cache=True, art="robots", deadline=deadline)
+
+    def _endgueltig(snap: PageSnapshot) -> bool:
+        # Alles andere (401, 403, sonstiges 4xx, 5xx): unklarer Zugriff.
+        # Anderes Schema probieren, sonst am Ende -> UNBEKANNT.
+        return snap.final_url is not None and (
+            snap.status == 200 or snap.status in ABSENT_STATUS)
+
+    # https bevorzugt, http als Fallback — gehedged (http startet, wenn
+    # https nicht zügig antwortet; siehe http_client.hedge_schemes).
+    snap, alle = hedge_schemes(_versuch, _endgueltig)
+    if snap is not None:
+        if snap.status == 200:
+            text = snap.text
+            if snap.truncated:
+                text = text.rsplit("\n", 1)[0]
+            return snap.final_url, text, 200, snap.truncated
+        # Klarer "existiert nicht" -> nach robots.txt-Spec: alles erlaubt.
+        return snap.final_url, "", snap.status, False
+
+    return None, None, letzter_status(alle), False
 
 
 # -----------------------------------------------------------------------------
@@ -147,7 +200,10 @@ def _fetch_robots(
 _DIRECTIVE_RE = re.compile(r"^([A-Za-z][A-Za-z0-9\-]*)\s*:\s*(.*)$")
 
 
-def _parse_groups(text: str) -> list[tuple[list[str], list[tuple[str, str, str]]]]:
+def _parse_groups(
+    text: str,
+    sitemaps: Optional[list[str]] = None,
+) -> list[tuple[list[str], list[tuple[str, str, str]]]]:
     """
     Zerlegt robots.txt in User-agent-Gruppen.
 
@@ -160,6 +216,9 @@ def _parse_groups(text: str) -> list[tuple[list[str], list[tuple[str, str, str]]
         Liste von (agents, rules), wobei
           agents = ["GPTBot", "ChatGPT-User", ...]  (Namen wie in robots.txt)
           rules  = [(directive_lowercase, value, original_line), ...]
+
+    sitemaps: wird eine Liste übergeben, landen dort die `Sitemap:`-URLs
+    (gruppenunabhängig, nur absolute http(s)-URLs, ohne Duplikate).
     """
     groups: list[tuple[list[str], list[tuple[str, str, str]]]] = []
     current_agents: list[str] = []
@@ -194,8 +253,13 @@ def _parse_groups(text: str) -> list[tuple[list[str], list[tuple[str, str, str]]
             if current_agents:
                 current_rules.append((directive, value, raw.strip()))
                 just_saw_rule = True
-        # Andere Direktiven (Sitemap, Crawl-delay, Host) sind für diese
-        # Prüfung irrelevant und werden ignoriert.
+        elif directive == "sitemap":
+            # Gilt für die ganze Datei, nicht für die Gruppe
+            if (sitemaps is not None and value.lower().startswith(("http://", "https://"))
+                    and value not in sitemaps):
+                sitemaps.append(value)
+        # Andere Direktiven (Crawl-delay, Host) sind für diese Prüfung
+        # irrelevant und werden ignoriert.
 
     # Letzte Gruppe abschließen
     if current_agents:
@@ -208,24 +272,35 @@ def _parse_groups(text: str) -> list[tuple[list[str], list[tuple[str, str, str]]
 # 3. Für einen Bot die spezifischste passende Gruppe finden
 # -----------------------------------------------------------------------------
 
-def _find_group_for_bot(
-    bot_name: str,
+def _gruppen_index(
     groups: list[tuple[list[str], list[tuple[str, str, str]]]],
-) -> tuple[list[str], list[tuple[str, str, str]], str] | None:
+) -> dict[str, tuple[list[str], list[tuple[str, str, str]], str]]:
     """
-    Case-insensitive: sucht eine Gruppe, in der der Bot-Name exakt gelistet ist.
-    Rückgabe (agents, rules, matched_agent_line) oder None.
+    Einmal je robots.txt: User-agent (casefold) -> (agents, rules, matched_agent_line).
+
+    Danach kostet jeder Bot nur noch einen Dict-Zugriff, egal wie viele Bots
+    geprüft werden und wie viele Agents die Datei listet.
 
     Gemäß robots.txt-Regel schlägt eine eigene Gruppe die *-Gruppe.
-    Wenn ein Bot in mehreren Gruppen vorkommt (selten), nehmen wir die erste —
+    Wenn ein Agent in mehreren Gruppen vorkommt (selten), zählt die erste —
     das ist im Regelfall dieselbe wie "die spezifischste".
     """
-    bot_lower = bot_name.lower()
+    index: dict[str, tuple[list[str], list[tuple[str, str, str]], str]] = {}
     for agents, rules in groups:
         for a in agents:
-            if a.lower() == bot_lower:
-                return agents, rules, a
-    return None
+            index.setdefault(a.strip().casefold(), (agents, rules, a))
+    return index
+
+
+def _find_group_for_bot(
+    bot_name: str,
+    index: dict[str, tuple[list[str], list[tuple[str, str, str]], str]],
+) -> tuple[list[str], list[tuple[str, str, str]], str] | None:
+    """
+    Case-insensitive: die Gruppe, in der der Bot-Name exakt gelistet ist.
+    Rückgabe (agents, rules, matched_agent_line) oder None.
+    """
+    return index.get(bot_name.casefold())
 
 
 # -----------------------------------------------------------------------------
@@ -323,15 +398,13 @@ def evaluate_robots_text(
         )
         return result
 
-    # Text parsen
-    groups = _parse_groups(text)
+    # Text parsen (Sitemap-Zeilen nebenbei für die Zusatz-Checks)
+    groups = _parse_groups(text, result.sitemaps)
+    index = _gruppen_index(groups)
 
     # *-Gruppe merken (für Fallback und Global-Block-Prüfung)
-    star_group_rules: list[tuple[str, str, str]] | None = None
-    for agents, rules in groups:
-        if any(a.strip() == "*" for a in agents):
-            star_group_rules = rules
-            break
+    star = index.get("*")
+    star_group_rules = star[1] if star is not None else None
 
     # Global-Block via User-agent: *
     if star_group_rules is not None:
@@ -342,7 +415,7 @@ def evaluate_robots_text(
 
     # Pro Bot prüfen
     def _check_bot(name: str, klasse: str) -> None:
-        found = _find_group_for_bot(name, groups)
+        found = _find_group_for_bot(name, index)
         if found is not None:
             _, rules, matched = found
             allowed, evidence = _is_root_allowed(rules)
@@ -397,11 +470,15 @@ def check_robots(
     domain: str,
     user_agent: str = DEFAULT_USER_AGENT,
     timeout: int = DEFAULT_TIMEOUT,
+    deadline: Optional[float] = None,
 ) -> RobotsResult:
     """
     Prüft eine Domain gegen die in CLAUDE.md definierten Klasse-A- und -B-Bots.
     Holt robots.txt übers Netz und delegiert die Auswertung an
     evaluate_robots_text(). Interpretiert nichts — nur Fakten.
+
+    deadline: Ende des Zeitbudgets (time.monotonic()) — was bis dahin nicht
+    geladen ist, wird UNBEKANNT ("Zeitbudget überschritten").
     """
     # Domain saeubern: Schema und trailing slash weg
     dom = domain.strip()
@@ -411,7 +488,32 @@ def check_robots(
         dom = dom[7:]
     dom = dom.strip("/")
 
-    final_url, text, status = _fetch_robots(dom, user_agent=user_agent, timeout=timeout)
+    # Domain laut DNS-Cache tot -> sofort UNBEKANNT, kein weiterer Versuch
+    dns_fehler = domain_tot(dom)
+    if dns_fehler:
+        result = RobotsResult(domain=dom)
+        result.fetch_error = f"Domain nicht auflösbar (DNS: {dns_fehler})"
+        result.overall_status = "UNBEKANNT"
+        result.reason = "Domain nicht erreichbar"
+        return result
+    sperre = host_gesperrt(dom)
+    if sperre:
+        result = RobotsResult(domain=dom)
+        result.fetch_error = sperre
+        result.overall_status = "UNBEKANNT"
+        result.reason = "Domain nicht erreichbar"
+        return result
+
+    final_url, text, status, truncated = _fetch_robots(dom, user_agent=user_agent,
+                                                       timeout=timeout, deadline=deadline)
+
+    # Zeitbudget aufgebraucht, bevor robots.txt da war -> UNBEKANNT
+    if final_url is None and zeitbudget_erschoepft(deadline):
+        result = RobotsResult(domain=dom)
+        result.fetch_error = f"robots.txt nicht rechtzeitig geladen ({ZEITBUDGET_UEBERSCHRITTEN})"
+        result.overall_status = "UNBEKANNT"
+        result.reason = ZEITBUDGET_UEBERSCHRITTEN
+        return result
 
     # Netzwerk-Fehler oder 5xx -> UNBEKANNT (Grundregel Nr. 1)
     if final_url is None:
@@ -425,7 +527,9 @@ def check_robots(
         result.reason = "robots.txt konnte nicht geladen werden"
         return result
 
-    return evaluate_robots_text(text or "", status or 200, dom, final_url)
+    result = evaluate_robots_text(text or "", status or 200, dom, final_url)
+    result.truncated = truncated
+    return result
 
 
 # -----------------------------------------------------------------------------
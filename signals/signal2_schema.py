@@ -23,11 +23,22 @@ from __future__ import annotations
 import json
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
-import requests
-from bs4 import BeautifulSoup
+try:
+    import orjson                   # optional, siehe JSON_BACKEND
+except ImportError:
+    orjson = None
+
+from circuit_breaker import host_gesperrt
+from dns_cache import domain_tot
+from dokument import ParsedDocument
+from http_client import (
+    ZEITBUDGET_UEBERSCHRITTEN, PageSnapshot, fetch_homepage, fetch_url, submit_mit_kontext,
+)
 
 
 # -----------------------------------------------------------------------------
@@ -75,6 +86,23 @@ DEFAULT_USER_AGENT = os.environ.get(
 )
 DEFAULT_TIMEOUT = int(os.environ.get("GEO_RADAR_HTTP_TIMEOUT", "15"))
 
+# JSON-Backend für die JSON-LD-Blöcke: orjson (in C, mehrfach schneller),
+# wenn installiert, sonst die Standardbibliothek. GEO_RADAR_JSON_BACKEND=json
+# erzwingt die Standardbibliothek.
+JSON_BACKEND = os.environ.get("GEO_RADAR_JSON_BACKEND", "orjson" if orjson else "json")
+
+# Obergrenzen für JSON-LD (UTF-8-Bytes): je Block und für alle Blöcke einer
+# Seite zusammen. Manche Hotel-Websites betten mehrere MB Produkt- oder
+# Event-Graphen ein — was darüber liegt, wird nicht geparst, sondern als
+# Parse-Fehler "Block zu groß" ausgewiesen.
+MAX_LD_BLOCK_BYTES = int(os.environ.get("GEO_RADAR_MAX_LD_BLOCK_KB", "1024")) * 1024
+MAX_LD_SEITE_BYTES = int(os.environ.get("GEO_RADAR_MAX_LD_SEITE_KB", "2048")) * 1024
+
+# Obergrenzen beim Einsammeln der Entitäten (_build_entity_index): tiefer
+# verschachtelte Teile und Entitäten über der Anzahl bleiben ungelesen.
+MAX_LD_TIEFE = int(os.environ.get("GEO_RADAR_MAX_LD_TIEFE", "64"))
+MAX_LD_ENTITAETEN = int(os.environ.get("GEO_RADAR_MAX_LD_ENTITAETEN", "10000"))
+
 
 # -----------------------------------------------------------------------------
 # Datentypen
@@ -120,77 +148,110 @@ class SchemaResult:
     faqpage_quelle: Optional[str] = None
     overall_status: str = "UNBEKANNT"  # GRÜN | GELB | ROT | UNBEKANNT
     reason: str = ""
+    truncated: bool = False            # Startseite über dem Byte-Limit, nur Anfang geprüft
+    entities_truncated: bool = False   # Tiefe/Anzahl der Entitäten über der Grenze
 
 
-# -----------------------------------------------------------------------------
-# HTTP-Fetch der Startseite (Redirects folgen, HTTPS bevorzugt)
-# -----------------------------------------------------------------------------
-
-def _fetch_html(
-    domain: str,
-    user_agent: str = DEFAULT_USER_AGENT,
-    timeout: int = DEFAULT_TIMEOUT,
-) -> tuple[str, str, int] | tuple[None, None, Optional[int]]:
+@dataclass
+class EntityIndex:
     """
-    Holt die Startseite der Domain.
-
-    Rückgabe bei 2xx:      (final_url, html, status)
-    Rückgabe sonst:        (None, None, letzter_status_oder_None) -> UNBEKANNT
+    Alle Entitäten (dicts mit @type) der JSON-LD-Blöcke einer Seite, einmal
+    eingesammelt: in Dokument-Reihenfolge, nach normalisiertem Typ und nach
+    @id. Die Prüfungen lesen nur noch hier, @type wird je Entität einmal
+    normalisiert.
     """
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "de-AT,de;q=0.9,en;q=0.7",
-    }
-    last_status = None
-
-    for scheme in ("https", "http"):
-        url = f"{scheme}://{domain}/"
-        try:
-            r = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-            last_status = r.status_code
-            if 200 <= r.status_code < 300:
-                return r.url, r.text, r.status_code
-            # 4xx/5xx: versuche das andere Schema; ansonsten -> UNBEKANNT
-        except requests.RequestException:
-            continue
-
-    return None, None, last_status
+    entities: list[dict] = field(default_factory=list)
+    by_type: dict[str, list[dict]] = field(default_factory=dict)   # Typ -> Entitäten
+    by_id: dict[str, dict] = field(default_factory=dict)           # @id -> erste Definition
+    truncated: bool = False                                        # MAX_LD_TIEFE/-ENTITAETEN
+    _types: dict[int, list[str]] = field(default_factory=dict, repr=False)
+    _position: dict[int, int] = field(default_factory=dict, repr=False)
+
+    def types_of(self, entity: dict) -> list[str]:
+        """Normalisierte @type-Werte einer Entität aus dem Index."""
+        return self._types[id(entity)]
+
+    def with_types(self, types: set[str]) -> list[dict]:
+        """Entitäten mit mindestens einem der Typen, in Dokument-Reihenfolge."""
+        treffer = {id(e): e for t in types for e in self.by_type.get(t, ())}
+        return sorted(treffer.values(), key=lambda e: self._position[id(e)])
+
+    def resolve(self, value: Any) -> Any:
+        """Reine @id-Referenz ({"@id": "#addr"}) -> die Entität dazu, sonst value."""
+        if isinstance(value, list):
+            return [self.resolve(v) for v in value]
+        if _is_reference(value):
+            return self.by_id.get(value["@id"], value)
+        return value
+
+    def resolved(self, entity: dict) -> dict:
+        """Kopie der Entität mit aufgelösten Referenzen (erste Ebene)."""
+        return {k: self.resolve(v) for k, v in entity.items()}
 
 
 # -----------------------------------------------------------------------------
 # JSON-LD-Blöcke aus HTML ziehen und parsen
 # -----------------------------------------------------------------------------
 
-def _extract_ld_blocks(soup: BeautifulSoup) -> list[tuple[Optional[Any], Optional[str]]]:
+_ZU_GROSS = "Block zu groß"
+
+
+def _lade_json(raw: str, roh: bytes) -> Any:
     """
-    Zieht alle <script type="application/ld+json">-Blöcke.
+    Parst einen Block mit dem JSON_BACKEND. Was orjson ablehnt (Syntaxfehler,
+    aber auch NaN/Infinity oder einzelne Surrogate, die json annimmt), geht an
+    json — Ergebnis und Fehlermeldung hängen so nicht vom Backend ab.
+    """
+    if JSON_BACKEND == "orjson" and orjson is not None:
+        try:
+            return orjson.loads(roh)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
 
-    Rückgabe: Liste von (parsed_json_oder_None, error_oder_None).
-    Ein leerer Block wird übersprungen.
+
+def _extract_ld_blocks(dokument: ParsedDocument) -> list[tuple[Optional[Any], Optional[str]]]:
     """
-    def _has_ld_type(v):
-        return v is not None and "application/ld+json" in v.lower()
+    Parst alle <script type="application/ld+json">-Blöcke des Dokuments.
 
+    Rückgabe: Liste von (parsed_json_oder_None, error_oder_None).
+    Ein leerer Block wird übersprungen (schon in dokument.ld_json).
+    Blöcke über MAX_LD_BLOCK_BYTES bzw. jenseits von MAX_LD_SEITE_BYTES
+    (Summe der Seite) werden nicht geparst: Fehler "Block zu groß".
+    """
     blocks: list[tuple[Optional[Any], Optional[str]]] = []
-    for script in soup.find_all("script", type=_has_ld_type):
-        raw = script.string
-        if raw is None:
-            raw = script.get_text()
-        raw = (raw or "").strip()
-        if not raw:
+    budget = MAX_LD_SEITE_BYTES
+    for raw in dokument.ld_json:
+        roh = raw.encode("utf-8", errors="surrogatepass")
+        if len(roh) > MAX_LD_BLOCK_BYTES:
+            blocks.append((None, f"{_ZU_GROSS}: {len(roh) // 1024} KB "
+                                 f"(Grenze {MAX_LD_BLOCK_BYTES // 1024} KB je Block)"))
+            continue
+        if len(roh) > budget:
+            blocks.append((None, f"{_ZU_GROSS}: {len(roh) // 1024} KB "
+                                 f"(Grenze {MAX_LD_SEITE_BYTES // 1024} KB je Seite erreicht)"))
             continue
+        budget -= len(roh)
         try:
-            data = json.loads(raw)
-            blocks.append((data, None))
+            blocks.append((_lade_json(raw, roh), None))
         except json.JSONDecodeError as exc:
             blocks.append((None, f"{exc.__class__.__name__}: {exc.msg} (line {exc.lineno})"))
+        except RecursionError:
+            blocks.append((None, "RecursionError: Block zu tief verschachtelt"))
     return blocks
 
 
-def _flatten_entities(data: Any, out: Optional[list[dict]] = None) -> list[dict]:
+def _is_reference(value: Any) -> bool:
+    """{"@id": ...} ohne eigene Properties (höchstens @type) — ein Verweis."""
+    return (isinstance(value, dict) and isinstance(value.get("@id"), str)
+            and value.keys() <= {"@id", "@type"})
+
+
+def _build_entity_index(daten: list[Any]) -> EntityIndex:
     """
-    Sammelt rekursiv alle dicts mit @type-Feld.
+    Sammelt in EINEM iterativen Durchgang alle dicts mit @type-Feld aus den
+    geparsten Blöcken, in derselben Reihenfolge wie eine rekursive
+    Tiefensuche.
 
     Deckt ab:
     - Top-level Objekt oder Array
@@ -198,22 +259,38 @@ def _flatten_entities(data: Any, out: Optional[list[dict]] = None) -> list[dict]
     - Verschachtelte Entitäten in Properties (z. B. WebPage.mainEntity = Hotel)
 
     PostalAddress und GeoCoordinates werden als eigene Entitäten mitgesammelt —
-    das ist OK, weil unsere LODGING_TYPES-Filter sie ignoriert.
+    das ist OK, weil unsere LODGING_TYPES-Filter sie ignoriert. Jedes dict
+    mit @id und eigenen Properties landet in by_id (die erste Definition
+    gewinnt), damit Verweise quer durch den @graph auflösbar sind.
     """
-    if out is None:
-        out = []
-    if isinstance(data, list):
-        for item in data:
-            _flatten_entities(item, out)
-    elif isinstance(data, dict):
-        if "@type" in data:
-            out.append(data)
-        for k, v in data.items():
-            if k == "@type":
-                continue
-            if isinstance(v, (dict, list)):
-                _flatten_entities(v, out)
-    return out
+    index = EntityIndex()
+    stapel: list[tuple[Any, int]] = [(d, 0) for d in reversed(daten)]
+    while stapel:
+        knoten, tiefe = stapel.pop()
+        if tiefe > MAX_LD_TIEFE:
+            index.truncated = True
+            continue
+        if isinstance(knoten, dict):
+            if "@type" in knoten:
+                if len(index.entities) >= MAX_LD_ENTITAETEN:
+                    index.truncated = True
+                    break
+                types = _type_of(knoten)
+                index._types[id(knoten)] = types
+                index._position[id(knoten)] = len(index.entities)
+                index.entities.append(knoten)
+                for t in dict.fromkeys(types):
+                    index.by_type.setdefault(t, []).append(knoten)
+            kennung = knoten.get("@id")
+            if isinstance(kennung, str) and not _is_reference(knoten):
+                index.by_id.setdefault(kennung, knoten)
+            kinder = [v for k, v in knoten.items() if k != "@type" and isinstance(v, (dict, list))]
+        elif isinstance(knoten, list):
+            kinder = [v for v in knoten if isinstance(v, (dict, list))]
+        else:
+            continue
+        stapel.extend((kind, tiefe + 1) for kind in reversed(kinder))
+    return index
 
 
 def _normalize_type(t: Any) -> str:
@@ -239,10 +316,6 @@ def _type_of(entity: dict) -> list[str]:
     return []
 
 
-def _is_lodging(entity: dict) -> bool:
-    return any(t in LODGING_TYPES for t in _type_of(entity))
-
-
 # -----------------------------------------------------------------------------
 # Kernfeld-Prüfungen (jeweils klein und einzeln testbar)
 # -----------------------------------------------------------------------------
@@ -397,15 +470,21 @@ def _run_field_checks(entity: dict) -> tuple[list[FieldCheck], list[FieldCheck]]
 # -----------------------------------------------------------------------------
 
 def evaluate_html(
-    html: str,
+    html: str | bytes,
     http_status: int = 200,
     domain: str = "",
     fetched_url: Optional[str] = None,
     faqpage_extern: Optional[str] = None,
+    encoding: Optional[str] = None,
+    dokument: Optional[ParsedDocument] = None,
 ) -> SchemaResult:
     """
-    Wertet HTML-Text aus. Wird sowohl von check_schema() nach dem Fetch als auch
-    von Tests direkt aufgerufen.
+    Wertet HTML aus. Wird sowohl von check_schema() nach dem Fetch als auch
+    von Tests direkt aufgerufen. html als str oder als Rohbytes mit dem
+    encoding des Abruf-Layers (dann dekodiert lxml selbst).
+
+    dokument: bereits geparstes HTML (PageSnapshot.dokument) — dann wird
+    nicht erneut geparst und html nicht mehr gelesen.
 
     faqpage_extern: Pfad einer FAQ-Unterseite, auf der bereits gültiges
     FAQPage-Markup nachgewiesen wurde (Glocknerhof-Fix: FAQPage-Markup
@@ -421,18 +500,19 @@ def evaluate_html(
         result.reason = f"Seite nicht abrufbar (HTTP {http_status})"
         return result
 
-    soup = BeautifulSoup(html, "lxml")
-    blocks = _extract_ld_blocks(soup)
+    if dokument is None:
+        dokument = ParsedDocument(html, encoding)
+    blocks = _extract_ld_blocks(dokument)
     result.n_blocks = len(blocks)
 
-    parsed_entities: list[dict] = []
+    daten: list[Any] = []
     for data, err in blocks:
         if err is not None:
             result.n_invalid += 1
             result.parse_errors.append(err)
         else:
             result.n_parsed += 1
-            parsed_entities.extend(_flatten_entities(data))
+            daten.append(data)
 
     # kein Markup -> ROT
     if result.n_blocks == 0:
@@ -443,23 +523,27 @@ def evaluate_html(
     # alle Blöcke unparsbar -> UNBEKANNT (Ehrlichkeitsregel)
     if result.n_parsed == 0:
         result.overall_status = "UNBEKANNT"
-        result.reason = (
-            f"alle {result.n_blocks} JSON-LD-Blöcke unparsbar — "
-            "vorhanden, aber technisch defekt"
-        )
+        if all(err.startswith(_ZU_GROSS) for err in result.parse_errors):
+            result.reason = (
+                f"alle {result.n_blocks} JSON-LD-Blöcke zu groß für die Prüfung — "
+                "vorhanden, aber nicht ausgewertet"
+            )
+        else:
+            result.reason = (
+                f"alle {result.n_blocks} JSON-LD-Blöcke unparsbar — "
+                "vorhanden, aber technisch defekt"
+            )
         return result
 
-    # Alle @type-Werte sammeln (dedup, Reihenfolge beibehalten)
-    seen_types: list[str] = []
-    for e in parsed_entities:
-        for t in _type_of(e):
-            if t not in seen_types:
-                seen_types.append(t)
+    index = _build_entity_index(daten)
+    result.entities_truncated = index.truncated
+    # Alle @type-Werte (dedup, Reihenfolge des ersten Auftretens)
+    seen_types = list(index.by_type)
     result.all_types = seen_types
 
     # Lodging-Entität suchen
-    lodging_entities = [e for e in parsed_entities if _is_lodging(e)]
-    result.has_faqpage = any("FAQPage" in _type_of(e) for e in parsed_entities)
+    lodging_entities = index.with_types(LODGING_TYPES)
+    result.has_faqpage = "FAQPage" in index.by_type
     if not result.has_faqpage and faqpage_extern:
         result.has_faqpage = True
         result.faqpage_quelle = faqpage_extern
@@ -478,12 +562,14 @@ def evaluate_html(
     def _score(e: dict) -> int:
         return sum(1 for f in CORE_FIELDS if e.get(f))
     lodging = max(lodging_entities, key=_score)
-    lodging_types = _type_of(lodging)
+    lodging_types = index.types_of(lodging)
     lodging_type_name = next(
         (t for t in lodging_types if t in LODGING_TYPES),
         lodging_types[0] if lodging_types else "?",
     )
 
+    # Verweise wie "address": {"@id": "#addr"} zeigen auf die Definition
+    lodging = index.resolved(lodging)
     core_checks, empf_checks = _run_field_checks(lodging)
     has_sa, sa_count, sa_evidence = _check_sameAs(lodging)
     result.lodging = LodgingCheck(
@@ -542,6 +628,8 @@ def evaluate_html(
 _FAQ_LINK_SCHLUESSEL = ("faq", "fragen", "wissenswert")
 _FAQ_STANDARD_PFADE = ("/faq", "/faqs", "/haeufige-fragen", "/fragen")
 _MAX_FAQ_UNTERSEITEN = 3
+# Höchstens so viele FAQ-Kandidaten gleichzeitig (alle auf derselben Domain).
+_FAQ_PARALLEL_PRO_HOST = 2
 
 
 def _gleiche_domain(netloc: str, dom: str) -> bool:
@@ -557,12 +645,15 @@ def _gleiche_domain(netloc: str, dom: str) -> bool:
     return n == d or n.endswith("." + d)
 
 
-def finde_faq_kandidaten(html: str, basis_url: str, dom: str) -> list[str]:
+def finde_faq_kandidaten(html: str | bytes, basis_url: str, dom: str,
+                         encoding: Optional[str] = None,
+                         dokument: Optional[ParsedDocument] = None) -> list[str]:
     """
     Sammelt FAQ-Kandidaten-URLs aus dem Startseiten-HTML: Links, deren
     href ODER Ankertext ein FAQ-Schlüsselwort enthält, plus die
     Standard-Pfade. Nur gleiche Domain, dedupliziert, Reihenfolge:
     echte Links zuerst (die treffen fast immer), Standard-Pfade danach.
+    dokument: bereits geparstes HTML wie in evaluate_html().
     """
     from urllib.parse import urljoin, urlparse
 
@@ -581,10 +672,9 @@ def finde_faq_kandidaten(html: str, basis_url: str, dom: str) -> list[str]:
             kandidaten.append(url)
 
     try:
-        soup = BeautifulSoup(html, "lxml")
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            text = a.get_text(" ", strip=True)
+        if dokument is None:
+            dokument = ParsedDocument(html, encoding)
+        for href, text in dokument.anker:
             blob = (href + " " + text).lower()
             if any(k in blob for k in _FAQ_LINK_SCHLUESSEL):
                 _nimm(urljoin(basis_url, href))
@@ -597,54 +687,107 @@ def finde_faq_kandidaten(html: str, basis_url: str, dom: str) -> list[str]:
     return kandidaten[:_MAX_FAQ_UNTERSEITEN]
 
 
-def hat_faqpage_markup(html: str) -> bool:
+def hat_faqpage_markup(html: str | bytes, encoding: Optional[str] = None) -> bool:
     """Prüft ein HTML NUR auf gültiges FAQPage-JSON-LD (deterministisch)."""
     try:
-        soup = BeautifulSoup(html, "lxml")
+        blocks = _extract_ld_blocks(ParsedDocument(html, encoding))
     except Exception:
         return False
-    for data, err in _extract_ld_blocks(soup):
-        if err is not None:
-            continue
-        if any("FAQPage" in _type_of(e) for e in _flatten_entities(data)):
-            return True
-    return False
+    index = _build_entity_index([data for data, err in blocks if err is None])
+    return "FAQPage" in index.by_type
+
+
+# Grund, wenn die Host-Sicherung (circuit_breaker.py) einen Kandidaten ausließ
+_HOST_GESPERRT = "Host gesperrt"
 
 
 def _pruefe_faq_unterseiten(
     kandidaten: list[str], dom: str,
     user_agent: str, timeout: int,
-) -> tuple[Optional[str], int]:
+    deadline: Optional[float] = None,
+) -> tuple[Optional[str], int, Optional[str]]:
     """
     Ruft die Kandidaten-URLs ab und sucht FAQPage-Markup. Rückgabe:
-    (Pfad_der_Fundstelle_oder_None, Anzahl_geprüfter_Seiten).
+    (Pfad_der_Fundstelle_oder_None, Anzahl_geprüfter_Seiten, offen).
+    offen: warum mindestens ein Kandidat gar nicht geprüft wurde
+    (Zeitbudget überschritten, Host gesperrt) — "keine FAQPage" ist dann
+    nicht belegt. None = alle Kandidaten geprüft.
     Weiterleitungen auf fremde Domains werden verworfen (Domain-Riegel).
+
+    Die Kandidaten laufen parallel, aber höchstens _FAQ_PARALLEL_PRO_HOST
+    gleichzeitig (alle liegen auf derselben Domain — Höflichkeitsgrenze).
+    Die Reihenfolge bleibt maßgeblich: gewinnt ein späterer Kandidat, wird
+    trotzdem auf die früheren gewartet. Sobald Kandidat i trifft, werden
+    alle Kandidaten nach i abgebrochen (noch nicht gestartete gar nicht
+    erst geladen, laufende ohne Body/Parse).
     """
     from urllib.parse import urlparse
-    import time as _time
-
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "de-AT,de;q=0.9,en;q=0.7",
-    }
-    geprueft = 0
-    for i, url in enumerate(kandidaten):
-        if i > 0:
-            _time.sleep(0.3)  # höflich zwischen Requests
-        try:
-            r = requests.get(url, headers=headers, timeout=timeout,
-                             allow_redirects=True)
-        except requests.RequestException:
-            continue
-        if not (200 <= r.status_code < 300):
-            continue
-        if not _gleiche_domain(urlparse(r.url).netloc, dom):
-            continue
-        geprueft += 1
-        if hat_faqpage_markup(r.text):
-            return urlparse(r.url).path or "/", geprueft
-    return None, geprueft
+
+    abbruch = [threading.Event() for _ in kandidaten]
+
+    def _pruefe(i: int, url: str) -> tuple[bool, Optional[str], Optional[str]]:
+        """(wurde geprüft, Fundstelle oder None, Grund fürs Auslassen) für Kandidat i."""
+        if abbruch[i].is_set():
+            return False, None, None
+        snap = fetch_url(url, user_agent=user_agent, timeout=timeout,
+                         abbruch=abbruch[i], deadline=deadline)
+        if snap.budget_exceeded:
+            return False, None, ZEITBUDGET_UEBERSCHRITTEN
+        if snap.host_gesperrt:
+            return False, None, _HOST_GESPERRT
+        if not snap.ok:
+            return False, None, None
+        if not _gleiche_domain(urlparse(snap.final_url).netloc, dom):
+            return False, None, None
+        if abbruch[i].is_set():
+            return False, None, None
+        if hat_faqpage_markup(snap.body, snap.encoding):
+            for spaeter in abbruch[i + 1:]:
+                spaeter.set()
+            return True, urlparse(snap.final_url).path or "/", None
+        return True, None, None
+
+    pool = ThreadPoolExecutor(max_workers=_FAQ_PARALLEL_PRO_HOST,
+                              thread_name_prefix="geo-faq")
+    try:
+        futures = [submit_mit_kontext(pool, _pruefe, i, url) for i, url in enumerate(kandidaten)]
+        geprueft, offen = 0, None
+        for future in futures:           # Präferenz-Reihenfolge
+            wurde_geprueft, quelle, ausgelassen = future.result()
+            geprueft += wurde_geprueft
+            offen = offen or ausgelassen
+            if quelle:
+                return quelle, geprueft, None
+        return None, geprueft, offen
+    finally:
+        # Nicht auf abgebrochene Nachzügler warten
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _faq_nicht_abschliessend_geprueft(result: SchemaResult,
+                                     grund: str = ZEITBUDGET_UEBERSCHRITTEN) -> None:
+    """
+    Nicht alle FAQ-Unterseiten wurden geprüft (grund: Zeitbudget, gesperrter
+    Host). Fehlt sonst nichts, hängt die Ampel allein an der FAQPage ->
+    UNBEKANNT. Fehlt mehr, bleibt GELB — aber ohne die unbelegte Behauptung
+    "keine FAQPage".
+    """
+    nur_faq_offen = (
+        result.lodging is not None
+        and all(f.present for f in result.lodging.fields)
+        and result.lodging.has_sameAs
+    )
+    if nur_faq_offen:
+        result.overall_status = "UNBEKANNT"
+        result.reason = (
+            f"{grund} — FAQ-Unterseiten nicht vollständig geprüft "
+            f"(Lodging-Entität ({result.lodging.type_name}) sonst vollständig)"
+        )
+    else:
+        result.reason = result.reason.replace(
+            "keine FAQPage",
+            f"FAQPage nicht abschließend geprüft ({grund})",
+        )
 
 
 # -----------------------------------------------------------------------------
@@ -655,8 +798,17 @@ def check_schema(
     domain: str,
     user_agent: str = DEFAULT_USER_AGENT,
     timeout: int = DEFAULT_TIMEOUT,
+    snapshot: Optional[PageSnapshot] = None,
+    deadline: Optional[float] = None,
 ) -> SchemaResult:
-    """Prüft eine Domain auf Schema.org-JSON-LD. Interpretiert nichts — nur Fakten."""
+    """
+    Prüft eine Domain auf Schema.org-JSON-LD. Interpretiert nichts — nur Fakten.
+
+    snapshot: bereits geholte Startseite (fetch_homepage) — dann wird nicht
+    erneut geladen. Ohne snapshot holt check_schema() die Seite selbst.
+    deadline: Ende des Zeitbudgets (time.monotonic()). Reicht es nicht für
+    die FAQ-Unterseiten, wird "keine FAQPage" nicht behauptet.
+    """
     dom = domain.strip()
     if dom.startswith("https://"):
         dom = dom[8:]
@@ -664,9 +816,35 @@ def check_schema(
         dom = dom[7:]
     dom = dom.strip("/")
 
-    final_url, html, status = _fetch_html(dom, user_agent=user_agent, timeout=timeout)
+    # Domain laut DNS-Cache tot -> sofort UNBEKANNT, kein weiterer Versuch
+    dns_fehler = domain_tot(dom)
+    if dns_fehler:
+        result = SchemaResult(domain=dom)
+        result.fetch_error = f"Domain nicht auflösbar (DNS: {dns_fehler})"
+        result.overall_status = "UNBEKANNT"
+        result.reason = "Domain nicht erreichbar"
+        return result
+    sperre = host_gesperrt(dom)
+    if sperre:
+        result = SchemaResult(domain=dom)
+        result.fetch_error = sperre
+        result.overall_status = "UNBEKANNT"
+        result.reason = "Domain nicht erreichbar"
+        return result
+
+    if snapshot is None:
+        snapshot = fetch_homepage(dom, user_agent=user_agent, timeout=timeout,
+                                  deadline=deadline)
+    final_url, status = snapshot.final_url, snapshot.status
+
+    if not snapshot.ok and snapshot.budget_exceeded:
+        result = SchemaResult(domain=dom, fetched_status=status)
+        result.fetch_error = f"Startseite nicht rechtzeitig geladen ({ZEITBUDGET_UEBERSCHRITTEN})"
+        result.overall_status = "UNBEKANNT"
+        result.reason = ZEITBUDGET_UEBERSCHRITTEN
+        return result
 
-    if final_url is None:
+    if not snapshot.ok:
         result = SchemaResult(domain=dom, fetched_status=status)
         result.fetch_error = (
             "Startseite nicht abrufbar (Timeout/DNS/Connection-Fehler"
@@ -677,20 +855,26 @@ def check_schema(
         result.reason = "HTML konnte nicht geladen werden"
         return result
 
-    result = evaluate_html(html or "", status or 200, dom, final_url)
+    html, encoding, dokument = snapshot.body, snapshot.encoding, snapshot.dokument
+    result = evaluate_html(html, status or 200, dom, final_url, encoding=encoding,
+                           dokument=dokument)
 
     # Glocknerhof-Fix: Startseite ohne FAQPage heißt noch nicht "keine
     # FAQPage" — das Markup gehört auf die FAQ-Unterseite. Nachprüfen,
     # bevor der Mangel behauptet wird (nur wenn eine Lodging-Entität da
     # ist; ohne die entscheidet die FAQPage ohnehin nichts).
     if result.overall_status == "GELB" and not result.has_faqpage:
-        kandidaten = finde_faq_kandidaten(html or "", final_url, dom)
+        kandidaten = finde_faq_kandidaten(html, final_url, dom, encoding=encoding,
+                                          dokument=dokument)
         if kandidaten:
-            quelle, geprueft = _pruefe_faq_unterseiten(
-                kandidaten, dom, user_agent, timeout)
+            quelle, geprueft, offen = _pruefe_faq_unterseiten(
+                kandidaten, dom, user_agent, timeout, deadline)
             if quelle:
-                result = evaluate_html(html or "", status or 200, dom,
-                                       final_url, faqpage_extern=quelle)
+                result = evaluate_html(html, status or 200, dom, final_url,
+                                       faqpage_extern=quelle, encoding=encoding,
+                                       dokument=dokument)
+            elif offen:
+                _faq_nicht_abschliessend_geprueft(result, offen)
             elif geprueft:
                 # Ehrlich präzisieren: nicht nur die Startseite wurde
                 # geprüft. Der Wortlaut "keine FAQPage" bleibt erhalten —
@@ -702,6 +886,7 @@ def check_schema(
                     f"FAQ-Unterseite(n) geprüft)",
                 )
 
+    result.truncated = snapshot.truncated
     return result
 
 
@@ -724,6 +909,9 @@ def format_report(res: SchemaResult) -> str:
     )
     for err in res.parse_errors[:3]:
         lines.append(f"  ! Parse-Fehler: {err}")
+    if res.entities_truncated:
+        lines.append(f"  ! Nur teilweise gelesen: mehr als {MAX_LD_ENTITAETEN} Entitäten "
+                     f"oder tiefer als {MAX_LD_TIEFE} Ebenen verschachtelt")
     if res.all_types:
         lines.append(f"@type-Werte gefunden: {', '.join(res.all_types)}")
     else:
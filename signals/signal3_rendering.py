@@ -25,10 +25,14 @@ import os
 import re
 import sys
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional
 
-import requests
-from bs4 import BeautifulSoup, Comment
+from circuit_breaker import host_gesperrt
+from dns_cache import domain_tot
+from dokument import ParsedDocument, Textumfang
+from http_client import (
+    ZEITBUDGET_UEBERSCHRITTEN, PageSnapshot, fetch_homepage, ist_utf8_kompatibel,
+)
 
 
 # -----------------------------------------------------------------------------
@@ -58,6 +62,14 @@ DEFAULT_TIMEOUT = int(os.environ.get("GEO_RADAR_HTTP_TIMEOUT", "15"))
 # -----------------------------------------------------------------------------
 # Framework-Anker: kein Killerkriterium für sich allein, aber kombiniert mit
 # duennem Body ein starkes Indiz für SPA-Shell.
+#
+# Jede Zeile ist ein gewöhnliches Muster (ohne Groß-/Kleinschreibung, \s und
+# \b nur ASCII — HTML trennt Attribute ohnehin nur mit ASCII-Leerraum) und
+# wird für sich gesucht. Eine gemeinsame Alternation wäre ein Durchlauf,
+# verliert aber die Literal-Vorsuche der einzelnen Muster und ist auf
+# typischen Startseiten mehrfach langsamer. Bedingung: nur ASCII, damit
+# jede Zeile auch als Byte-Muster gilt (geprüft in
+# tests/test_signals_vendored.py).
 # -----------------------------------------------------------------------------
 
 FRAMEWORK_MARKERS: list[tuple[str, str]] = [
@@ -65,41 +77,71 @@ FRAMEWORK_MARKERS: list[tuple[str, str]] = [
     (r'<div\s+[^>]*id=["\']app["\']', 'Vue/Nuxt #app-Anker'),
     (r'<div\s+[^>]*id=["\']__next["\']', 'Next.js __next-Anker'),
     (r'<div\s+[^>]*id=["\']__nuxt["\']', 'Nuxt __nuxt-Anker'),
+    (r'<div\s+[^>]*id=["\']___gatsby["\']', 'Gatsby ___gatsby-Anker'),
+    (r'<astro-island\b', 'Astro astro-island Element'),
     (r'\bdata-reactroot\b', 'React data-reactroot Attribut'),
     (r'\bng-version\s*=', 'Angular ng-version Attribut'),
     (r'\bng-app\s*=', 'AngularJS ng-app Attribut'),
     (r'\bdata-v-[a-f0-9]{6,}', 'Vue.js data-v- Attribute'),
+    (r'\bdata-sveltekit-', 'SvelteKit data-sveltekit Attribute'),
 ]
 
 
 # -----------------------------------------------------------------------------
 # Adresse und Telefon — bewusst tolerante Regeln, damit deutsche und
 # österreichische Formate sicher greifen.
+#
+# Gesucht wird nur in begrenzten Fenstern (ParsedDocument.kontaktfenster:
+# tel:-Links, <address>, sichtbarer Text je Block, JSON-LD), nie im rohen HTML
+# mit seinen Inline-Scripts und Base64-Blobs. Jede Wiederholung ist begrenzt
+# oder possessiv, kein Muster setzt quer über eine lange Ziffern- oder
+# Buchstabenfolge zurück: die Suche bleibt linear in der Fensterlänge
+# (benchmarks/bench_kontakt.py).
 # -----------------------------------------------------------------------------
 
-# +43 5356 12345  oder  0043 5356 12345
+# +43 5356 12345  oder  0043 5356 12345 (E.164: höchstens 15 Ziffern je Block)
 PHONE_INTERNATIONAL = re.compile(
-    r'(?:\+|00)\d{1,3}[\s\-\/\.\(\)]{0,3}\d{1,5}[\s\-\/\.\(\)]{0,3}\d{2,}[\s\-\/\.\(\)]{0,3}\d{2,}'
+    r'(?:\+|00)\d{1,3}[\s\-\/\.\(\)]{0,3}\d{1,5}[\s\-\/\.\(\)]{0,3}\d{2,15}'
+    r'[\s\-\/\.\(\)]{0,3}\d{2,15}'
 )
 
 # 0512 12345 (Inlands-Vorwahl)
 PHONE_DOMESTIC = re.compile(
-    r'\b0\d{2,4}[\s\-\/\.\(\)]{1,3}\d{3,}[\s\-\/\.\(\)]{0,3}\d{0,}'
+    r'\b0\d{2,4}[\s\-\/\.\(\)]{1,3}\d{3,15}[\s\-\/\.\(\)]{0,3}\d{0,15}'
 )
 
 # "Bergstraße 12", "Hauptstrasse 5", "Muehlweg 3", "Kirchplatz 1", "Str. 7"
+# Der Straßenname wird ab seinem Anfang possessiv gelesen, die Endung danach
+# per Lookbehind geprüft (mit mindestens einem Zeichen davor) — statt
+# Zurücksetzen Zeichen für Zeichen, ab jeder Wortgrenze neu, das bei langen
+# Bindestrich-Ketten ("a-a-a-...") quadratisch wurde.
+_STRASSENNAME = r'[A-ZÄÖÜa-zäöüß\-]'
 ADDRESS_STREET = re.compile(
-    r'\b[A-ZÄÖÜa-zäöüß\-]+(?:straße|strasse|str\.|weg|gasse|platz|allee|ring|ufer)\s+\d{1,4}\b',
+    r'\b(?<!' + _STRASSENNAME + r')' + _STRASSENNAME + r'++(?:'
+    + '|'.join(f'(?<={_STRASSENNAME}{endung})'
+               for endung in ('straße', 'strasse', 'weg', 'gasse', 'platz', 'allee', 'ring', 'ufer'))
+    + r'|(?<=' + _STRASSENNAME + r'str)\.)\s++\d{1,4}\b',
     re.IGNORECASE,
 )
 
 # "6370 Kitzbühel", "1010 Wien" — PLZ 4-5 stellig plus Ort mit Grossbuchstabe.
 # Bewusst keine Ziffer davor, um Preise wie "6370 EUR" auszuschließen.
 ADDRESS_PLZ_ORT = re.compile(
-    r'(?:^|[^\d])(\d{4,5})\s+([A-ZÄÖÜ][A-Za-zäöüß\-]{2,30})\b'
+    r'(?:^|[^\d])(\d{4,5})\s++([A-ZÄÖÜ][A-Za-zäöüß\-]{2,30})\b'
 )
 
 
+# -----------------------------------------------------------------------------
+# Framework-Marker kompiliert — als str- und als Byte-Muster (UTF-8-Seiten,
+# fast alle Hotel-Websites), dank re.ASCII mit gleicher Bedeutung.
+# -----------------------------------------------------------------------------
+
+_MARKER_ZEILEN = [re.compile(muster, re.IGNORECASE | re.ASCII)
+                  for muster, _label in FRAMEWORK_MARKERS]
+_MARKER_ZEILEN_B = [re.compile(muster.encode("ascii"), re.IGNORECASE | re.ASCII)
+                    for muster, _label in FRAMEWORK_MARKERS]
+
+
 # -----------------------------------------------------------------------------
 # Datentypen
 # -----------------------------------------------------------------------------
@@ -114,6 +156,7 @@ class RenderingResult:
 
     # Sichtbarer Textumfang im rohen HTML (nach Script/Style/Comment-Strip)
     visible_text_length: int = 0
+    visible_text_sample: str = ""      # Anfang des sichtbaren Texts als Beleg
 
     # SPA-Verdachts-Info
     is_spa_suspect: bool = False
@@ -127,87 +170,59 @@ class RenderingResult:
 
     overall_status: str = "UNBEKANNT"  # GRÜN | GELB | ROT | UNBEKANNT
     reason: str = ""
-
-
-# -----------------------------------------------------------------------------
-# HTTP-Fetch
-# -----------------------------------------------------------------------------
-
-def _fetch_html(
-    domain: str,
-    user_agent: str = DEFAULT_USER_AGENT,
-    timeout: int = DEFAULT_TIMEOUT,
-) -> tuple[str, str, int] | tuple[None, None, Optional[int]]:
-    """Holt die Startseite. Rückgabe wie in Signal 2."""
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
-        "Accept-Language": "de-AT,de;q=0.9,en;q=0.7",
-    }
-    last_status = None
-    for scheme in ("https", "http"):
-        url = f"{scheme}://{domain}/"
-        try:
-            r = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-            last_status = r.status_code
-            if 200 <= r.status_code < 300:
-                return r.url, r.text, r.status_code
-        except requests.RequestException:
-            continue
-    return None, None, last_status
+    truncated: bool = False            # Startseite über dem Byte-Limit, nur Anfang geprüft
 
 
 # -----------------------------------------------------------------------------
 # Text-/Struktur-Analyse
 # -----------------------------------------------------------------------------
 
-def _visible_text(html: str) -> str:
+def _measure_visible_text(html: str | bytes, encoding: Optional[str] = None,
+                          dokument: Optional[ParsedDocument] = None) -> Textumfang:
     """
-    Extrahiert den sichtbaren Text aus dem HTML.
-    Entfernt <script>, <style>, <noscript>, <template> und Kommentare.
+    Misst den sichtbaren Text im HTML (dokument.sichtbarer_umfang): Länge
+    plus kurze Probe, gestreamt — der Text wird nie als Ganzes gebaut.
+    Ohne <script>, <style>, <noscript>, <template> und Kommentare.
     <nav>, <header>, <footer> BLEIBEN — dort steht oft der Kontakt.
     """
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup(["script", "style", "noscript", "template"]):
-        tag.decompose()
-    for c in soup.find_all(string=lambda t: isinstance(t, Comment)):
-        c.extract()
-    return soup.get_text(separator=" ", strip=True)
+    if dokument is None:
+        dokument = ParsedDocument(html, encoding)
+    return dokument.sichtbarer_umfang
 
 
-def _detect_framework_markers(html: str) -> list[str]:
-    """Findet alle Framework-Anker im HTML — case-insensitive."""
+def _detect_framework_markers(html: str | bytes) -> list[str]:
+    """Findet alle Framework-Anker im HTML — case-insensitive, Zeile für Zeile."""
+    zeilen = _MARKER_ZEILEN_B if isinstance(html, bytes) else _MARKER_ZEILEN
     found = []
-    for pattern, label in FRAMEWORK_MARKERS:
-        if re.search(pattern, html, re.IGNORECASE):
+    for muster, (_quelle, label) in zip(zeilen, FRAMEWORK_MARKERS):
+        if muster.search(html):
             found.append(label)
     return found
 
 
-def _find_phone(html: str) -> tuple[bool, str]:
-    """Sucht ein Telefon-Muster im rohen HTML."""
-    m = PHONE_INTERNATIONAL.search(html)
-    if m:
-        return True, m.group(0).strip()
-    m = PHONE_DOMESTIC.search(html)
-    if m:
-        return True, m.group(0).strip()
+def _find_phone(fenster: Iterable[str]) -> tuple[bool, str]:
+    """Sucht ein Telefon-Muster, Fenster für Fenster (erster Treffer zählt)."""
+    for text in fenster:
+        m = PHONE_INTERNATIONAL.search(text) or PHONE_DOMESTIC.search(text)
+        if m:
+            return True, m.group(0).strip()
     return False, ""
 
 
-def _find_address(html: str) -> tuple[bool, str]:
+def _find_address(fenster: Iterable[str]) -> tuple[bool, str]:
     """
-    Sucht ein Adress-Muster im rohen HTML. Zwei Wege:
+    Sucht ein Adress-Muster, Fenster für Fenster (erster Treffer zählt). Zwei Wege:
     1. Straßenname + Hausnummer (z. B. 'Bergstraße 12')
     2. PLZ + Ort (z. B. '6370 Kitzbühel')
     """
-    m = ADDRESS_STREET.search(html)
-    if m:
-        return True, m.group(0).strip()
-    m = ADDRESS_PLZ_ORT.search(html)
-    if m:
-        # Gruppen 1 und 2 sind PLZ und Ort
-        return True, f"{m.group(1)} {m.group(2)}".strip()
+    for text in fenster:
+        m = ADDRESS_STREET.search(text)
+        if m:
+            return True, m.group(0).strip()
+        m = ADDRESS_PLZ_ORT.search(text)
+        if m:
+            # Gruppen 1 und 2 sind PLZ und Ort
+            return True, f"{m.group(1)} {m.group(2)}".strip()
     return False, ""
 
 
@@ -216,12 +231,23 @@ def _find_address(html: str) -> tuple[bool, str]:
 # -----------------------------------------------------------------------------
 
 def evaluate_html(
-    html: str,
+    html: str | bytes,
     http_status: int = 200,
     domain: str = "",
     fetched_url: Optional[str] = None,
+    encoding: Optional[str] = None,
+    dokument: Optional[ParsedDocument] = None,
 ) -> RenderingResult:
-    """Wertet HTML-Text aus. Rein — kein Netz — leicht testbar."""
+    """
+    Wertet HTML aus. Rein — kein Netz — leicht testbar.
+
+    html als Rohbytes (mit encoding aus dem Abruf-Layer): lxml dekodiert
+    selbst, die Marker-Suche läuft auf den Bytes. Nur Nicht-UTF-8-Seiten
+    werden für die Marker-Suche einmal dekodiert. Adresse und Telefon
+    kommen aus den Kontaktfenstern des geparsten Dokuments.
+    dokument: bereits geparstes html (PageSnapshot.dokument) — sichtbarer
+    Text und Kontaktfenster kommen dann ohne erneuten Parse daraus.
+    """
     result = RenderingResult(domain=domain, fetched_url=fetched_url, fetched_status=http_status)
 
     if not (200 <= http_status < 300):
@@ -229,16 +255,23 @@ def evaluate_html(
         result.reason = f"Seite nicht abrufbar (HTTP {http_status})"
         return result
 
-    text = _visible_text(html)
-    result.visible_text_length = len(text)
-
-    markers = _detect_framework_markers(html)
+    if dokument is None:
+        dokument = ParsedDocument(html, encoding)
+    # Zeichensatz wie beim Parse (ohne encoding von ParsedDocument erkannt)
+    roh = html
+    if isinstance(html, bytes) and not ist_utf8_kompatibel(dokument.encoding):
+        roh = html.decode(dokument.encoding, errors="replace")
+    umfang = _measure_visible_text(html, encoding, dokument)
+    result.visible_text_length = umfang.laenge
+    result.visible_text_sample = umfang.probe
+
+    markers = _detect_framework_markers(roh)
     result.spa_markers_found = markers
     # SPA-Verdacht = Framework-Marker UND wenig sichtbarer Text.
     result.is_spa_suspect = bool(markers) and result.visible_text_length < SPA_MARKER_TEXT_LIMIT
 
-    result.has_address, result.address_evidence = _find_address(html)
-    result.has_phone, result.phone_evidence = _find_phone(html)
+    result.has_address, result.address_evidence = _find_address(dokument.kontaktfenster())
+    result.has_phone, result.phone_evidence = _find_phone(dokument.kontaktfenster())
 
     # Ampel-Logik in Reihenfolge der Prioritaet:
 
@@ -316,8 +349,15 @@ def check_rendering(
     domain: str,
     user_agent: str = DEFAULT_USER_AGENT,
     timeout: int = DEFAULT_TIMEOUT,
+    snapshot: Optional[PageSnapshot] = None,
+    deadline: Optional[float] = None,
 ) -> RenderingResult:
-    """Prüft eine Domain auf Render-Auslieferung. Interpretiert nichts."""
+    """
+    Prüft eine Domain auf Render-Auslieferung. Interpretiert nichts.
+
+    snapshot: bereits geholte Startseite (fetch_homepage) — wie in Signal 2.
+    deadline: Ende des Zeitbudgets (time.monotonic()) — wie in Signal 1.
+    """
     dom = domain.strip()
     if dom.startswith("https://"):
         dom = dom[8:]
@@ -325,9 +365,35 @@ def check_rendering(
         dom = dom[7:]
     dom = dom.strip("/")
 
-    final_url, html, status = _fetch_html(dom, user_agent=user_agent, timeout=timeout)
+    # Domain laut DNS-Cache tot -> sofort UNBEKANNT, kein weiterer Versuch
+    dns_fehler = domain_tot(dom)
+    if dns_fehler:
+        result = RenderingResult(domain=dom)
+        result.fetch_error = f"Domain nicht auflösbar (DNS: {dns_fehler})"
+        result.overall_status = "UNBEKANNT"
+        result.reason = "Domain nicht erreichbar"
+        return result
+    sperre = host_gesperrt(dom)
+    if sperre:
+        result = RenderingResult(domain=dom)
+        result.fetch_error = sperre
+        result.overall_status = "UNBEKANNT"
+        result.reason = "Domain nicht erreichbar"
+        return result
+
+    if snapshot is None:
+        snapshot = fetch_homepage(dom, user_agent=user_agent, timeout=timeout,
+                                  deadline=deadline)
+    status = snapshot.status
 
-    if final_url is None:
+    if not snapshot.ok and snapshot.budget_exceeded:
+        result = RenderingResult(domain=dom, fetched_status=status)
+        result.fetch_error = f"Startseite nicht rechtzeitig geladen ({ZEITBUDGET_UEBERSCHRITTEN})"
+        result.overall_status = "UNBEKANNT"
+        result.reason = ZEITBUDGET_UEBERSCHRITTEN
+        return result
+
+    if not snapshot.ok:
         result = RenderingResult(domain=dom, fetched_status=status)
         result.fetch_error = (
             "Startseite nicht abrufbar (Timeout/DNS/Connection-Fehler"
@@ -338,7 +404,10 @@ def check_rendering(
         result.reason = "HTML konnte nicht geladen werden"
         return result
 
-    return evaluate_html(html or "", status or 200, dom, final_url)
+    result = evaluate_html(snapshot.body, status or 200, dom, snapshot.final_url,
+                           encoding=snapshot.encoding, dokument=snapshot.dokument)
+    result.truncated = snapshot.truncated
+    return result
 
 
 # -----------------------------------------------------------------------------
@@ -355,6 +424,8 @@ def format_report(res: RenderingResult) -> str:
     lines.append(f"Ampel: {res.overall_status}  —  {res.reason}")
     lines.append("")
     lines.append(f"Sichtbarer Textumfang im Body: {res.visible_text_length} Zeichen")
+    if res.visible_text_sample:
+        lines.append(f"Textprobe: {res.visible_text_sample[:120]}")
     if res.spa_markers_found:
         lines.append("Framework-Marker gefunden: " + ", ".join(res.spa_markers_found))
         lines.append(f"SPA-Verdacht: {'JA' if res.is_spa_suspect else 'nein'}")
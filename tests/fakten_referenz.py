@@ -0,0 +1,130 @@
+"""
+Referenz für tests/test_zusatz_checks.py: die frühere Regex-Kaskade aus
+check_website() (bis auf sortierte hreflang_langs) und ein Generator für
+WordPress-typische Startseiten. benchmarks/bench_fakten.py misst gegen dieselbe
+Kaskade.
+"""
+from __future__ import annotations
+
+import re
+
+_KOPF = """<!DOCTYPE html><html lang="de-AT"><head><meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Hotel Bergblick – Ihr Urlaub in Kitzbühel</title>
+<meta name="description" content="Familiengeführtes 4-Sterne-Hotel mit Wellness und Blick auf den Hahnenkamm.">
+<meta name="robots" content="index, follow, max-image-preview:large">
+<link rel="canonical" href="https://www.hotel-bergblick.at/">
+<link rel="alternate" hreflang="de" href="https://www.hotel-bergblick.at/">
+<link rel="alternate" hreflang="en" href="https://www.hotel-bergblick.at/en/">
+<link rel="alternate" hreflang="x-default" href="https://www.hotel-bergblick.at/">
+<meta property="og:locale" content="de_DE">
+<meta property="og:title" content="Hotel Bergblick – Ihr Urlaub in Kitzbühel">
+<meta property="og:description" content="Familiengeführtes 4-Sterne-Hotel mit Wellness.">
+<meta property="og:image" content="https://www.hotel-bergblick.at/wp-content/uploads/2024/01/aussen.jpg">
+<script type="application/ld+json" class="yoast-schema-graph">{{"@context":"https://schema.org","@graph":[
+{{"@type":"WebPage","@id":"https://www.hotel-bergblick.at/","name":"Hotel Bergblick"}},
+{{"@type":"Hotel","name":"Hotel Bergblick","telephone":"+43 5356 62222"}},
+{{"@type":"BreadcrumbList","itemListElement":[{{"@type":"ListItem","position":1}}]}}]}}</script>
+<style id="global-styles-inline-css">{css}</style>
+<script id="jquery-core-js-extra">{js}</script>
+</head><body class="home page-template-default">
+<header class="wp-block-template-part"><nav><a href="/zimmer/">Zimmer</a> <a href="/wellness/">Wellness</a>
+<a href="https://www.hotel-bergblick.at/kontakt/">Kontakt</a> <a href="#top">Nach oben</a>
+<a href="https://www.facebook.com/hotelbergblick">Facebook</a></nav></header>
+<main><h1 class="wp-block-heading">Willkommen im <em>Hotel Bergblick</em></h1>
+{inhalt}</main>
+<footer>Hotel Bergblick · Hahnenkammstraße 12 · 6370 Kitzbühel · Tel. +43 5356 62222</footer>
+</body></html>"""
+
+_CSS = (".wp-block-button__link{color:#fff;background-color:#32373c;border-radius:9999px;"
+        "padding:calc(.667em + 2px) calc(1.333em + 2px);font-size:1.125em}\n")
+_JS = ('var wpData={"ajax_url":"https:\\/\\/www.hotel-bergblick.at\\/wp-admin\\/admin-ajax.php",'
+       '"nonce":"4f2a"};if(a<b&&c>d){init()}\n')
+_BLOCK = """<div class="wp-block-group alignfull has-background"><div class="wp-block-columns">
+<div class="wp-block-column"><h2 class="wp-block-heading">Doppelzimmer Bergblick</h2>
+<p class="has-text-align-left">Genießen Sie den Blick auf die Kitzbüheler Alpen. Frühstück vom
+regionalen Buffet, Wellness mit Saunalandschaft und Ruheraum, Skibus direkt vor dem Haus.</p>
+<figure class="wp-block-image"><img src="/wp-content/uploads/2024/01/zimmer.jpg" alt="Doppelzimmer mit Balkon" loading="lazy" width="800" height="600"></figure>
+<figure class="wp-block-image"><img src="/wp-content/uploads/2024/01/deko.png" alt="" width="40" height="40"></figure>
+<a href="/zimmer/doppelzimmer/" class="wp-block-button__link">Details</a></div></div></div>
+<!-- /wp:group -->
+"""
+
+
+def erzeuge_seite(kb: int) -> bytes:
+    """WordPress-typische Startseite mit etwa kb Kilobyte."""
+    css, js = _CSS * 300, _JS * 250
+    rahmen = len(_KOPF.format(css=css, js=js, inhalt="").encode("utf-8"))
+    anzahl = max(1, (kb * 1024 - rahmen) // len(_BLOCK.encode("utf-8")))
+    return _KOPF.format(css=css, js=js, inhalt=_BLOCK * anzahl).encode("utf-8")
+
+
+def fakten_regex(raw_html: str, netloc: str) -> dict:
+    """Die frühere Regex-Kaskade aus check_website()."""
+    facts: dict = {}
+    m = re.search(r'<meta\s+name=["\']description["\']\s+content=["\'](.*?)["\']', raw_html, re.I) or \
+        re.search(r'<meta\s+content=["\'](.*?)["\']\s+name=["\']description["\']', raw_html, re.I)
+    facts["meta_desc"] = m.group(1).strip() if m else ""
+    facts["meta_desc_ok"] = bool(facts["meta_desc"])
+    facts["viewport"] = bool(re.search(r'<meta[^>]+name=["\']viewport["\']', raw_html, re.I))
+    lm = re.search(r'<html[^>]+lang=["\']([^"\']+)["\']', raw_html, re.I)
+    facts["lang"]    = lm.group(1) if lm else ""
+    facts["lang_ok"] = bool(facts["lang"])
+    tm = re.search(r'<title[^>]*>(.*?)</title>', raw_html, re.I | re.DOTALL)
+    facts["page_title"] = re.sub(r"\s+", " ", tm.group(1)).strip() if tm else ""
+    facts["title_ok"]   = bool(facts["page_title"])
+    cm = re.search(r'<link[^>]+rel=["\']canonical["\'][^>]+href=["\']([^"\']+)["\']', raw_html, re.I)
+    facts["canonical"]    = cm.group(1) if cm else ""
+    facts["canonical_ok"] = bool(facts["canonical"])
+    og_title = re.search(r'<meta\s+(?:property|name)=["\']og:title["\']\s+content=["\'](.*?)["\']', raw_html, re.I) or \
+               re.search(r'<meta\s+content=["\'](.*?)["\']\s+(?:property|name)=["\']og:title["\']', raw_html, re.I)
+    og_desc = re.search(r'<meta\s+(?:property|name)=["\']og:description["\']\s+content=["\'](.*?)["\']', raw_html, re.I) or \
+              re.search(r'<meta\s+content=["\'](.*?)["\']\s+(?:property|name)=["\']og:description["\']', raw_html, re.I)
+    og_image = re.search(r'<meta\s+(?:property|name)=["\']og:image["\']\s+content=["\'](.*?)["\']', raw_html, re.I) or \
+               re.search(r'<meta\s+content=["\'](.*?)["\']\s+(?:property|name)=["\']og:image["\']', raw_html, re.I)
+    og_parts = []
+    if og_title:  og_parts.append("og:title")
+    if og_desc:   og_parts.append("og:description")
+    if og_image:  og_parts.append("og:image")
+    facts["og_tags_found"] = og_parts
+    facts["og_ok"] = len(og_parts) >= 2
+    h1_matches = re.findall(r'<h1[^>]*>(.*?)</h1>', raw_html, re.I | re.DOTALL)
+    facts["h1_count"] = len(h1_matches)
+    facts["h1_text"] = re.sub(r'<[^>]+>', '', h1_matches[0]).strip() if h1_matches else ""
+    facts["h1_ok"] = len(h1_matches) == 1 and bool(facts["h1_text"])
+    all_images = re.findall(r'<img\b[^>]*>', raw_html, re.I)
+    images_with_alt = [img for img in all_images if re.search(r'\balt=["\'][^"\']+["\']', img, re.I)]
+    facts["img_total"] = len(all_images)
+    facts["img_with_alt"] = len(images_with_alt)
+    facts["img_alt_pct"] = round(len(images_with_alt) / len(all_images) * 100) if all_images else 100
+    facts["img_alt_ok"] = facts["img_alt_pct"] >= 80
+    jsonld_blocks = re.findall(r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', raw_html, re.I | re.DOTALL)
+    facts["jsonld_count"] = len(jsonld_blocks)
+    facts["jsonld_ok"] = len(jsonld_blocks) > 0
+    jsonld_types = []
+    for block in jsonld_blocks:
+        types = re.findall(r'"@type"\s*:\s*"([^"]+)"', block)
+        jsonld_types.extend(types)
+    facts["jsonld_types"] = jsonld_types
+    text_only = re.sub(r'<script[^>]*>.*?</script>', '', raw_html, flags=re.I | re.DOTALL)
+    text_only = re.sub(r'<style[^>]*>.*?</style>', '', text_only, flags=re.I | re.DOTALL)
+    text_only = re.sub(r'<[^>]+>', ' ', text_only)
+    text_only = re.sub(r'\s+', ' ', text_only).strip()
+    words = [w for w in text_only.split() if len(w) > 1]
+    facts["word_count"] = len(words)
+    facts["content_ok"] = len(words) >= 300
+    meta_robots = re.search(r'<meta\s+name=["\']robots["\']\s+content=["\'](.*?)["\']', raw_html, re.I) or \
+                  re.search(r'<meta\s+content=["\'](.*?)["\']\s+name=["\']robots["\']', raw_html, re.I)
+    robots_content = meta_robots.group(1).lower() if meta_robots else ""
+    facts["meta_robots"] = robots_content
+    facts["noindex"] = "noindex" in robots_content
+    facts["nofollow"] = "nofollow" in robots_content
+    facts["indexable_ok"] = not facts["noindex"]
+    hreflang_matches = re.findall(r'<link[^>]+hreflang=["\']([^"\']+)["\']', raw_html, re.I)
+    facts["hreflang_langs"] = sorted(set(hreflang_matches))
+    facts["hreflang_ok"] = len(hreflang_matches) > 0
+    all_links = re.findall(r'<a\b[^>]+href=["\']([^"\'#]+)["\']', raw_html, re.I)
+    internal_links = [l for l in all_links if l.startswith("/") or netloc in l]
+    facts["internal_link_count"] = len(internal_links)
+    facts["internal_links_ok"] = len(internal_links) >= 3
+    return facts
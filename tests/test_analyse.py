@@ -0,0 +1,108 @@
+"""Tests für den parallelen Analyse-Ablauf (analyse.py) — ohne Netz."""
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import analyse                               # noqa: E402
+
+
+def _res(status):
+    return SimpleNamespace(overall_status=status, reason="Testgrund", sitemaps=[])
+
+
+def _langsam(ergebnis, dauer=0.2):
+    def _f(*_a, **_kw):
+        time.sleep(dauer)
+        return ergebnis
+    return _f
+
+
+def test_pruefungen_laufen_parallel_und_melden_fortschritt(monkeypatch):
+    startseite = object()
+    gesehen = {}
+
+    def fake_schema(domain, snapshot=None, deadline=None):
+        gesehen["s2"] = snapshot
+        time.sleep(0.2)
+        return _res("GELB")
+
+    def fake_website(url, snapshot=None, deadline=None, sitemaps=None):
+        gesehen["sitemaps"] = sitemaps
+        time.sleep(0.2)
+        return {"https": True}
+
+    robots = _res("GRÜN")
+    robots.sitemaps = ["https://example.at/sitemap_index.xml"]
+    monkeypatch.setattr(analyse, "check_robots", _langsam(robots, 0.1))
+    monkeypatch.setattr(analyse, "fetch_homepage", _langsam(startseite, 0.05))
+    monkeypatch.setattr(analyse, "check_schema", fake_schema)
+    monkeypatch.setattr(analyse, "check_rendering", _langsam(_res("GRÜN")))
+    monkeypatch.setattr(analyse, "check_website", fake_website)
+
+    meldungen = []
+    haupt = threading.current_thread()
+
+    def melde(text):
+        assert threading.current_thread() is haupt
+        meldungen.append(text)
+
+    t0 = time.monotonic()
+    ergebnis = analyse.fuehre_analyse_durch("example.at", "https://example.at", melde=melde)
+    dauer = time.monotonic() - t0
+
+    # Summe seriell wäre 0.75 s — parallel nahe an der längsten Kette
+    # (robots.txt -> Zusatz-Checks, 0.3 s)
+    assert dauer < 0.6
+    assert gesehen["s2"] is startseite
+    assert gesehen["sitemaps"] == ["https://example.at/sitemap_index.xml"]
+    assert len(meldungen) == len(analyse.FORTSCHRITT)
+    assert ergebnis["facts"] == {"https": True}
+    assert ergebnis["befund"]["overall"] == "GELB"
+    assert ergebnis["netz"]["abrufe"] == 0
+    assert set(ergebnis["netz"]["zeiten"].values()) == {0.0}
+
+
+def test_haengende_pruefung_wird_nach_budget_unbekannt(monkeypatch):
+    monkeypatch.setattr(analyse, "NACHLAUF", 0.05)
+    monkeypatch.setattr(analyse, "check_robots", _langsam(_res("GRÜN"), 0.05))
+    monkeypatch.setattr(analyse, "fetch_homepage", _langsam(object(), 0.05))
+    monkeypatch.setattr(analyse, "check_schema", _langsam(_res("GRÜN"), 0.05))
+    monkeypatch.setattr(analyse, "check_rendering", _langsam(_res("GRÜN"), 2.0))
+    monkeypatch.setattr(analyse, "check_website", _langsam({"https": True}, 0.05))
+
+    t0 = time.monotonic()
+    ergebnis = analyse.fuehre_analyse_durch("example.at", "https://example.at", budget=0.2)
+    assert time.monotonic() - t0 < 1.0
+    assert ergebnis["s2"].overall_status == "GRÜN"
+    assert ergebnis["s3"].overall_status == "UNBEKANNT"
+    assert ergebnis["s3"].reason == "Zeitbudget überschritten"
+    assert ergebnis["befund"]["overall"] != "GRÜN"
+
+
+def test_keine_folgepruefung_auf_platzhalter_der_startseite(monkeypatch):
+    monkeypatch.setattr(analyse, "NACHLAUF", 0.05)
+    gestartet = []
+
+    def _merke(name):
+        def _f(*_a, **_kw):
+            gestartet.append(name)
+            return _res("GRÜN")
+        return _f
+
+    monkeypatch.setattr(analyse, "check_robots", _langsam(_res("GRÜN"), 0.05))
+    monkeypatch.setattr(analyse, "fetch_homepage", _langsam(object(), 2.0))
+    monkeypatch.setattr(analyse, "check_schema", _merke("s2"))
+    monkeypatch.setattr(analyse, "check_rendering", _merke("s3"))
+    monkeypatch.setattr(analyse, "check_website", _merke("facts"))
+
+    meldungen = []
+    ergebnis = analyse.fuehre_analyse_durch("example.at", "https://example.at",
+                                            melde=meldungen.append, budget=0.2)
+    assert gestartet == []
+    assert ergebnis["s2"].reason == ergebnis["s3"].reason == "Zeitbudget überschritten"
+    assert ergebnis["facts"]["sitemap_exists"] is None
+    assert len(meldungen) == len(analyse.FORTSCHRITT)
@@ -53,3 +53,10 @@ def test_befund_haelt_signal_gruende_fest():
 def test_signal_kurzzeile():
     b = baue_befund(_res("GRÜN"), _res("ROT"), _res("GELB"))
     assert signal_kurzzeile(b) == "S1 GRÜN | S2 ROT | S3 GELB"
+
+
+def test_befund_nennt_gekuerzte_datei_im_grund():
+    gekuerzt = SimpleNamespace(overall_status="GRÜN", reason="Alle Bots erlaubt", truncated=True)
+    b = baue_befund(gekuerzt, _res("GRÜN"), _res("GRÜN"))
+    assert b["signale"][0]["grund"].startswith("Alle Bots erlaubt (Hinweis:")
+    assert "Prüf-Limit" not in b["signale"][1]["grund"]
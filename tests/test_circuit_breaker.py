@@ -0,0 +1,144 @@
+"""Tests für die Host-Sicherung (signals/circuit_breaker.py) — ohne Netz."""
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "signals"))
+
+import requests                                # noqa: E402
+from urllib3.exceptions import ReadTimeoutError  # noqa: E402
+
+import circuit_breaker                         # noqa: E402
+from circuit_breaker import CircuitBreaker     # noqa: E402
+from signals import check_rendering, check_robots, check_schema, fetch_url, get_session  # noqa: E402
+from zusatz_checks import build_checks, check_website  # noqa: E402
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    frisch = CircuitBreaker(schwelle=2, sperrdauer=60)
+    monkeypatch.setattr(circuit_breaker, "_breaker", frisch)
+    return frisch
+
+
+def test_sperre_ab_schwelle_und_zuruecksetzen_bei_antwort():
+    b = CircuitBreaker(schwelle=2, sperrdauer=0.1)
+    b.fehlschlag("https://hotel.at:443", "ConnectTimeout: erster")
+    assert b.gesperrt("https://hotel.at:443") is None
+    b.fehlschlag("https://HOTEL.at:443", "ReadTimeout: zweiter")
+    assert "ConnectTimeout: erster" in b.gesperrt("https://hotel.at:443")
+
+    time.sleep(0.15)
+    assert b.gesperrt("https://hotel.at:443") is None   # halboffen: ein Versuch darf raus
+    b.fehlschlag("https://hotel.at:443", "ConnectTimeout: dritter")
+    assert b.gesperrt("https://hotel.at:443") is not None   # ... und sperrt sofort wieder
+    b.erfolg("https://hotel.at:443")
+    assert b.gesperrt("https://hotel.at:443") is None
+
+
+def test_origin_mit_schema_und_port():
+    assert circuit_breaker.origin("https://Hotel.AT/faq") == "https://hotel.at:443"
+    assert circuit_breaker.origin("http://hotel.at/") == "http://hotel.at:80"
+    assert circuit_breaker.origin("https://hotel.at:8443/x") == "https://hotel.at:8443"
+
+
+def test_toter_host_kostet_jeden_timeout_nur_einmal(breaker, monkeypatch):
+    aufrufe = []
+
+    def haengt(url, **_kw):
+        aufrufe.append(url)
+        raise requests.ConnectTimeout(f"Verbindung zu {url} hängt")
+    monkeypatch.setattr(get_session(), "get", haengt)
+
+    for _ in range(2):
+        s1 = check_robots("haengt.at")
+        assert s1.overall_status == "UNBEKANNT"
+    assert len(aufrufe) == 4                        # je Schema zwei, danach gesperrt
+
+    for check in (check_schema, check_rendering):
+        res = check("haengt.at")
+        assert res.overall_status == "UNBEKANNT"
+        assert "Host gesperrt" in res.fetch_error and "ConnectTimeout" in res.fetch_error
+    facts = check_website("https://haengt.at")
+    assert facts["sitemap_exists"] is None
+    sitemap = next(c for c in build_checks(facts) if c["name"] == "sitemap.xml vorhanden")
+    assert sitemap["detail"] == "Nicht geprüft (Website antwortet nicht)"
+    assert len(aufrufe) == 4
+    assert breaker.statistik() == {"gesperrt": 2, "kurzschluesse": 2}
+
+
+def test_lese_timeout_beim_streamen_zaehlt(breaker, monkeypatch):
+    class _Haengt:
+        url, status_code, headers = "https://langsam.at/", 200, {}
+
+        def iter_content(self, _n):
+            raise requests.ConnectionError(ReadTimeoutError(None, None, "Read timed out."))
+
+    monkeypatch.setattr(get_session(), "get", lambda url, **_kw: _Haengt())
+    fetch_url("https://langsam.at/")
+    fetch_url("https://langsam.at/sitemap.xml")
+    snap = fetch_url("https://langsam.at/faq")
+    assert snap.host_gesperrt and "Read timed out" in snap.error
+
+
+def test_schnelle_fehler_sperren_nicht(breaker, monkeypatch):
+    def abgelehnt(url, **_kw):
+        raise requests.ConnectionError("Connection refused")
+    monkeypatch.setattr(get_session(), "get", abgelehnt)
+    for _ in range(3):
+        assert not fetch_url("https://zu.at/").host_gesperrt
+    assert breaker.gesperrt("https://zu.at:443") is None
+
+
+def test_toter_tls_port_sperrt_nicht_die_http_origin(breaker, monkeypatch):
+    # https hängt, http antwortet: nur die https-Origin wird gesperrt.
+    # Untergrenze über der Vorgabe: kein verkürzter gelernter Timeout
+    import host_latenz
+    monkeypatch.setattr(host_latenz, "_latenz", host_latenz.LatenzStatistik(minimum=60))
+
+    def nur_http(url, **_kw):
+        if url.startswith("https://"):
+            raise requests.ConnectTimeout(f"Verbindung zu {url} hängt")
+        return _Antwort(url, b"<html><body>Hotel Teststern</body></html>")
+    monkeypatch.setattr(get_session(), "get", nur_http)
+    for _ in range(3):
+        assert check_robots("tls-kaputt.at").overall_status == "GRÜN"
+    assert breaker.gesperrt("https://tls-kaputt.at:443") is not None
+    assert breaker.gesperrt("http://tls-kaputt.at:80") is None
+    assert circuit_breaker.host_gesperrt("tls-kaputt.at") is None
+    res = check_rendering("tls-kaputt.at")
+    assert res.fetch_error is None and res.overall_status != "UNBEKANNT"
+
+
+def test_gesperrte_faq_unterseite_ist_nicht_abschliessend_geprueft(breaker, monkeypatch):
+    import signal2_schema
+    from test_signals_vendored import _STARTSEITE_MIT_FAQ_LINK
+    from signals import PageSnapshot
+    def haengt(url, **_kw):
+        raise requests.ConnectTimeout(f"Verbindung zu {url} hängt")
+    monkeypatch.setattr(get_session(), "get", haengt)
+    for _ in range(2):
+        breaker.fehlschlag("https://www.glocknerhof.at:443", "ConnectTimeout: hängt")
+    startseite = PageSnapshot(
+        url="https://glocknerhof.at/", final_url="https://www.glocknerhof.at/",
+        status=200, body=_STARTSEITE_MIT_FAQ_LINK.encode("utf-8"), encoding="utf-8")
+    res = check_schema("glocknerhof.at", snapshot=startseite)
+    assert "keine FAQPage" not in res.reason
+    assert f"nicht abschließend geprüft ({signal2_schema._HOST_GESPERRT})" in res.reason
+
+
+class _Antwort:
+    status_code, history = 200, []
+
+    def __init__(self, url, body):
+        self.url, self.content = url, body
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+
+    def iter_content(self, _n):
+        yield self.content
+
+    def close(self):
+        pass
@@ -0,0 +1,143 @@
+"""Tests für den DNS-Cache (signals/dns_cache.py) — ohne echtes DNS."""
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "signals"))
+
+import dns_cache                               # noqa: E402
+from dns_cache import DnsCache                 # noqa: E402
+from signals import check_rendering, check_robots, check_schema, get_session  # noqa: E402
+
+
+def _zaehlender_aufloeser(antworten, dauer=0.0):
+    aufrufe = []
+
+    def aufloeser(host):
+        aufrufe.append(host)
+        time.sleep(dauer)
+        antwort = antworten[host]
+        if isinstance(antwort, Exception):
+            raise antwort
+        return antwort
+    return aufloeser, aufrufe
+
+
+def test_parallele_lookups_teilen_sich_eine_aufloesung():
+    aufloeser, aufrufe = _zaehlender_aufloeser({"hotel.at": ["192.0.2.1"]}, dauer=0.1)
+    cache = DnsCache(aufloeser=aufloeser)
+    ergebnisse = []
+    threads = [threading.Thread(target=lambda: ergebnisse.append(cache.aufloesen("hotel.at")))
+               for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert ergebnisse == [["192.0.2.1"]] * 6
+    assert aufrufe == ["hotel.at"]
+    cache.aufloesen("HOTEL.at.")                 # Schreibweise egal, weiterhin gecacht
+    assert len(aufrufe) == 1
+
+
+def test_nxdomain_wird_negativ_gecacht_und_laeuft_ab():
+    nx = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+    aufloeser, aufrufe = _zaehlender_aufloeser({"vertippt.at": nx})
+    cache = DnsCache(negativ_ttl=0.1, aufloeser=aufloeser)
+    for _ in range(3):
+        with pytest.raises(socket.gaierror):
+            cache.aufloesen("vertippt.at")
+    assert aufrufe == ["vertippt.at"]
+    assert cache.bekannt_tot("vertippt.at") == "Name or service not known"
+    time.sleep(0.15)
+    assert cache.bekannt_tot("vertippt.at") is None
+    with pytest.raises(socket.gaierror):
+        cache.aufloesen("vertippt.at")
+    assert len(aufrufe) == 2
+
+
+def test_haengender_lookup_gilt_nach_timeout_als_tot():
+    aufloeser, _ = _zaehlender_aufloeser({"haengt.at": ["192.0.2.1"]}, dauer=1.0)
+    cache = DnsCache(timeout=0.05, aufloeser=aufloeser)
+    t0 = time.monotonic()
+    with pytest.raises(socket.gaierror):
+        cache.aufloesen("haengt.at")
+    assert time.monotonic() - t0 < 0.5
+    assert "Zeitüberschreitung" in cache.bekannt_tot("haengt.at")
+
+
+def test_wartezeit_im_pool_zaehlt_nicht_als_dns_timeout():
+    # Ein Worker, belegt von einem langsamen Lookup: der gesunde Host wartet
+    # in der Schlange länger als timeout, löst danach aber sofort auf
+    aufloeser, _ = _zaehlender_aufloeser({"langsam.at": ["192.0.2.1"],
+                                          "gesund.at": ["192.0.2.2"]})
+    langsam = {"langsam.at": 0.3}
+
+    def mit_dauer(host):
+        time.sleep(langsam.get(host, 0))
+        return aufloeser(host)
+    cache = DnsCache(timeout=0.2, aufloeser=mit_dauer, worker=1)
+    threading.Thread(target=lambda: pytest.raises(socket.gaierror, cache.aufloesen,
+                                                  "langsam.at")).start()
+    time.sleep(0.05)
+    assert cache.aufloesen("gesund.at") == ["192.0.2.2"]
+    assert cache.bekannt_tot("gesund.at") is None
+
+
+def test_volle_warteschlange_wird_nicht_negativ_gecacht():
+    aufloeser, aufrufe = _zaehlender_aufloeser({"blockiert.at": ["192.0.2.1"],
+                                                "gesund.at": ["192.0.2.2"]}, dauer=0.3)
+    cache = DnsCache(aufloeser=aufloeser, worker=1, warteschlange=0.05)
+    threading.Thread(target=lambda: cache.aufloesen("blockiert.at")).start()
+    time.sleep(0.05)
+    with pytest.raises(socket.gaierror, match="Worker belegt"):
+        cache.aufloesen("gesund.at")
+    assert cache.bekannt_tot("gesund.at") is None
+    time.sleep(0.6)                                 # Lookup lief im Hintergrund zu Ende
+    assert cache.aufloesen("gesund.at") == ["192.0.2.2"]
+    assert aufrufe == ["blockiert.at", "gesund.at"]
+
+
+def test_tote_domain_ist_in_allen_signalen_sofort_unbekannt(monkeypatch):
+    nx = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+    aufloeser, aufrufe = _zaehlender_aufloeser({"abgelaufen.at": nx})
+    cache = DnsCache(aufloeser=aufloeser)
+    monkeypatch.setattr(dns_cache, "_resolver", cache)
+    with pytest.raises(socket.gaierror):
+        cache.aufloesen("abgelaufen.at")
+    monkeypatch.setattr(get_session(), "get",
+                        lambda *_a, **_kw: pytest.fail("Abruf trotz toter Domain"))
+
+    for check in (check_robots, check_schema, check_rendering):
+        res = check("https://abgelaufen.at/")
+        assert res.overall_status == "UNBEKANNT"
+        assert "DNS" in res.fetch_error
+    assert aufrufe == ["abgelaufen.at"]
+
+
+def test_session_verbindet_ueber_den_dns_cache(monkeypatch):
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *_a):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    aufloeser, aufrufe = _zaehlender_aufloeser({"nur-im-cache.test": ["127.0.0.1"]})
+    monkeypatch.setattr(dns_cache, "_resolver", DnsCache(aufloeser=aufloeser))
+    try:
+        r = get_session().get(f"http://nur-im-cache.test:{server.server_port}/", timeout=5)
+        assert r.status_code == 200 and r.content == b"ok"
+        assert aufrufe == ["nur-im-cache.test"]
+    finally:
+        server.shutdown()
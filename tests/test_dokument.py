@@ -0,0 +1,184 @@
+"""Tests für den gemeinsamen Parse (signals/dokument.py) — ohne Netz."""
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "signals"))
+
+from bs4 import BeautifulSoup, Comment         # noqa: E402
+
+import dokument                                # noqa: E402
+import signal2_schema                          # noqa: E402
+from dokument import ParsedDocument             # noqa: E402
+from signals import PageSnapshot, check_rendering, check_schema, get_session  # noqa: E402
+from zusatz_checks import check_website        # noqa: E402
+
+_SEITEN = [
+    "",
+    "   ",
+    "<!-- nur ein Kommentar -->",
+    "nur Text ohne Tags",
+    """<!DOCTYPE html><html lang="de-AT"><head><title>  Hotel
+    Teststern </title><meta name="description" content="Familienhotel &amp; Spa">
+    <style>p{color:red}</style><script>var a = "<p>kein Text</p>";</script>
+    <script type="application/ld+json">{"@type":"Hotel","name":"Teststern"}</script>
+    <script type="Application/LD+JSON; charset=utf-8"> [1, 2 </script>
+    <script type="application/ld+json">   </script></head>
+    <body><!-- Kommentar --><header><a href="/faq">Häufige <b>Fragen</b></a></header>
+    <noscript>Bitte JavaScript aktivieren</noscript><template><p>Vorlage</p></template>
+    <p>Zimmer&nbsp;ab 149&euro;<br>Bergstraße 12, 6370 Kitzbühel</p><![CDATA[cdata]]>
+    <a href="">leer</a><a>ohne href</a><a href="/k"><script>x()</script>Kontakt</a>
+    <svg><title>Icon</title><style>.x{}</style></svg>Tel. +43 5356 62222</body></html>""",
+    "<html><body><p>ungeschlossen <div>verschachtelt <span>tief</p> Rest",
+    "<?xml version='1.0' encoding='utf-8'?><html><body><p>XHTML</p></body></html>",
+]
+
+
+def _sichtbar_bs(html, encoding=None):
+    """Bisherige Umsetzung aus signal3_rendering (drei BeautifulSoup-Bäume)."""
+    soup = (BeautifulSoup(html, "lxml", from_encoding=encoding) if isinstance(html, bytes)
+            else BeautifulSoup(html, "lxml"))
+    for tag in soup(["script", "style", "noscript", "template"]):
+        tag.decompose()
+    for c in soup.find_all(string=lambda t: isinstance(t, Comment)):
+        c.extract()
+    return soup.get_text(separator=" ", strip=True)
+
+
+def _ld_bs(html, encoding=None):
+    soup = (BeautifulSoup(html, "lxml", from_encoding=encoding) if isinstance(html, bytes)
+            else BeautifulSoup(html, "lxml"))
+    roh = []
+    for script in soup.find_all("script", type=lambda v: v and "application/ld+json" in v.lower()):
+        text = (script.string if script.string is not None else script.get_text()).strip()
+        if text:
+            roh.append(text)
+    return roh
+
+
+def _anker_bs(html):
+    return [(a["href"], a.get_text(" ", strip=True))
+            for a in BeautifulSoup(html, "lxml").find_all("a", href=True)]
+
+
+def test_ansichten_entsprechen_beautifulsoup():
+    for html in _SEITEN:
+        doc = ParsedDocument(html)
+        sichtbar = _sichtbar_bs(html)
+        assert doc.sichtbarer_umfang.laenge == len(sichtbar), html
+        assert doc.sichtbarer_umfang.probe == sichtbar[:dokument.TEXTPROBE_ZEICHEN], html
+        assert doc.ld_json == _ld_bs(html), html
+        assert doc.anker == _anker_bs(html), html
+
+
+def test_rohbytes_mit_encoding_wie_str():
+    html = _SEITEN[4]
+    for encoding in ("utf-8", "utf-8-sig", "cp1252", "utf-16"):
+        roh = html.replace("€", "EUR").encode(encoding)
+        sichtbar = _sichtbar_bs(roh.decode(encoding))
+        assert ParsedDocument(roh, encoding).sichtbarer_umfang == \
+            dokument.Textumfang(len(sichtbar), sichtbar[:dokument.TEXTPROBE_ZEICHEN]), encoding
+
+
+def test_sichtbarer_umfang_gestreamt_ohne_baum_zu_veraendern():
+    from lxml import etree
+    abschnitt = _SEITEN[4][_SEITEN[4].index("<body>") + 6:_SEITEN[4].index("</body>")]
+    html = "<html><body>" + abschnitt * 200 + "</body></html>"
+    doc = ParsedDocument(html.encode("utf-8"), "utf-8")
+    vorher = etree.tostring(doc.wurzel)
+    sichtbar = _sichtbar_bs(html)
+    assert doc.sichtbarer_umfang.laenge == len(sichtbar)
+    assert doc.sichtbarer_umfang.probe == sichtbar[:dokument.TEXTPROBE_ZEICHEN]
+    assert len(doc.sichtbarer_umfang.probe) == dokument.TEXTPROBE_ZEICHEN
+    assert etree.tostring(doc.wurzel) == vorher
+
+
+def test_kopfdaten_unabhaengig_von_attribut_reihenfolge():
+    kopf = ParsedDocument(_SEITEN[4]).kopf
+    assert kopf.titel == "Hotel Teststern"
+    assert kopf.sprache == "de-AT"
+    assert kopf.meta["description"] == "Familienhotel & Spa"
+
+    kopf = ParsedDocument("""<html><head>
+        <meta content="Hotel am See" property="og:title">
+        <meta content="noindex, follow" name="ROBOTS">
+        <link href="https://example.at/" rel="canonical">
+        <meta name="viewport"><meta property="og:title" content="zweiter"></head></html>""").kopf
+    assert kopf.meta == {"og:title": "Hotel am See", "robots": "noindex, follow", "viewport": ""}
+    assert kopf.canonical == "https://example.at/"
+
+
+# Grenzfälle für JSON-LD: Kommentare, Rohtext-Elemente, Attributwerte,
+# kaputtes Markup — der Baum muss liefern, was BeautifulSoup lieferte
+_LD_FAELLE = [
+    b'<script type="application/ld+json">{"a":"</b>"}</script><p>x</p>',
+    b'<script type="application/ld+json">{"a":\r\n"x"}</script>',
+    b'<!-- <script type="application/ld+json">{"a":1}</script> -->',
+    b'<div data-x=\'<script type="application/ld+json">{"a":1}</script>\'>y</div>',
+    b'<style><script type="application/ld+json">{"a":1}</script></style>',
+    b'<title><script type="application/ld+json">{"a":1}</script></title>',
+    b'<textarea><script type="application/ld+json">{"a":1}</script></textarea>',
+    b'<noscript><script type="application/ld+json">{"a":1}</script></noscript>',
+    b'<script type="text/javascript">s="<script type=\'application/ld+json\'>{}</script>";'
+    b'</script>',
+    b'<script data-x="a>b" TYPE = application/ld+json>{"a":2}</script >',
+    b'<script type="application&#47;ld+json">{"a":3}</script\n>',
+    b'<script type="application/ld+json">{"a":"</scriptx>"}</script>',
+    b'<script type="application/ld+json">{"a":"</SCRIPT >"}</script>',
+    b'<script type="application/ld+json">{"a":"\x00\xc3\xa4\xff"}</script>',
+    b'<script type="application/ld+json" type="text/x">{"a":4}</script>',
+    b'<script type="text/x" type="application/ld+json">{"a":5}</script>',
+    b'<!--><!---><!-- x --!><?php y ?><p>a<</p><script/type="application/ld+json">'
+    b'{"a":6}</script>',
+    b'<script type="application/ld+json">{"a":7}',
+    b'<script type="application/ld+json">{"a":"<!-- x -->"}</script>',
+    b'<a href="x" <script type="application/ld+json">{"a":8}</script>',
+    b'<script type="application/ld+json"/>{"a":9}</script>',
+    b'<p>a</ p></><script type="application/ld+json">{"a":10}</script>',
+    b'<!-- offen <script type="application/ld+json">{"a":11}</script>',
+]
+
+
+def test_ld_bloecke_aus_dem_baum_wie_beautifulsoup():
+    for html in _LD_FAELLE:
+        assert ParsedDocument(html, "utf-8").ld_json == _ld_bs(html, "utf-8"), html
+
+
+def test_startseite_wird_je_analyse_nur_einmal_geparst(monkeypatch):
+    parses = []
+    original = dokument._parse
+
+    def zaehle(body, encoding):
+        parses.append(threading.current_thread().name)
+        return original(body, encoding)
+    monkeypatch.setattr(dokument, "_parse", zaehle)
+    monkeypatch.setattr(get_session(), "head", lambda url, **_kw: _nicht_da(url))
+    monkeypatch.setattr(get_session(), "get", lambda url, **_kw: _nicht_da(url))
+
+    body = _SEITEN[4].encode("utf-8")
+    snap = PageSnapshot(url="https://example.at/", final_url="https://example.at/",
+                        status=200, body=body, encoding="utf-8", elapsed=0.2)
+    threads = [threading.Thread(target=lambda: check_schema("example.at", snapshot=snap)),
+               threading.Thread(target=lambda: check_rendering("example.at", snapshot=snap)),
+               threading.Thread(target=lambda: check_website("https://example.at", snap))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(parses) == 1
+
+
+def _nicht_da(url):
+    class _Antwort:
+        status_code, headers, content, history = 404, {}, b"", []
+
+        def __init__(self, url):
+            self.url = url
+
+        def iter_content(self, _n):
+            return iter(())
+
+        def close(self):
+            pass
+    return _Antwort(url)
@@ -0,0 +1,542 @@
+"""Tests für den gemeinsamen Abruf-Layer (signals/http_client.py) — ohne Netz."""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "signals"))
+
+import pytest                                  # noqa: E402
+import requests                                # noqa: E402
+
+import http_cache                              # noqa: E402
+import http_client                             # noqa: E402
+from http_cache import CacheEintrag, ResponseCache  # noqa: E402
+from http_client import (                      # noqa: E402
+    PageSnapshot, fetch_homepage, fetch_url, get_session, hedge_schemes,
+    protokolliere, submit_mit_kontext,
+)
+
+
+class _Resp:
+    def __init__(self, url, body=b"<html>ok</html>", status=200, encoding="utf-8",
+                 headers=None):
+        self.url, self.content, self.status_code = url, body, status
+        self.encoding = encoding
+        self.headers = {"Content-Type": "text/html", **(headers or {})}
+        self.geschlossen = False
+
+    def iter_content(self, groesse):
+        for i in range(0, len(self.content), groesse):
+            yield self.content[i:i + groesse]
+
+    def close(self):
+        self.geschlossen = True
+
+
+def test_https_fehler_faellt_auf_http_zurueck(monkeypatch):
+    aufrufe = []
+
+    def fake_get(url, **_kw):
+        aufrufe.append(url)
+        if url.startswith("https://"):
+            raise requests.ConnectionError("TLS kaputt")
+        return _Resp(url)
+
+    monkeypatch.setattr(get_session(), "get", fake_get)
+    snap = fetch_homepage("example.at")
+    assert snap.ok
+    assert snap.final_url == "http://example.at/"
+    assert aufrufe == ["https://example.at/", "http://example.at/"]
+    assert snap.text == "<html>ok</html>"
+
+
+def test_beide_schemata_fehlgeschlagen_behaelt_letzten_status(monkeypatch):
+    monkeypatch.setattr(get_session(), "get",
+                        lambda url, **_kw: _Resp(url, b"", 503))
+    snap = fetch_homepage("example.at")
+    assert not snap.ok
+    assert snap.final_url is None
+    assert snap.status == 503
+
+
+def test_text_mit_unbekanntem_encoding_faellt_auf_utf8_zurueck():
+    snap = PageSnapshot(url="https://example.at/", final_url="https://example.at/",
+                        status=200, body="Kitzbühel".encode("utf-8"),
+                        encoding="x-gibt-es-nicht")
+    assert snap.text == "Kitzbühel"
+
+
+def test_session_ist_prozessweit_und_gepoolt():
+    s = get_session()
+    assert get_session() is s
+    adapter = s.get_adapter("https://example.at/")
+    assert adapter is s.get_adapter("http://example.at/")
+    assert adapter._pool_maxsize == http_client.POOL_PRO_HOST
+    # Ein POST (Mailversand) wird nie automatisch wiederholt
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+
+def _versuch_mit(dauern, ergebnisse):
+    def versuch(scheme, abbruch):
+        time.sleep(dauern[scheme])
+        return (scheme, ergebnisse[scheme], abbruch)
+    return versuch
+
+
+def _ok(r):
+    return r[1]
+
+
+def test_hedge_startet_http_wenn_https_haengt():
+    versuch = _versuch_mit({"https": 1.0, "http": 0.0}, {"https": True, "http": True})
+    t0 = time.monotonic()
+    gewinner, alle = hedge_schemes(versuch, _ok, delay=0.05)
+    assert time.monotonic() - t0 < 0.5
+    assert gewinner[0] == "http"
+    assert [r[0] for r in alle] == ["http"]
+
+
+def test_hedge_bevorzugt_https_innerhalb_der_nachfrist():
+    versuch = _versuch_mit({"https": 0.12, "http": 0.06}, {"https": True, "http": True})
+    gewinner, alle = hedge_schemes(versuch, _ok, delay=0.1)
+    assert gewinner[0] == "https"
+    assert not gewinner[2].is_set()
+
+
+def test_hedge_ohne_erfolg_liefert_beide_in_schema_reihenfolge():
+    versuch = _versuch_mit({"https": 0.2, "http": 0.0}, {"https": False, "http": False})
+    gewinner, alle = hedge_schemes(versuch, _ok, delay=0.05)
+    assert gewinner is None
+    assert [r[0] for r in alle] == ["https", "http"]
+
+
+def test_hedge_verlierer_gibt_seinen_worker_sofort_frei():
+    import socket
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *_a):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # Nimmt Verbindungen an, antwortet aber nie
+    haengt = socket.socket()
+    haengt.bind(("127.0.0.1", 0))
+    haengt.listen()
+    ziele = {"https": f"http://127.0.0.1:{haengt.getsockname()[1]}/",
+             "http": f"http://127.0.0.1:{server.server_address[1]}/"}
+    ende = {}
+
+    def versuch(scheme, abbruch):
+        try:
+            return fetch_url(ziele[scheme], timeout=10, abbruch=abbruch)
+        finally:
+            ende[scheme] = time.monotonic()
+
+    try:
+        gewinner, _ = hedge_schemes(versuch, lambda s: s.ok, delay=0.1)
+        entschieden = time.monotonic()
+        assert gewinner.final_url == ziele["http"]
+        for _ in range(100):
+            if "https" in ende:
+                break
+            time.sleep(0.02)
+        assert ende["https"] - entschieden < 1.0
+    finally:
+        server.shutdown()
+        haengt.close()
+
+
+def test_hedge_abgeschaltet_ist_seriell():
+    versuch = _versuch_mit({"https": 0.0, "http": 0.0}, {"https": True, "http": True})
+    gewinner, alle = hedge_schemes(versuch, _ok, delay=None)
+    assert gewinner[0] == "https" and len(alle) == 1
+
+
+def _cache_im(tmp_path, monkeypatch, max_bytes=1_000_000):
+    cache = ResponseCache(tmp_path / "cache", max_bytes)
+    monkeypatch.setattr(http_cache, "_cache", cache)
+    return cache
+
+
+def test_cache_revalidiert_und_liefert_304_von_platte(tmp_path, monkeypatch):
+    cache = _cache_im(tmp_path, monkeypatch)
+    gesendet = []
+
+    def fake_get(url, headers=None, **_kw):
+        gesendet.append(dict(headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return _Resp(url, b"", 304)
+        return _Resp(url, "User-agent: *\nDisallow:".encode(), headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(get_session(), "get", fake_get)
+    url = "https://example.at/robots.txt"
+    with protokolliere() as protokoll:
+        erst = fetch_url(url, cache=True)
+        zweit = fetch_url(url, cache=True)
+    assert erst.cache == "miss" and zweit.cache == "hit"
+    assert "If-None-Match" not in gesendet[0]
+    assert zweit.status == 200 and zweit.text == erst.text
+    zf = protokoll.zusammenfassung()
+    assert (zf["abrufe"], zf["cache_treffer"], zf["cache_fehlschlaege"]) == (2, 1, 1)
+    assert zf["bytes"] == len(erst.body)           # 304: kein Body übertragen
+    assert (cache.treffer, cache.fehlschlaege) == (1, 1)
+
+
+def test_304_ohne_gespeicherten_body_holt_unbedingt_nach(tmp_path, monkeypatch):
+    cache = _cache_im(tmp_path, monkeypatch)
+    gesendet = []
+
+    def fake_get(url, headers=None, **_kw):
+        gesendet.append(dict(headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return _Resp(url, b"", 304)
+        return _Resp(url, b"<html>Startseite</html>", headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(get_session(), "get", fake_get)
+    url = "https://example.at/"
+    fetch_url(url, cache=True)
+
+    nachschlagen = cache.lookup
+
+    def lookup_dann_verdraengt(u):
+        eintrag = nachschlagen(u)
+        cache._pfade(u)[1].unlink()
+        return eintrag
+
+    monkeypatch.setattr(cache, "lookup", lookup_dann_verdraengt)
+    snap = fetch_url(url, cache=True)
+    assert snap.status == 200 and snap.text == "<html>Startseite</html>"
+    assert snap.cache == "miss"
+    assert "If-None-Match" in gesendet[1] and "If-None-Match" not in gesendet[2]
+    assert len(gesendet) == 3
+
+
+def test_ohne_cache_flag_kein_bedingter_request(tmp_path, monkeypatch):
+    cache = _cache_im(tmp_path, monkeypatch)
+    cache.store(CacheEintrag(url="https://example.at/", final_url="https://example.at/",
+                             status=200, etag='"v1"'), b"alt")
+    gesendet = []
+    monkeypatch.setattr(get_session(), "get",
+                        lambda url, headers=None, **_kw: gesendet.append(headers) or _Resp(url))
+    snap = fetch_url("https://example.at/")
+    assert snap.cache is None and "If-None-Match" not in gesendet[0]
+
+
+def test_cache_verdraengt_am_laengsten_unbenutzte_eintraege(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=1_800)
+
+    def speichere(name):
+        url = f"https://{name}.at/"
+        cache.store(CacheEintrag(url=url, final_url=url, status=200, etag=f'"{name}"'),
+                    b"x" * 600)
+        return tmp_path / f"{cache._key(url)}.json"
+
+    for alter, name in enumerate(("a", "b")):
+        os.utime(speichere(name), (1000 + alter, 1000 + alter))
+    cache.body("https://a.at/")                  # a wieder benutzt -> b ist am ältesten
+    speichere("c")
+    assert cache.lookup("https://b.at/") is None
+    assert cache.lookup("https://a.at/") is not None
+    assert cache.lookup("https://c.at/") is not None
+    assert cache.statistik()["eintraege"] == 2
+
+
+def test_protokoll_erfasst_abrufe_aus_worker_threads(monkeypatch):
+    monkeypatch.setattr(get_session(), "get", lambda url, **_kw: _Resp(url))
+    with protokolliere() as protokoll, ThreadPoolExecutor(2) as pool:
+        submit_mit_kontext(pool, fetch_url, "https://example.at/a").result()
+        pool.submit(fetch_url, "https://example.at/b").result()   # ohne Kontext: nicht erfasst
+    assert [a.url for a in protokoll.abrufe] == ["https://example.at/a"]
+
+
+def test_endloser_stream_wird_beim_byte_limit_abgebrochen(tmp_path, monkeypatch):
+    class _Endlos(_Resp):
+        def iter_content(self, groesse):
+            while True:
+                yield b"x" * groesse
+
+    antwort = _Endlos("https://example.at/robots.txt", headers={"ETag": '"v1"'})
+    monkeypatch.setattr(get_session(), "get", lambda url, **_kw: antwort)
+    monkeypatch.setitem(http_client.MAX_BYTES, "robots", 100_000)
+    cache = _cache_im(tmp_path, monkeypatch)
+
+    snap = fetch_url("https://example.at/robots.txt", art="robots", cache=True)
+    assert snap.ok and snap.truncated
+    assert len(snap.body) == 100_000
+    assert antwort.geschlossen
+    assert cache.lookup("https://example.at/robots.txt") is None   # gekürzt: nicht gecacht
+
+
+def test_sniff_encoding_reihenfolge_bom_header_meta_probe():
+    from http_client import sniff_encoding
+    meta = b'<html><head><meta charset="windows-1252"></head>'
+    assert sniff_encoding(b"\xef\xbb\xbf<html>", "text/html; charset=iso-8859-1") == "utf-8-sig"
+    assert sniff_encoding(meta, "text/html; charset=UTF-8") == "utf-8"
+    assert sniff_encoding(meta, "text/html") == "cp1252"
+    assert sniff_encoding(b'<meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-1">') == "cp1252"
+    assert sniff_encoding("<p>Kitzbühel</p>".encode("utf-8")) == "utf-8"
+    assert sniff_encoding("<p>Kitzbühel</p>".encode("cp1252")) == "cp1252"
+    assert sniff_encoding(b"<p>x</p>", "text/html; charset=gibt-es-nicht") == "utf-8"
+
+
+def test_seite_ohne_charset_wird_nicht_als_latin1_gelesen(monkeypatch):
+    # requests nimmt für text/html ohne charset ISO-8859-1 an -> "KitzbÃ¼hel"
+    body = "<html><body>6370 Kitzbühel</body></html>".encode("utf-8")
+    monkeypatch.setattr(get_session(), "get", lambda url, **_kw: _Resp(url, body, encoding="ISO-8859-1"))
+    snap = fetch_url("https://example.at/")
+    assert snap.encoding == "utf-8"
+    assert "Kitzbühel" in snap.text
+
+
+def test_abgelaufenes_zeitbudget_ruft_nicht_mehr_ab(monkeypatch):
+    monkeypatch.setattr(get_session(), "get", lambda *_a, **_kw: pytest.fail("Abruf trotz Budget"))
+    snap = fetch_url("https://example.at/", deadline=time.monotonic() - 1)
+    assert snap.budget_exceeded and not snap.ok
+    assert snap.error == "Zeitbudget überschritten"
+
+
+def test_zeitbudget_kappt_den_timeout(monkeypatch):
+    gesehen = {}
+
+    def fake_get(url, timeout=None, **_kw):
+        gesehen["timeout"] = timeout
+        return _Resp(url, b"ok")
+    monkeypatch.setattr(get_session(), "get", fake_get)
+    fetch_url("https://example.at/", timeout=10, deadline=time.monotonic() + 2)
+    assert gesehen["timeout"] <= 2
+
+
+def test_timeout_wird_je_host_gelernt_und_begrenzt():
+    from host_latenz import LatenzStatistik
+    lat = LatenzStatistik(minimum=3)
+    assert lat.timeout("neu.at", 15) == 15             # ohne Messwert: Vorgabe
+    for _ in range(5):
+        lat.erfasse("cdn.at", ttfb=0.08, body_bytes=500_000, download=0.1)
+        lat.erfasse("langsam.at", ttfb=2.0)
+    assert lat.timeout("cdn.at", 15) == 3              # Untergrenze
+    assert 6 <= lat.timeout("langsam.at", 15) < 15     # langsam, aber lebendig
+    lat.erfasse("modem.at", ttfb=0.5, body_bytes=64 * 1024, download=16.0)
+    assert lat.timeout("modem.at", 15) == 15           # 4 KiB/s: Chunk-Zeit, gekappt
+
+
+def test_gelernter_timeout_verlaengert_nie_die_vorgabe():
+    from host_latenz import LatenzStatistik
+    lat = LatenzStatistik(minimum=3)
+    for _ in range(5):
+        lat.erfasse("langsam.at", ttfb=7.0)
+    assert lat.timeout("langsam.at", 5) == 5           # langsamer Host, knappe Vorgabe
+    assert lat.timeout("langsam.at", 60) < 60
+
+
+def test_gelernter_timeout_je_klasse_und_nie_unter_der_untergrenze():
+    from host_latenz import TIMEOUT_MIN, LatenzStatistik
+    lat = LatenzStatistik()
+    lat.erfasse("hotel.at", ttfb=0.05, klasse="robots")
+    assert lat.timeout("hotel.at", 15) == 15           # robots.txt sagt nichts über html
+    lat.erfasse("hotel.at", ttfb=1.0)                  # flotte Startseite
+    assert lat.timeout("hotel.at", 15) == TIMEOUT_MIN
+    assert lat.timeout("hotel.at", 4) == 4             # Vorgabe unter der Untergrenze
+    lat.erfasse("hotel.at", ttfb=2.5, klasse="sitemap")
+    assert lat.timeout("hotel.at", 15, klasse="sitemap") == 7.5   # 3 × TTFB
+
+
+def test_zeitueberschreitung_unter_gelerntem_timeout_sperrt_nicht(monkeypatch):
+    from host_latenz import LatenzStatistik
+    import circuit_breaker
+    import host_latenz
+    monkeypatch.setattr(host_latenz, "_latenz", LatenzStatistik(minimum=3))
+    breaker = circuit_breaker.CircuitBreaker(schwelle=1, sperrdauer=60)
+    monkeypatch.setattr(circuit_breaker, "_breaker", breaker)
+    antworten = iter([_Resp("https://langsam.at/", b"ok")])
+
+    def fake_get(url, timeout=None, **_kw):
+        for r in antworten:
+            return r
+        raise requests.ReadTimeout(f"Read timed out. (read timeout={timeout})")
+    monkeypatch.setattr(get_session(), "get", fake_get)
+    fetch_url("https://langsam.at/", timeout=15)
+    snap = fetch_url("https://langsam.at/faq", timeout=15)
+    assert "read timeout=3" in snap.error
+    assert breaker.gesperrt("https://langsam.at:443") is None
+    fetch_url("https://neu.at/", timeout=15)           # Vorgabe-Timeout: zählt
+    assert breaker.gesperrt("https://neu.at:443") is not None
+
+
+def test_fetch_url_nutzt_den_gelernten_timeout(monkeypatch):
+    from host_latenz import LatenzStatistik
+    import host_latenz
+    monkeypatch.setattr(host_latenz, "_latenz", LatenzStatistik(minimum=3))
+    gesehen = []
+
+    def fake_get(url, timeout=None, **_kw):
+        gesehen.append(timeout)
+        return _Resp(url, b"ok")
+    monkeypatch.setattr(get_session(), "get", fake_get)
+    fetch_url("https://schnell.at/", timeout=15)
+    fetch_url("https://schnell.at/faq", timeout=15)
+    assert gesehen == [15, 3]
+
+
+def test_zeitmessung_schluesselt_abruf_und_redirects_auf():
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/alt":
+                self.send_response(301)
+                self.send_header("Location", "/neu")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            time.sleep(0.1)                         # "Server-Denkzeit"
+            self.send_response(200)
+            self.send_header("Content-Length", "5")
+            self.end_headers()
+            self.wfile.write(b"hallo")
+
+        def log_message(self, *_a):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        snap = fetch_url(f"http://127.0.0.1:{server.server_port}/alt")
+    finally:
+        server.shutdown()
+    t = snap.timing
+    assert snap.ok and t.bytes == 5
+    assert [hop["status"] for hop in t.redirects] == [301]
+    assert t.warten >= 0.1 and t.ttfb >= t.warten
+    assert t.tls == 0.0                             # http: kein Handshake
+
+
+def test_redirect_cache_springt_direkt_zum_ziel(tmp_path, monkeypatch):
+    from datetime import timedelta
+    import redirect_cache
+    from redirect_cache import RedirectCache
+    monkeypatch.setattr(redirect_cache, "_redirects", RedirectCache(tmp_path / "r.json"))
+    angefragt = []
+
+    class _Hop:
+        def __init__(self, url, status):
+            self.url, self.status_code = url, status
+            self.elapsed = timedelta(seconds=0.05)
+
+    def fake_get(url, **_kw):
+        angefragt.append(url)
+        if url.startswith("https://www.example.at"):
+            return _Resp(url, b"ok")
+        ziel = "https://www.example.at" + url.split("example.at", 1)[1]
+        r = _Resp(ziel, b"ok")
+        r.history = [_Hop(url, 301)]
+        return r
+    monkeypatch.setattr(get_session(), "get", fake_get)
+
+    erst = fetch_url("http://example.at/")
+    zweit = fetch_url("http://example.at/robots.txt")
+    assert angefragt == ["http://example.at/", "https://www.example.at/robots.txt"]
+    assert zweit.url == "http://example.at/robots.txt"
+    assert zweit.final_url == "https://www.example.at/robots.txt"
+    assert zweit.timing.redirects == [
+        {"url": "http://example.at/", "status": 301, "dauer": 0.0, "cache": True}]
+    assert erst.timing.redirects[0]["dauer"] == 0.05
+    # überlebt einen Neustart (neue Instanz, gleiche Datei)
+    assert RedirectCache(tmp_path / "r.json").aufloesen("http://example.at/faq")[0] == \
+        "https://www.example.at/faq"
+
+
+def test_veraltete_umleitung_wird_vergessen_und_neu_verfolgt(tmp_path, monkeypatch):
+    from datetime import timedelta
+    import redirect_cache
+    from redirect_cache import RedirectCache
+    cache = RedirectCache(tmp_path / "r.json")
+    cache.merke("http://example.at/", "https://www.example.at/", [])
+    monkeypatch.setattr(redirect_cache, "_redirects", cache)
+    angefragt = []
+
+    class _Hop:
+        def __init__(self, url, status):
+            self.url, self.status_code = url, status
+            self.elapsed = timedelta(seconds=0.05)
+
+    def fake_get(url, **_kw):
+        angefragt.append(url)
+        if url.startswith("https://www.example.at"):
+            return _Resp(url, b"weg", 410)              # altes Ziel gibt es nicht mehr
+        if url.startswith("https://neu.example.at"):
+            return _Resp(url, b"ok")
+        r = _Resp("https://neu.example.at" + url.split("example.at", 1)[1], b"ok")
+        r.history = [_Hop(url, 301)]
+        return r
+    monkeypatch.setattr(get_session(), "get", fake_get)
+
+    snap = fetch_url("http://example.at/")
+    assert snap.status == 200 and snap.final_url == "https://neu.example.at/"
+    assert angefragt == ["https://www.example.at/", "http://example.at/"]
+    assert cache.aufloesen("http://example.at/faq")[0] == "https://neu.example.at/faq"
+
+
+def test_umleitung_gilt_nur_fuer_erfolg_am_gemerkten_ziel():
+    from redirect_cache import Umleitung
+    u = Umleitung(ziel="https://www.example.at")
+    assert u.bestaetigt(200, "https://www.example.at/de/")
+    assert u.bestaetigt(304, "https://www.example.at/")
+    assert not u.bestaetigt(404, "https://www.example.at/robots.txt")
+    assert not u.bestaetigt(503, "https://www.example.at/")
+    assert not u.bestaetigt(200, "https://example.at/")
+
+
+def test_redirect_cache_merkt_keine_pfad_umleitung():
+    from redirect_cache import RedirectCache
+    cache = RedirectCache()
+    cache.merke("https://example.at/", "https://www.example.at/de/", [])
+    assert cache.aufloesen("https://example.at/robots.txt") == ("https://example.at/robots.txt", None)
+
+
+def test_gzip_wird_entpackt_und_leitungsbytes_gezaehlt():
+    import gzip
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    html = ("<html><body>" + "<p>Zimmer mit Bergblick</p>" * 500 + "</body></html>").encode()
+    gepackt = gzip.compress(html)
+    gesehen = {}
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            gesehen["accept"] = self.headers.get("Accept-Encoding", "")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(gepackt)))
+            self.end_headers()
+            self.wfile.write(gepackt)
+
+        def log_message(self, *_a):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with protokolliere() as protokoll:
+            snap = fetch_url(f"http://127.0.0.1:{server.server_port}/")
+    finally:
+        server.shutdown()
+    assert "gzip" in gesehen["accept"]
+    assert snap.body == html
+    assert (snap.timing.kodierung, snap.timing.bytes, snap.timing.bytes_leitung) == \
+        ("gzip", len(html), len(gepackt))
+    zf = protokoll.zusammenfassung()
+    assert (zf["bytes"], zf["bytes_leitung"]) == (len(html), len(gepackt))
@@ -94,7 +94,7 @@ def test_brevo_hat_vorrang_und_sendet_beide_mails(monkeypatch):
         posts.append({"url": url, "json": json, "headers": headers})
         return FakeResponse()
 
-    monkeypatch.setattr(mailer.requests, "post", fake_post)
+    monkeypatch.setattr(mailer._brevo(), "post", fake_post)
     monkeypatch.setenv("BREVO_API_KEY", "xkeysib-test")
     monkeypatch.setenv("MAIL_FROM", "kontakt@gernot-riedel.com")
     for k in ("SMTP_HOST", "SMTP_USER", "SMTP_PASS"):
@@ -115,12 +115,19 @@ def test_brevo_hat_vorrang_und_sendet_beide_mails(monkeypatch):
     assert "VERKAUFSCHANCE" in an_gernot["json"]["textContent"]
 
 
+def test_brevo_nutzt_nicht_die_crawler_session():
+    from signals import get_session
+    assert mailer._brevo() is mailer._brevo()
+    assert mailer._brevo() is not get_session()
+    assert "GEO-Radar" not in mailer._brevo().headers["User-Agent"]
+
+
 def test_brevo_fehlerantwort_wird_gemeldet(monkeypatch):
     class FakeResponse:
         status_code = 401
         text = "Key not found"
 
-    monkeypatch.setattr(mailer.requests, "post",
+    monkeypatch.setattr(mailer._brevo(), "post",
                         lambda *a, **kw: FakeResponse())
     monkeypatch.setenv("BREVO_API_KEY", "falsch")
     monkeypatch.setenv("MAIL_FROM", "kontakt@gernot-riedel.com")
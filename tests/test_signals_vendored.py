@@ -54,6 +54,7 @@ def test_nicht_abrufbar_ist_unbekannt():
 
 import signal2_schema  # noqa: E402
 from signal2_schema import check_schema  # noqa: E402
+from http_client import PageSnapshot, get_session  # noqa: E402
 
 _STARTSEITE_MIT_FAQ_LINK = """<html><head>
 <script type="application/ld+json">
@@ -82,23 +83,443 @@ def test_evaluate_html_faqpage_extern_wird_uebernommen():
     assert "FAQPage auf /zimmer-preise/wissenswertes-faq/" in res.reason
 
 
-def test_check_schema_glocknerhof_regression(monkeypatch):
-    class _Resp:
-        def __init__(self, url, text, status=200):
-            self.url, self.text, self.status_code = url, text, status
+class _Resp:
+    def __init__(self, url, text, status=200):
+        self.url, self.status_code = url, status
+        self.content, self.encoding = text.encode("utf-8"), "utf-8"
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+
+    def iter_content(self, groesse):
+        for i in range(0, len(self.content), groesse):
+            yield self.content[i:i + groesse]
+
+    def close(self):
+        pass
 
-    def fake_fetch_html(domain, user_agent=None, timeout=None, **_kw):
-        return ("https://www.glocknerhof.at/", _STARTSEITE_MIT_FAQ_LINK, 200)
+
+def _fake_get(seiten, dauer=None, aufrufe=None):
+    """Fake-Session.get: liefert seiten[schluessel], wenn der Schlüssel in der URL steckt."""
+    import time
 
     def fake_get(url, **_kw):
-        if "wissenswertes-faq" in url:
-            return _Resp(url, _FAQ_UNTERSEITE)
+        if aufrufe is not None:
+            aufrufe.append(url)
+        for schluessel, html in seiten.items():
+            if schluessel in url:
+                if dauer:
+                    time.sleep(dauer.get(schluessel, 0))
+                return _Resp(url, html)
         return _Resp(url, "<html></html>", 404)
+    return fake_get
+
 
-    monkeypatch.setattr(signal2_schema, "_fetch_html", fake_fetch_html)
-    monkeypatch.setattr(signal2_schema.requests, "get", fake_get)
+def test_check_schema_glocknerhof_regression(monkeypatch):
+    monkeypatch.setattr(get_session(), "get", _fake_get({
+        "wissenswertes-faq": _FAQ_UNTERSEITE}))
 
-    res = check_schema("glocknerhof.at")
+    startseite = PageSnapshot(
+        url="https://glocknerhof.at/", final_url="https://www.glocknerhof.at/",
+        status=200, body=_STARTSEITE_MIT_FAQ_LINK.encode("utf-8"), encoding="utf-8")
+
+
+    res = check_schema("glocknerhof.at", snapshot=startseite)
     assert res.has_faqpage is True
     assert res.faqpage_quelle == "/zimmer-preise/wissenswertes-faq/"
     assert "keine FAQPage" not in res.reason
+
+
+def test_nicht_abrufbarer_snapshot_ist_unbekannt():
+    # Startseite einmal fehlgeschlagen -> Signal 2 und 3 melden UNBEKANNT,
+    # ohne selbst noch einmal zu laden.
+    import signal3_rendering
+    leer = PageSnapshot(url="https://example.at/", status=503)
+    assert check_schema("example.at", snapshot=leer).overall_status == "UNBEKANNT"
+    res3 = signal3_rendering.check_rendering("example.at", snapshot=leer)
+    assert res3.overall_status == "UNBEKANNT"
+    assert "letzter Status 503" in res3.fetch_error
+
+
+def test_faq_unterseiten_behalten_praeferenz_reihenfolge(monkeypatch):
+    # Der zweite Kandidat trifft schneller — gewinnen muss trotzdem der
+    # erste (echte Links vor Standard-Pfaden).
+    monkeypatch.setattr(get_session(), "get", _fake_get(
+        {"/link-faq": _FAQ_UNTERSEITE, "/faq": _FAQ_UNTERSEITE},
+        dauer={"/link-faq": 0.2}))
+    quelle, geprueft, _ = signal2_schema._pruefe_faq_unterseiten(
+        ["https://glocknerhof.at/link-faq/", "https://glocknerhof.at/faq"],
+        "glocknerhof.at", "Test", 5)
+    assert quelle == "/link-faq/"
+    assert geprueft == 1
+
+
+def test_faq_unterseiten_brechen_nach_treffer_ab(monkeypatch):
+    aufrufe = []
+    monkeypatch.setattr(signal2_schema, "_FAQ_PARALLEL_PRO_HOST", 1)
+    monkeypatch.setattr(get_session(), "get", _fake_get(
+        {"/faq": _FAQ_UNTERSEITE}, aufrufe=aufrufe))
+    quelle, _, _ = signal2_schema._pruefe_faq_unterseiten(
+        ["https://glocknerhof.at/faq", "https://glocknerhof.at/faqs",
+         "https://glocknerhof.at/fragen"],
+        "glocknerhof.at", "Test", 5)
+    assert quelle == "/faq"
+    assert aufrufe == ["https://glocknerhof.at/faq"]
+
+
+def test_gekuerzte_robots_txt_wertet_nur_vollstaendige_zeilen_aus(monkeypatch):
+    import http_client
+    from signal1_robots import check_robots
+    robots = "User-agent: *\nAllow: /\n" + "# Füllzeile\n" * 200 + "User-agent: GPTBot\nDisallow: /"
+    monkeypatch.setitem(http_client.MAX_BYTES, "robots", len(robots.encode()) - 20)
+    monkeypatch.setattr(get_session(), "get", _fake_get({"robots.txt": robots}))
+    res = check_robots("example.at")
+    assert res.truncated is True
+    # Die abgeschnittene GPTBot-Gruppe zählt nicht — nur der vollständige Anfang
+    assert res.global_block is False
+    assert all(b.allowed for b in res.bots)
+
+
+# ---------------------------------------------------------------------------
+# Rohbytes-Pfad: gleiche Befunde wie auf str (UTF-8 und windows-1252)
+# ---------------------------------------------------------------------------
+
+_KONTAKT_FAELLE = [
+    "Hotel Post, Bergstraße 12, 6370 Kitzbühel, Tel. +43 5356 12345",
+    "Adresse:\xa0Ölbergweg\xa03 – 5020\xa0Salzburg",
+    "„Überfuhrgasse 7“ 1010 Wien-Innere Stadt",
+    "Preis 6370 EUR, Telefon 0512/123 456",
+    "éBergweg 4 und x-weg 5; 12345 München- 4020 Linz-Urfahr",
+    "STRASSE 4, Seeufer 3, 9220 Velden am Wörther See, Fax 05356 62222-99",
+]
+
+
+# Bisherige Muster (unbegrenzt, über das ganze rohe HTML) als Referenz
+_KONTAKT_MUSTER_ALT = [
+    r'(?:\+|00)\d{1,3}[\s\-\/\.\(\)]{0,3}\d{1,5}[\s\-\/\.\(\)]{0,3}\d{2,}[\s\-\/\.\(\)]{0,3}\d{2,}',
+    r'\b0\d{2,4}[\s\-\/\.\(\)]{1,3}\d{3,}[\s\-\/\.\(\)]{0,3}\d{0,}',
+    r'(?i)\b[A-ZÄÖÜa-zäöüß\-]+(?:straße|strasse|str\.|weg|gasse|platz|allee|ring|ufer)\s+\d{1,4}\b',
+    r'(?:^|[^\d])(\d{4,5})\s+([A-ZÄÖÜ][A-Za-zäöüß\-]{2,30})\b',
+]
+
+
+def test_begrenzte_kontaktmuster_finden_dasselbe():
+    import re
+    import signal3_rendering as s3
+    neu = [s3.PHONE_INTERNATIONAL, s3.PHONE_DOMESTIC, s3.ADDRESS_STREET, s3.ADDRESS_PLZ_ORT]
+    for text in _KONTAKT_FAELLE + ["Kaiser-Franz-Josef-Straße 3", "Hauptstr.\t7a", "tel 0043535662222"]:
+        for alt, muster in zip(_KONTAKT_MUSTER_ALT, neu):
+            a, b = re.search(alt, text), muster.search(text)
+            assert (a and a.group(0)) == (b and b.group(0)), (text, alt)
+
+
+def test_kontaktsuche_nur_in_begrenzten_fenstern():
+    import signal3_rendering as s3
+    from dokument import ParsedDocument
+    seite = ("""<html><head><script>var tel = "+43 1 999 999", a = "Scriptweg 9";</script>
+<script type="application/ld+json">{"telephone": "+43 5356 62222"}</script></head>
+<body><img src="data:image/png;base64,MDUxMiAxMjM0NTY3" alt=""><p data-x="Attributgasse 5">Willkommen</p>
+<a href="tel:%2B43%205356%2062222"><svg></svg></a>
+<address>Hahnenkamm<b>straße</b> 12<br>6370 Kitzbühel</address></body></html>""")
+    fenster = list(ParsedDocument(seite).kontaktfenster())
+    assert fenster[:2] == ["+43 5356 62222", "Hahnenkammstraße 12 6370 Kitzbühel"]
+    assert not any("Scriptweg" in f or "Attributgasse" in f or "base64" in f for f in fenster)
+    assert s3._find_phone(fenster) == (True, "+43 5356 62222")
+    assert s3._find_address(fenster) == (True, "Hahnenkammstraße 12")
+
+
+def test_kontaktfenster_je_block_mit_inline_kindern():
+    import signal3_rendering as s3
+    from dokument import ParsedDocument
+
+    def fenster(html):
+        return list(ParsedDocument(html).kontaktfenster())
+    assert s3._find_phone(fenster("<div><p>Tel: +43 5356 <span>62222</span></p></div>")) == \
+        (True, "+43 5356 62222")
+    assert s3._find_address(fenster("<footer><p><b>6370</b> Kitzbühel</p></footer>")) == \
+        (True, "6370 Kitzbühel")
+    # Block-Grenzen trennen, Scripts dazwischen nicht
+    assert fenster("<ul><li>6370</li><li>Kitzbühel</li></ul>") == ["6370", "Kitzbühel"]
+    assert fenster("<p>Tel.<script>x()</script> 0512 <i>123</i>456</p>") == ["Tel. 0512 123456"]
+
+
+def test_kontaktfenster_bleiben_begrenzt():
+    import dokument
+    from dokument import ParsedDocument
+    seite = "<p>" + "<span>Zimmer mit Seeblick</span> und " * 5000 + "</p>"
+    fenster = list(ParsedDocument(seite).kontaktfenster())
+    assert len(fenster) > 1
+    assert max(map(len, fenster)) <= dokument.KONTAKTFENSTER_ZEICHEN
+
+
+def test_kontaktsuche_linear_bei_boesartigen_eingaben():
+    import time
+    import signal3_rendering as s3
+    for text in ("a-" * 50_000, "4" * 200_000, "+1 " * 50_000, "Weg" * 50_000 + " 1"):
+        start = time.perf_counter()
+        s3._find_address([text])
+        s3._find_phone([text])
+        assert time.perf_counter() - start < 1.0, text[:10]
+
+
+def test_evaluate_html_bytes_und_str_liefern_dasselbe():
+    import signal3_rendering as s3
+    seite = ("<html><body><p>" + " ".join(_KONTAKT_FAELLE) + "</p>"
+             + "<p>Zimmer mit Blick auf den Wilden Kaiser.</p>" * 40 + "</body></html>")
+    for encoding in ("utf-8", "cp1252"):
+        roh = seite.replace("„", '"').replace("“", '"').replace("–", "-").encode(encoding)
+        text = roh.decode(encoding)
+        a, b = s3.evaluate_html(text), s3.evaluate_html(roh, encoding=encoding)
+        assert (a.overall_status, a.visible_text_length, a.address_evidence, a.phone_evidence) == \
+               (b.overall_status, b.visible_text_length, b.address_evidence, b.phone_evidence)
+    roh = LODGING_OK.encode("utf-8")
+    assert evaluate_html(roh, encoding="utf-8").all_types == evaluate_html(LODGING_OK).all_types
+
+
+def test_evaluate_html_bytes_ohne_encoding_werden_erkannt():
+    import signal3_rendering as s3
+    res = s3.evaluate_html("<p>Bergstraße 12</p>".encode())
+    assert res.has_address is True and "Bergstraße" in res.address_evidence
+    assert s3.evaluate_html("<p>Bergstraße 12</p>".encode("cp1252")).has_address is True
+    assert evaluate_html(LODGING_OK.encode("utf-8")) == evaluate_html(LODGING_OK)
+
+
+def test_abgelaufenes_zeitbudget_ist_in_allen_signalen_unbekannt(monkeypatch):
+    import time
+    import signal3_rendering
+    from signal1_robots import check_robots
+    monkeypatch.setattr(get_session(), "get", _fake_get({}))
+    vorbei = time.monotonic() - 1
+    for check in (check_robots, check_schema, signal3_rendering.check_rendering):
+        res = check("example.at", deadline=vorbei)
+        assert res.overall_status == "UNBEKANNT"
+        assert res.reason == "Zeitbudget überschritten"
+
+
+def test_faq_suche_ueber_budget_behauptet_keine_fehlende_faqpage(monkeypatch):
+    import time
+    monkeypatch.setattr(get_session(), "get", _fake_get(
+        {"wissenswertes-faq": _FAQ_UNTERSEITE}, dauer={"wissenswertes-faq": 0.5}))
+    startseite = PageSnapshot(
+        url="https://glocknerhof.at/", final_url="https://www.glocknerhof.at/",
+        status=200, body=_STARTSEITE_MIT_FAQ_LINK.encode("utf-8"), encoding="utf-8")
+    res = check_schema("glocknerhof.at", snapshot=startseite, deadline=time.monotonic() + 0.1)
+    assert "keine FAQPage" not in res.reason
+    assert "Zeitbudget überschritten" in res.reason
+
+
+def test_sitemap_zeilen_der_robots_txt_werden_gesammelt():
+    from signal1_robots import evaluate_robots_text
+    robots = ("Sitemap: https://example.at/sitemap_index.xml\n"
+              "User-agent: *\nDisallow: /wp-admin/\n"
+              "sitemap: https://example.at/sitemap_index.xml\n"
+              "Sitemap: /relativ.xml\n"
+              "Sitemap: https://example.at/news-sitemap.xml # News\n")
+    res = evaluate_robots_text(robots, 200, "example.at")
+    assert res.sitemaps == ["https://example.at/sitemap_index.xml",
+                            "https://example.at/news-sitemap.xml"]
+    assert res.overall_status == "GRÜN"
+
+
+# Bisherige Tabelle (je Muster ein eigener Durchlauf) als Referenz
+_MARKER_EINZELN = [
+    (r'<div\s+[^>]*id=["\']root["\']', 'React/Vite #root-Anker'),
+    (r'<div\s+[^>]*id=["\']app["\']', 'Vue/Nuxt #app-Anker'),
+    (r'<div\s+[^>]*id=["\']__next["\']', 'Next.js __next-Anker'),
+    (r'<div\s+[^>]*id=["\']__nuxt["\']', 'Nuxt __nuxt-Anker'),
+    (r'\bdata-reactroot\b', 'React data-reactroot Attribut'),
+    (r'\bng-version\s*=', 'Angular ng-version Attribut'),
+    (r'\bng-app\s*=', 'AngularJS ng-app Attribut'),
+    (r'\bdata-v-[a-f0-9]{6,}', 'Vue.js data-v- Attribute'),
+]
+
+_MARKER_FAELLE = [
+    "",
+    '<div id="root"></div>',
+    "<DIV class='x' ID='app' data-v-7ba5bd90></DIV><div data-v-12345>kurz</div>",
+    '<div data-reactroot="" id="root"><div id="__next"></div></div>',
+    '<div id="__nuxt"><app-root ng-version = "17.0.1"></app-root>',
+    '<html ng-app="x"><p>xdata-reactroot data-reactrootx zng-app= ng-app</p>',
+    '<script>var s = "<div id=\'app\'>";</script><div id="apps">',
+    "<div\n  class=\"a-b\"\n  id=\"root\"\n>-data-v-abcdef0</div>",
+]
+
+
+def test_marker_scan_entspricht_den_einzelnen_mustern():
+    import re
+    import signal3_rendering as s3
+    for html in _MARKER_FAELLE:
+        for text in (html, html.encode("utf-8")):
+            erwartet = []
+            for muster, label in _MARKER_EINZELN:
+                if isinstance(text, bytes):
+                    muster = muster.encode("ascii")
+                # \s nur ASCII: "<div\xa0id=..." ist in HTML kein div mit id
+                if re.search(muster, text, re.IGNORECASE | re.ASCII):
+                    erwartet.append(label)
+            gefunden = s3._detect_framework_markers(text)
+            assert [m for m in gefunden if m in dict(_MARKER_EINZELN).values()] == erwartet, text
+
+
+def test_neue_marker_gatsby_astro_sveltekit():
+    import signal3_rendering as s3
+    html = ('<body data-sveltekit-preload-data="hover"><div id="___gatsby">'
+            '<astro-island uid="Z1" component-url="/x.js"></astro-island></div></body>')
+    assert s3._detect_framework_markers(html.encode("utf-8")) == [
+        "Gatsby ___gatsby-Anker", "Astro astro-island Element", "SvelteKit data-sveltekit Attribute"]
+
+
+def test_framework_marker_gelten_fuer_str_und_bytes():
+    # Vertrag der Marker-Tabelle: jede Zeile nur ASCII (auch als Byte-Muster)
+    import signal3_rendering as s3
+    for muster, label in s3.FRAMEWORK_MARKERS:
+        assert muster.isascii(), label
+    # str und Bytes bedeuten dasselbe — Leerraum in HTML ist ASCII-Leerraum
+    for html in ('<div\xa0id="root">', '<div id="root">', 'ädata-reactroot', '<p\u2003ng-app=1>'):
+        assert s3._detect_framework_markers(html) == \
+            s3._detect_framework_markers(html.encode("utf-8")), html
+
+
+_JSON_FAELLE = ['{"@type":"Hotel","name":"A"}', '{"a":NaN}', '{"a":"\\ud800"}', '[1,]',
+                '{"a":1} x', '{"a":"\t"}', '{"a":1,"a":2}', '{"@graph":[{"@type":"Event"}]}']
+
+
+def test_json_backends_liefern_dieselben_bloecke(monkeypatch):
+    from dokument import ParsedDocument
+    seite = "".join(f'<script type="application/ld+json">{b}</script>' for b in _JSON_FAELLE)
+    ergebnisse = []
+    for backend in ("json", "orjson"):
+        monkeypatch.setattr(signal2_schema, "JSON_BACKEND", backend)
+        ergebnisse.append(signal2_schema._extract_ld_blocks(ParsedDocument(seite)))
+    assert repr(ergebnisse[0]) == repr(ergebnisse[1])
+    assert ergebnisse[0][3] == (None, "JSONDecodeError: Expecting value (line 1)")
+
+
+def _graph(anzahl):
+    import json
+    return json.dumps({"@graph": [{"@type": "Event", "name": "x" * 100}] * anzahl})
+
+
+def test_zu_grosser_json_ld_block_wird_nicht_geparst(monkeypatch):
+    def kein_parse(*_a):
+        raise AssertionError("Block trotz Grenze geparst")
+    monkeypatch.setattr(signal2_schema, "MAX_LD_BLOCK_BYTES", 4 * 1024)
+    monkeypatch.setattr(signal2_schema, "_lade_json", kein_parse)
+    res = evaluate_html(f'<script type="application/ld+json">{_graph(50)}</script>')
+    assert res.parse_errors == ["Block zu groß: 6 KB (Grenze 4 KB je Block)"]
+    assert res.overall_status == "UNBEKANNT" and "zu groß für die Prüfung" in res.reason
+
+
+def test_json_ld_budget_je_seite(monkeypatch):
+    from dokument import ParsedDocument
+    monkeypatch.setattr(signal2_schema, "MAX_LD_SEITE_BYTES", 6 * 1024)
+    seite = f'<script type="application/ld+json">{_graph(20)}</script>' * 3 + LODGING_OK
+    fehler = [err for _, err in signal2_schema._extract_ld_blocks(ParsedDocument(seite))]
+    assert fehler == [None, None, "Block zu groß: 2 KB (Grenze 6 KB je Seite erreicht)", None]
+
+
+def _flatten_rekursiv(data, out):
+    """Bisherige rekursive Sammlung als Referenz für die Reihenfolge."""
+    if isinstance(data, list):
+        for item in data:
+            _flatten_rekursiv(item, out)
+    elif isinstance(data, dict):
+        if "@type" in data:
+            out.append(data)
+        for k, v in data.items():
+            if k != "@type" and isinstance(v, (dict, list)):
+                _flatten_rekursiv(v, out)
+    return out
+
+
+def test_entity_index_in_reihenfolge_der_rekursion():
+    import json
+    daten = [json.loads(WORDPRESS_GENERIC.split('json">')[1].split("</script>")[0]),
+             json.loads(LODGING_OK.split('json">')[1].split("</script>")[0]),
+             [{"@type": ["schema:Hotel", "http://schema.org/Resort"], "x": [[{"@type": "Hotel"}]]}]]
+    index = signal2_schema._build_entity_index(daten)
+    assert [id(e) for e in index.entities] == [id(e) for e in _flatten_rekursiv(daten, [])]
+    assert list(index.by_type)[:4] == ["WebPage", "ReadAction", "BreadcrumbList", "ListItem"]
+    assert [index.types_of(e) for e in index.with_types({"Resort", "Hotel"})] == [
+        ["Hotel"], ["Hotel", "Resort"], ["Hotel"]]
+
+
+def test_id_verweise_im_graph_werden_aufgeloest():
+    graph = """<script type="application/ld+json">{"@context":"https://schema.org","@graph":[
+ {"@type":"Hotel","@id":"#hotel","name":"Hotel Teststern","telephone":"+43 5356 12345",
+  "url":"https://example.at","address":{"@id":"#addr"},"geo":{"@id":"#geo","@type":"GeoCoordinates"},
+  "image":[{"@id":"#bild"}]},
+ {"@type":"PostalAddress","@id":"#addr","streetAddress":"Hauptstr. 1","addressLocality":"Kitzbühel"},
+ {"@type":"GeoCoordinates","@id":"#geo","latitude":47.4,"longitude":12.4},
+ {"@type":"ImageObject","@id":"#bild","url":"https://example.at/bild.jpg"},
+ {"@type":"WebPage","about":{"@id":"#hotel"}}]}</script>"""
+    res = evaluate_html(graph)
+    assert all(f.present for f in res.lodging.fields), res.lodging.fields
+    felder = {f.name: f.evidence for f in res.lodging.fields}
+    assert felder["address"] == "PostalAddress: Hauptstr. 1, Kitzbühel"
+    assert felder["geo"] == "lat=47.4, lng=12.4"
+
+
+def test_entity_index_grenzen(monkeypatch):
+    tief = {"@type": "Thing"}
+    for _ in range(200):
+        tief = {"@type": "Thing", "teil": tief}
+    monkeypatch.setattr(signal2_schema, "MAX_LD_TIEFE", 50)
+    index = signal2_schema._build_entity_index([tief, {"@type": "Hotel"}])
+    assert index.truncated and len(index.entities) == 52 and "Hotel" in index.by_type
+
+    monkeypatch.setattr(signal2_schema, "MAX_LD_ENTITAETEN", 10)
+    index = signal2_schema._build_entity_index([[{"@type": "Event"}] * 50])
+    assert index.truncated and len(index.entities) == 10
+
+    verschachtelt = '<script type="application/ld+json">' + "[" * 100_000 + "]" * 100_000
+    monkeypatch.setattr(signal2_schema, "JSON_BACKEND", "json")
+    res = evaluate_html(verschachtelt + "</script>")
+    assert res.parse_errors == ["RecursionError: Block zu tief verschachtelt"]
+
+
+def _gruppe_linear(bot_name, groups):
+    """Bisherige Suche: alle Gruppen und Agents je Bot durchlaufen."""
+    for agents, rules in groups:
+        for a in agents:
+            if a.lower() == bot_name.lower():
+                return agents, rules, a
+    return None
+
+
+def test_gruppen_index_entspricht_linearer_suche():
+    import signal1_robots
+    robots = ("User-agent: *\nDisallow: /intern/\n"
+              "User-agent: gptbot\nUser-agent: CCBot\nDisallow: /\n"
+              "User-agent: GPTBot\nAllow: /\n"
+              "User-agent: *\nDisallow: /\n"
+              + "".join(f"User-agent: Agent{i}\nDisallow: /x{i}/\n" for i in range(300)))
+    groups = signal1_robots._parse_groups(robots)
+    index = signal1_robots._gruppen_index(groups)
+    for name in ("GPTBot", "ccbot", "*", "Agent0", "AGENT299", "ClaudeBot"):
+        assert signal1_robots._find_group_for_bot(name, index) == _gruppe_linear(name, groups)
+    res = signal1_robots.evaluate_robots_text(robots, 200, "example.at")
+    assert res.global_block is False                 # erste *-Gruppe zählt
+    assert next(b for b in res.bots if b.name == "GPTBot").beleg == "User-agent: gptbot -> Disallow: /"
+
+
+def test_bot_klassen_aus_datei(monkeypatch, tmp_path):
+    import pytest
+    import signal1_robots
+    datei = Path(__file__).resolve().parents[1] / "signals" / "bots.json"
+    a, b = signal1_robots.lade_bot_klassen(datei)
+    # Vorgabe bleibt vorne, die Datei ergänzt nur
+    assert a[:len(signal1_robots.KLASSE_A_BOTS)] == signal1_robots.KLASSE_A_BOTS
+    assert b[:len(signal1_robots.KLASSE_B_BOTS)] == signal1_robots.KLASSE_B_BOTS
+    assert {"DuckAssistBot", "Meta-ExternalAgent", "Amazonbot"} <= set(a + b)
+
+    monkeypatch.setattr(signal1_robots, "KLASSE_A_BOTS", a)
+    monkeypatch.setattr(signal1_robots, "KLASSE_B_BOTS", b)
+    res = signal1_robots.evaluate_robots_text("User-agent: amazonbot\nDisallow: /\n", 200)
+    assert len(res.bots) == len(a) + len(b)
+    assert (res.overall_status, res.reason) == ("GELB", "Klasse-B blockiert: Amazonbot")
+
+    for inhalt in ('["GPTBot"]', '{"A": ["GPTBot"]}', '{"A": ["GPTBot"], "B": [""]}',
+                   '{"A": ["GPTBot"], "B": ["gptbot"]}'):
+        kaputt = tmp_path / "bots.json"
+        kaputt.write_text(inhalt, encoding="utf-8")
+        with pytest.raises(ValueError):
+            signal1_robots.lade_bot_klassen(kaputt)
@@ -0,0 +1,259 @@
+"""Tests für die ergänzenden Checkpunkte (zusatz_checks.py) — ohne Netz."""
+import sys
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import zusatz_checks                            # noqa: E402
+from signals import PageSnapshot, get_session   # noqa: E402
+from zusatz_checks import ANZAHL_ZUSATZ_CHECKS, build_checks, check_website  # noqa: E402
+
+STARTSEITE = """<!DOCTYPE html><html lang="de-AT"><head>
+<title>Hotel Teststern Kitzbühel</title>
+<meta name="description" content="4-Sterne-Hotel in Kitzbühel">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<meta property="og:title" content="Hotel Teststern">
+<meta property="og:description" content="Urlaub in Kitzbühel">
+<link rel="canonical" href="https://www.teststern.at/">
+</head><body><h1>Willkommen</h1>
+<a href="/zimmer">Zimmer</a><a href="/preise">Preise</a><a href="/kontakt">Kontakt</a>
+<img src="a.jpg" alt="Blick auf den Hahnenkamm"></body></html>"""
+
+
+def _ohne_sitemap(monkeypatch):
+    def _kein_netz(*_a, **_kw):
+        raise requests.ConnectionError("kein Netz im Test")
+    monkeypatch.setattr(get_session(), "get", _kein_netz)
+    monkeypatch.setattr(get_session(), "head", _kein_netz)
+
+
+def test_check_website_nutzt_geteilten_snapshot(monkeypatch):
+    _ohne_sitemap(monkeypatch)
+    def nur_sitemap(url, **kw):
+        assert "sitemap" in url, "doppelter Abruf der Startseite"
+        return PageSnapshot(url=url, final_url=url, status=404)
+    monkeypatch.setattr(zusatz_checks, "fetch_url", nur_sitemap)
+    snap = PageSnapshot(url="https://www.teststern.at/", final_url="https://www.teststern.at/",
+                        status=200, body=STARTSEITE.encode("utf-8"), encoding="utf-8",
+                        elapsed=0.8)
+    facts = check_website("https://www.teststern.at", snapshot=snap)
+    assert facts["load_time"] == 0.8 and facts["load_ok"] is True
+    assert facts["lang"] == "de-AT"
+    assert facts["page_title"] == "Hotel Teststern Kitzbühel"
+    assert facts["og_tags_found"] == ["og:title", "og:description"]
+    assert facts["internal_link_count"] == 3
+    assert len(build_checks(facts)) == ANZAHL_ZUSATZ_CHECKS
+
+
+def test_schema_org_auf_rohbytes_ohne_dekodieren(monkeypatch):
+    _ohne_sitemap(monkeypatch)
+    html = STARTSEITE.replace("</head>", '<link rel="x" href="https://SCHEMA.org/Hotel"></head>')
+    for encoding in ("utf-8", "utf-8-sig", "cp1252", "utf-16"):
+        for seite, erwartet in ((html, True), (STARTSEITE, False)):
+            snap = PageSnapshot(url="https://www.teststern.at/",
+                                final_url="https://www.teststern.at/", status=200,
+                                body=seite.encode(encoding),
+                                encoding=encoding, elapsed=0.5)
+            facts = check_website("https://www.teststern.at", snapshot=snap)
+            assert facts["schema_org"] is erwartet, encoding
+            assert ("text" in vars(snap)) is (encoding == "utf-16"), encoding
+
+
+def test_nicht_abrufbare_startseite_ist_nicht_messbar(monkeypatch):
+    _ohne_sitemap(monkeypatch)
+    snap = PageSnapshot(url="https://www.teststern.at/", status=503)
+    facts = check_website("https://www.teststern.at", snapshot=snap)
+    assert facts["load_time"] is None and facts["load_ok"] is False
+    assert facts["sitemap_exists"] is None             # Netzwerkfehler: nicht feststellbar
+    sitemap = next(c for c in build_checks(facts) if c["name"] == "sitemap.xml vorhanden")
+    assert sitemap["detail"] == "Nicht geprüft (Website antwortet nicht)"
+    assert facts["meta_desc_ok"] is False
+
+
+def test_ladezeit_nennt_die_bremsende_phase(monkeypatch):
+    _ohne_sitemap(monkeypatch)
+    from signals import Zeitmessung
+    snap = PageSnapshot(url="https://www.teststern.at/", final_url="https://www.teststern.at/",
+                        status=200, body=STARTSEITE.encode("utf-8"), encoding="utf-8",
+                        elapsed=4.2, timing=Zeitmessung(dns=0.01, verbindung=0.05, tls=0.1,
+                                                        ttfb=3.6, download=0.6, bytes=90_000))
+    facts = check_website("https://www.teststern.at", snapshot=snap)
+    assert facts["timing"]["warten"] == 3.44
+    ladezeit = next(c for c in build_checks(facts) if c["name"] == "Ladezeit unter 3 Sekunden")
+    assert ladezeit["detail"] == "4.2s (Server 3.4s · Download 0.6s · Verbindung 0.2s)"
+    assert ladezeit["howto"].startswith("Laut Messung wartet der Abruf 3.4s")
+
+
+def test_ladezeit_bei_cache_treffer_ohne_aufschluesselung(monkeypatch):
+    _ohne_sitemap(monkeypatch)
+    from signals import Zeitmessung
+    # 304: Ladezeit vom letzten vollen Abruf, Zeitmessung vom kurzen Austausch
+    snap = PageSnapshot(url="https://www.teststern.at/", final_url="https://www.teststern.at/",
+                        status=200, body=STARTSEITE.encode("utf-8"), encoding="utf-8",
+                        elapsed=4.2, cache="hit",
+                        timing=Zeitmessung(dns=0.01, ttfb=0.08, download=0.0))
+    facts = check_website("https://www.teststern.at", snapshot=snap)
+    assert facts["timing"] is None
+    ladezeit = next(c for c in build_checks(facts) if c["name"] == "Ladezeit unter 3 Sekunden")
+    assert ladezeit["detail"] == "4.2s (letzter vollständiger Abruf — Seite seither unverändert)"
+    assert not ladezeit["howto"].startswith("Laut Messung")
+
+
+class _Antwort:
+    def __init__(self, url, status=200, content_type="text/html", body=b""):
+        self.url, self.status_code, self.content = url, status, body
+        self.headers = {"Content-Type": content_type}
+
+    def iter_content(self, _n):
+        if self.content:
+            yield self.content
+
+    def close(self):
+        pass
+
+
+def _sitemap_server(monkeypatch, head, get=None):
+    """Fake-Session: head/get(url) -> _Antwort; protokolliert (Methode, URL, Range)."""
+    aufrufe = []
+
+    def _head(url, headers=None, **_kw):
+        aufrufe.append(("HEAD", url, None))
+        return head(url)
+
+    def _get(url, headers=None, **_kw):
+        aufrufe.append(("GET", url, (headers or {}).get("Range")))
+        return get(url)
+    monkeypatch.setattr(get_session(), "head", _head)
+    monkeypatch.setattr(get_session(), "get", _get)
+    return aufrufe
+
+
+def _fakten(sitemaps=None):
+    snap = PageSnapshot(url="https://www.teststern.at/", status=503)
+    return check_website("https://www.teststern.at", snapshot=snap, sitemaps=sitemaps)
+
+
+def test_sitemap_aus_robots_txt_per_head_ohne_download(monkeypatch):
+    aufrufe = _sitemap_server(monkeypatch, head=lambda url: _Antwort(
+        url, 200 if url.endswith("sitemap_index.xml") else 404, "application/xml; charset=UTF-8"))
+    facts = _fakten(["https://www.teststern.at/sitemap_index.xml"])
+    assert facts["sitemap_exists"] is True and facts["sitemap_quelle"] == "robots.txt"
+    assert aufrufe == [("HEAD", "https://www.teststern.at/sitemap_index.xml", None)]
+    sitemap = next(c for c in build_checks(facts) if c["name"] == "sitemap.xml vorhanden")
+    assert sitemap["detail"] == "Gefunden (laut robots.txt)"
+
+
+def test_yoast_index_ohne_head_support_per_range_probe(monkeypatch):
+    yoast = (b'<?xml version="1.0" encoding="UTF-8"?><?xml-stylesheet type="text/xsl" '
+             b'href="//www.teststern.at/main-sitemap.xsl"?>\n<sitemapindex xmlns="...">')
+    index = "https://www.teststern.at/sitemap_index.xml"    # Yoast leitet /sitemap.xml um
+    aufrufe = _sitemap_server(
+        monkeypatch, head=lambda url: _Antwort(url, 405),
+        get=lambda url: _Antwort(index, 206, "text/xml", yoast))
+    facts = _fakten()
+    assert facts["sitemap_exists"] is True
+    assert facts["sitemap_url"] == index
+    assert aufrufe == [("HEAD", "https://www.teststern.at/sitemap.xml", None),
+                       ("GET", "https://www.teststern.at/sitemap.xml", "bytes=0-2047")]
+
+
+def test_ohne_sitemap_genau_ein_head(monkeypatch):
+    aufrufe = _sitemap_server(monkeypatch, head=lambda url: _Antwort(url, 404))
+    facts = _fakten()
+    assert facts["sitemap_exists"] is False
+    assert aufrufe == [("HEAD", "https://www.teststern.at/sitemap.xml", None)]
+
+
+def test_serverfehler_ist_keine_fehlende_sitemap(monkeypatch):
+    _sitemap_server(monkeypatch, head=lambda url: _Antwort(url, 503))
+    assert _fakten()["sitemap_exists"] is None
+
+
+def test_soft_404_zaehlt_nicht_als_sitemap(monkeypatch):
+    html = b"<!DOCTYPE html><html><body>Seite nicht gefunden</body></html>"
+    _sitemap_server(monkeypatch, head=lambda url: _Antwort(url, 200),
+                    get=lambda url: _Antwort(url, 200, body=html))
+    facts = _fakten()
+    assert facts["sitemap_exists"] is False
+
+
+def _kompression(facts):
+    return next(c for c in build_checks(facts) if c["name"].startswith("Komprimierte Übertragung"))
+
+
+def test_unkomprimierte_startseite_ist_eigener_checkpunkt(monkeypatch):
+    _ohne_sitemap(monkeypatch)
+    from signals import Zeitmessung
+    body = STARTSEITE.encode("utf-8") * 40
+    roh = PageSnapshot(url="https://www.teststern.at/", final_url="https://www.teststern.at/",
+                       status=200, body=body, encoding="utf-8", elapsed=0.5,
+                       timing=Zeitmessung(bytes=len(body), bytes_leitung=len(body)))
+    check = _kompression(check_website("https://www.teststern.at", snapshot=roh))
+    assert check["ok"] is False and check["detail"] == f"Unkomprimiert ({len(body) // 1024} KB)"
+
+    gz = PageSnapshot(url=roh.url, final_url=roh.final_url, status=200, body=body,
+                      encoding="utf-8", elapsed=0.5, headers={"Content-Encoding": "gzip"},
+                      timing=Zeitmessung(bytes=len(body), bytes_leitung=3 * 1024, kodierung="gzip"))
+    check = _kompression(check_website("https://www.teststern.at", snapshot=gz))
+    assert check["ok"] is True and check["detail"] == f"gzip (3 KB statt {len(body) // 1024} KB)"
+
+
+def test_nicht_messbare_kompression_ist_neutral(monkeypatch):
+    _ohne_sitemap(monkeypatch)
+    fehler = PageSnapshot(url="https://www.teststern.at/", final_url="https://www.teststern.at/",
+                          status=503, body=b"", encoding="utf-8", elapsed=0.5)
+    check = _kompression(check_website("https://www.teststern.at", snapshot=fehler))
+    assert check["ok"] is None and check["detail"] == "Nicht messbar"
+
+
+# Fixture-Korpus für den Abgleich mit der früheren Regex-Kaskade
+# (tests/fakten_referenz.py): wohlgeformte Seiten, wie sie beide Wege lesen
+_KORPUS = [
+    STARTSEITE,
+    "",
+    "<html><body><p>Nur ein Satz ohne Kopf.</p></body></html>",
+    """<html lang="en"><head><meta content="Hotel by the lake" name="description">
+<meta content="noindex, nofollow" name="robots"><meta name="og:title" content="Lake">
+<meta content="Lake view" property="og:description"><meta content="x.jpg" property="og:image">
+<link rel="alternate" hreflang="de" href="/de/"><link rel="alternate" hreflang="de" href="/de/x">
+<link rel="alternate" hreflang="en" href="/"></head>
+<body><h1>Erste</h1><h1><span>Zweite</span> Überschrift</h1>
+<script>var zimmer = ["Doppelzimmer", "Suite"];</script><style>h1{color:red}</style>
+<!-- ein Kommentar mit vielen Wörtern darin -->
+<img src="a.jpg"><img src="b.jpg" alt=""><img src="c.jpg" alt="Seeblick"><IMG SRC="d.jpg" ALT="Steg">
+<a href="/a">A</a> <a href="/b#c">B</a> <a href="">leer</a> <a href="https://lake.example/x">X</a>
+<a href="https://anderswo.example/">Y</a> <a href="#oben">Z</a>
+<script type="application/ld+json">{"@type": "Hotel", "x": {"@type":"PostalAddress"}}</script>
+<script type="application/ld+json">{"@type":"FAQPage" kaputt</script>
+<p>Ein Text mit a b c Einzelbuchstaben und Wörtern.</p></body></html>""",
+]
+
+
+def test_fakten_entsprechen_der_regex_kaskade():
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from fakten_referenz import erzeuge_seite, fakten_regex
+    from signals import ParsedDocument
+
+    korpus = [s.encode("utf-8") for s in _KORPUS] + [erzeuge_seite(60), erzeuge_seite(400)]
+    for roh in korpus:
+        for netloc in ("www.teststern.at", "lake.example", "www.hotel-bergblick.at"):
+            neu = zusatz_checks._html_fakten(ParsedDocument(roh, "utf-8"), netloc)
+            assert neu == fakten_regex(roh.decode("utf-8"), netloc), (roh[:80], netloc)
+
+
+def test_fakten_lesen_markup_statt_zeichenketten():
+    from signals import ParsedDocument
+    seite = ("""<html><head><title>Hotel &amp; Spa</title><meta lang="de" name="description"
+content="Wellness &amp; Genuss"><link href="/" rel="canonical"></head><body>
+<h1>Bergblick</h1><img alt=Seeblick src=a.jpg>
+<script>document.write("<h1>kein Markup</h1><img src=x>")</script></body></html>""")
+    facts = zusatz_checks._html_fakten(ParsedDocument(seite.encode("utf-8"), "utf-8"),
+                                       "example.at")
+    # Entities aufgelöst, Attribut-Reihenfolge egal, Script-Inhalt kein Markup
+    assert facts["page_title"] == "Hotel & Spa"
+    assert facts["meta_desc"] == "Wellness & Genuss"
+    assert facts["canonical"] == "/"
+    assert (facts["h1_count"], facts["h1_ok"]) == (1, True)
+    assert (facts["img_total"], facts["img_with_alt"]) == (1, 1)
@@ -0,0 +1,457 @@
+"""
+Ergänzende technische Checkpunkte des GEO-Readiness-Checkers.
+
+Von der Streamlit-App getrennt, damit die Logik ohne Streamlit testbar ist.
+Die Kernprüfungen (robots.txt/KI-Bots, Schema.org, Textsubstanz) laufen
+über die Signal-Module 1-3 (Ordner signals/); hier stehen nur die 15
+Zusatz-Checks, bewertet als bestanden/nicht bestanden.
+"""
+from __future__ import annotations
+
+import re
+from typing import Optional
+from urllib.parse import urlparse
+
+from signals import ZEITBUDGET_UEBERSCHRITTEN, PageSnapshot, ParsedDocument, fetch_url
+
+# Obergrenzen je Abruf — innerhalb eines Zeitbudgets (deadline) gilt die
+# kleinere der beiden Zeiten.
+SITEMAP_TIMEOUT = 5
+STARTSEITE_TIMEOUT = 10
+
+# Sitemap-Suche: nach den Sitemap:-Zeilen der robots.txt nur /sitemap.xml —
+# WordPress-Kern, Yoast und Rank Math leiten von dort auf ihren Index um.
+# Geprüft wird per HEAD; nur wenn der Server HEAD nicht kann (405/501), mit
+# den ersten SITEMAP_PROBE_BYTES — nie die ganze Datei.
+SITEMAP_PFAD = "/sitemap.xml"
+SITEMAP_PROBE_BYTES = 2048
+_SITEMAP_ACCEPT = "application/xml, text/xml, */*;q=0.1"
+# @type-Werte in einem JSON-LD-Block (ohne JSON-Parse, auch in kaputten Blöcken)
+_JSONLD_TYP = re.compile(r'"@type"\s*:\s*"([^"]+)"')
+_SCHEMA_ORG = re.compile(rb"schema\.org", re.I)
+
+
+# ══════════════════════════════════════════════════════
+# TECHNISCHE MESSUNG
+# ══════════════════════════════════════════════════════
+
+def _ist_sitemap(anfang: bytes) -> bool:
+    """Anfang einer Sitemap (XML-urlset/sitemapindex oder .xml.gz)?"""
+    kopf = anfang[:SITEMAP_PROBE_BYTES].lower()
+    return kopf.startswith(b"\x1f\x8b") or b"<urlset" in kopf or b"<sitemapindex" in kopf
+
+
+def _pruefe_sitemap(url: str, deadline: Optional[float]) -> tuple[Optional[bool], PageSnapshot]:
+    """
+    (vorhanden?, letzter Snapshot) für EINE Sitemap-URL. None = nicht
+    feststellbar (Netzwerkfehler, Serverfehler, Zeitbudget, Host gesperrt).
+    Ein HEAD; die ersten Bytes nur, wenn der Server HEAD ablehnt (405/501).
+    Ein HTML-Dokument mit 200 ist eine Soft-404, keine Sitemap.
+    """
+    probe = fetch_url(url, timeout=SITEMAP_TIMEOUT, accept=_SITEMAP_ACCEPT,
+                      methode="HEAD", deadline=deadline)
+    if probe.status in (405, 501):
+        probe = fetch_url(url, timeout=SITEMAP_TIMEOUT, accept=_SITEMAP_ACCEPT, art="sitemap",
+                          bereich=SITEMAP_PROBE_BYTES, deadline=deadline)
+        if probe.status in (200, 206):
+            return _ist_sitemap(probe.body), probe
+    if probe.status is None or probe.status >= 500:
+        return None, probe
+    if probe.ok:
+        return "html" not in probe.headers.get("Content-Type", "").lower(), probe
+    return False, probe
+
+
+def _erwaehnt_schema_org(snapshot: PageSnapshot) -> bool:
+    """
+    "schema.org" irgendwo im HTML, Groß-/Kleinschreibung egal — direkt auf
+    den Rohbytes, ohne die Seite zu dekodieren. Gilt für alle Zeichensätze,
+    die ASCII als ASCII-Bytes schreiben (UTF-8, cp1252, ISO-8859-x); sonst
+    (UTF-16) über den dekodierten Text.
+    """
+    if "schema.org".encode(snapshot.encoding or "utf-8").endswith(b"schema.org"):
+        return _SCHEMA_ORG.search(snapshot.body) is not None
+    return "schema.org" in snapshot.text.lower()
+
+
+def _html_fakten(dokument: ParsedDocument, netloc: str) -> dict:
+    """
+    Fakten aus dem Startseiten-HTML: Kopfdaten und Seitenstruktur entstehen
+    in einem Durchgang über den geparsten Baum (dokument.py), JSON-LD kommt
+    aus dokument.ld_json. netloc: Host der Website, für interne Links.
+    """
+    kopf, struktur = dokument.kopf, dokument.struktur
+    facts: dict = {}
+
+    # Meta-Description
+    facts["meta_desc"] = kopf.meta.get("description", "")
+    facts["meta_desc_ok"] = bool(facts["meta_desc"])
+
+    # Viewport
+    facts["viewport"] = "viewport" in kopf.meta
+
+    # lang=
+    facts["lang"]    = kopf.sprache
+    facts["lang_ok"] = bool(facts["lang"])
+
+    # Page Title
+    facts["page_title"] = kopf.titel
+    facts["title_ok"]   = bool(facts["page_title"])
+
+    # Canonical
+    facts["canonical"]    = kopf.canonical
+    facts["canonical_ok"] = bool(facts["canonical"])
+
+    # ─── NEW GEO & KI CHECKS ───
+
+    # Open Graph Tags (og:title, og:description, og:image)
+    og_parts = [og for og in ("og:title", "og:description", "og:image") if og in kopf.meta]
+    facts["og_tags_found"] = og_parts
+    facts["og_ok"] = len(og_parts) >= 2  # At least title + description
+
+    # H1 Heading
+    facts["h1_count"] = len(struktur.h1)
+    facts["h1_text"] = struktur.h1[0] if struktur.h1 else ""
+    facts["h1_ok"] = len(struktur.h1) == 1 and bool(facts["h1_text"])
+
+    # Image Alt Texts
+    facts["img_total"] = struktur.bilder
+    facts["img_with_alt"] = struktur.bilder_mit_alt
+    facts["img_alt_pct"] = (round(struktur.bilder_mit_alt / struktur.bilder * 100)
+                            if struktur.bilder else 100)
+    facts["img_alt_ok"] = facts["img_alt_pct"] >= 80
+
+    # JSON-LD Structured Data (preferred by AI engines over microdata/RDFa)
+    jsonld_blocks = dokument.ld_json
+    facts["jsonld_count"] = len(jsonld_blocks)
+    facts["jsonld_ok"] = len(jsonld_blocks) > 0
+    # Detect schema types in JSON-LD
+    facts["jsonld_types"] = [t for block in jsonld_blocks for t in _JSONLD_TYP.findall(block)]
+
+    # Sufficient Text Content (word count)
+    facts["word_count"] = struktur.woerter
+    facts["content_ok"] = struktur.woerter >= 300
+
+    # Meta Robots / Indexability
+    robots_content = kopf.meta.get("robots", "").lower()
+    facts["meta_robots"] = robots_content
+    facts["noindex"] = "noindex" in robots_content
+    facts["nofollow"] = "nofollow" in robots_content
+    facts["indexable_ok"] = not facts["noindex"]
+
+    # Hreflang Tags (multilingual / international targeting)
+    facts["hreflang_langs"] = sorted(set(struktur.hreflang))
+    facts["hreflang_ok"] = len(struktur.hreflang) > 0
+
+    # Internal Links (ohne Sprungmarken und leere href)
+    internal_links = [l for l in struktur.links if l and "#" not in l
+                      and (l.startswith("/") or netloc in l)]
+    facts["internal_link_count"] = len(internal_links)
+    facts["internal_links_ok"] = len(internal_links) >= 3
+    return facts
+
+
+def check_website(url: str, snapshot: Optional[PageSnapshot] = None,
+                  deadline: Optional[float] = None,
+                  sitemaps: Optional[list[str]] = None) -> dict:
+    """
+    Misst die ergänzenden technischen Faktoren direkt und verifizierbar.
+    robots.txt/KI-Bots, Schema.org/JSON-LD und Textsubstanz werden NICHT mehr
+    hier geprüft — das übernehmen die Signal-Module 1-3 (Ordner signals/).
+
+    snapshot: die bereits für Signal 2/3 geholte Startseite — dann wird sie
+    nicht ein drittes Mal geladen. Ohne snapshot wird `url` selbst geholt.
+    deadline: Ende des Zeitbudgets (time.monotonic()). Was bis dahin nicht
+    gemessen ist, steht als None in den Fakten und in facts["zeitbudget"].
+    sitemaps: Sitemap-URLs aus der robots.txt (RobotsResult.sitemaps) —
+    werden vor den Standardpfaden geprüft.
+    """
+    parsed = urlparse(url)
+    base   = f"{parsed.scheme}://{parsed.netloc}"
+    facts  = {"https": parsed.scheme == "https", "zeitbudget": []}
+
+    # Sitemap: erst die aus der robots.txt, dann /sitemap.xml — Schluss beim
+    # ersten Fund oder sobald eine Antwort nicht feststellbar ist
+    kandidaten = [(u, "robots.txt") for u in (sitemaps or [])]
+    if base + SITEMAP_PFAD not in (sitemaps or []):
+        kandidaten.append((base + SITEMAP_PFAD, "Standardpfad"))
+    facts["sitemap_exists"], facts["sitemap_url"], facts["sitemap_quelle"] = False, "", ""
+    for kandidat, quelle in kandidaten:
+        vorhanden, probe = _pruefe_sitemap(kandidat, deadline)
+        if vorhanden is None:
+            facts["sitemap_exists"] = None
+            if probe.budget_exceeded:
+                facts["zeitbudget"].append("sitemap")
+            else:
+                # Keine verwertbare Antwort — "nicht gefunden" wäre geraten
+                facts["sitemap_unerreichbar"] = True
+            break
+        if vorhanden:
+            facts["sitemap_exists"] = True
+            facts["sitemap_url"] = probe.final_url or kandidat
+            facts["sitemap_quelle"] = quelle
+            break
+
+    # Ladezeit + HTML (aus dem gemeinsamen Startseiten-Snapshot)
+    if snapshot is None:
+        snapshot = fetch_url(url, timeout=STARTSEITE_TIMEOUT, deadline=deadline)
+    if snapshot.budget_exceeded:
+        facts["zeitbudget"].append("startseite")
+    # Aufschlüsselung der Ladezeit (DNS, TCP, TLS, Warten, Download, Redirects).
+    # Bei einem Cache-Treffer stammt sie vom kurzen 304-Austausch, die Ladezeit
+    # aber vom letzten vollständigen Abruf — dann keine Aufschlüsselung.
+    facts["ladezeit_aus_cache"] = snapshot.cache == "hit"
+    facts["timing"] = (snapshot.timing.als_dict()
+                       if snapshot.timing is not None and snapshot.cache != "hit" else None)
+    if snapshot.ok:
+        facts["load_time"] = snapshot.elapsed
+        facts["load_ok"]   = snapshot.elapsed < 3.0
+        facts["html_truncated"] = snapshot.truncated
+    else:
+        facts["load_time"] = None
+        facts["load_ok"]   = False
+
+    # Kompression der Startseite (Content-Encoding — bei einem Cache-Treffer
+    # aus den gespeicherten Headern des letzten vollständigen Abrufs)
+    if snapshot.ok:
+        facts["kompression"] = snapshot.headers.get("Content-Encoding", "").strip().lower()
+        facts["html_bytes"] = len(snapshot.body)
+        facts["html_bytes_leitung"] = (snapshot.timing.bytes_leitung
+                                       if snapshot.timing is not None and snapshot.cache != "hit"
+                                       else None)
+    else:
+        facts["kompression"] = None
+
+    # Schema.org
+    facts["schema_org"] = snapshot.ok and _erwaehnt_schema_org(snapshot)
+
+    # HTML-Fakten aus dem gemeinsamen Parse (PageSnapshot.dokument)
+    facts.update(_html_fakten(snapshot.dokument if snapshot.ok else ParsedDocument(""),
+                              parsed.netloc))
+    return facts
+
+
+def _ladezeit_befund(facts: dict) -> tuple[str, str]:
+    """
+    (Zusatz zum Detail, Einleitung für den howto-Text) aus facts["timing"]:
+    welche Phase der Ladezeit am meisten kostet. Ohne Messung beides leer;
+    bei einem Cache-Treffer nur der Hinweis auf den letzten vollen Abruf.
+    """
+    if facts.get("ladezeit_aus_cache") and facts.get("load_time"):
+        return " (letzter vollständiger Abruf — Seite seither unverändert)", ""
+    t = facts.get("timing")
+    if not t or not facts.get("load_time"):
+        return "", ""
+    aufbau = t["dns"] + t["verbindung"] + t["tls"]
+    teile = [f"Server {t['warten']:.1f}s", f"Download {t['download']:.1f}s",
+             f"Verbindung {aufbau:.1f}s"]
+    if t["redirects"]:
+        teile.append(f"{len(t['redirects'])} Weiterleitung(en)")
+    phase, dauer = max((("warten", t["warten"]), ("download", t["download"]),
+                        ("aufbau", aufbau)), key=lambda p: p[1])
+    if phase == "warten":
+        einleitung = (f"Laut Messung wartet der Abruf {dauer:.1f}s auf die erste Antwort Ihres "
+                      "Servers — hier helfen vor allem Caching und ein leistungsfähigeres Hosting. ")
+    elif phase == "download":
+        einleitung = (f"Laut Messung dauert die Übertragung der Seite ({t['bytes'] // 1024} KB) "
+                      f"{dauer:.1f}s — die Seite selbst ist zu groß. ")
+    else:
+        einleitung = (f"Laut Messung kostet allein der Verbindungsaufbau (DNS, TCP, TLS) "
+                      f"{dauer:.1f}s — sprechen Sie Ihren Webhoster darauf an. ")
+    return f" ({' · '.join(teile)})", einleitung
+
+
+def build_checks(facts: dict) -> list:
+    """
+    Erstellt die 15 ergänzenden Checkpunkte mit Ergebnis und Quick-Win-Hinweis.
+
+    Die Kernprüfungen (robots.txt/KI-Bots, Schema.org/JSON-LD, Textsubstanz)
+    laufen NICHT mehr hier, sondern über die gemeinsamen Signal-Module 1-3
+    aus dem geo-radar (Ordner signals/) — mit Ampel-Logik statt Punkten.
+    """
+    # Image alt text detail
+    img_total = facts.get("img_total", 0)
+    img_alt   = facts.get("img_with_alt", 0)
+    img_pct   = facts.get("img_alt_pct", 100)
+
+    # OG tags detail
+    og_found = facts.get("og_tags_found", [])
+
+    # Ladezeit: welche Phase bremst
+    ladezeit_detail, ladezeit_einleitung = _ladezeit_befund(facts)
+
+    # Kompression
+    kompression = facts.get("kompression")
+    html_kb = facts.get("html_bytes", 0) // 1024
+    if kompression is None:
+        kompression_detail = "Nicht messbar"
+    elif kompression:
+        leitung = facts.get("html_bytes_leitung")
+        kompression_detail = (f"{kompression} ({leitung // 1024} KB statt {html_kb} KB)"
+                              if leitung else kompression)
+    else:
+        kompression_detail = f"Unkomprimiert ({html_kb} KB)"
+
+    return [
+        # ── SECTION: Technische Basis ──
+        {
+            "name":     "HTTPS-Verschlüsselung",
+            "ok":       facts.get("https", False),
+            "detail":   "Aktiv" if facts.get("https") else "Nicht aktiv",
+            "quickwin": "HTTPS aktivieren — Pflicht für jede moderne Website und Vertrauenssignal für KI-Systeme.",
+            "howto":    "Kontaktieren Sie Ihren Webhoster (z.B. World4You, All-Inkl, Strato) und fragen Sie nach einem kostenlosen SSL-Zertifikat (Let's Encrypt). Die meisten Hoster aktivieren das per Klick im Kundenmenü. Bei WordPress-Seiten danach unter Einstellungen → Allgemein die URL auf https:// ändern.",
+            "impact":   "Sicherheit & Vertrauen",
+            "category": "Technische Basis",
+        },
+        {
+            "name":     "Ladezeit unter 3 Sekunden",
+            "ok":       facts.get("load_ok", False),
+            "detail":   (f"{facts['load_time']}s{ladezeit_detail}" if facts.get("load_time") else
+                         f"Nicht messbar ({ZEITBUDGET_UEBERSCHRITTEN})"
+                         if "startseite" in facts.get("zeitbudget", ()) else "Nicht messbar")
+                        + (" — Seite über dem Prüf-Limit, nur der Anfang ausgewertet"
+                           if facts.get("html_truncated") else ""),
+            "quickwin": f"Ladezeit optimieren (aktuell {facts.get('load_time','?')}s) — KI-Crawler bevorzugen schnell ladende Seiten.",
+            "howto":    ladezeit_einleitung + "Die häufigsten Ursachen für langsame Seiten: (1) Bilder komprimieren — laden Sie Ihre Bilder auf tinypng.com hoch und ersetzen Sie die Originale. (2) Bei WordPress: ein Caching-Plugin installieren (z.B. WP Super Cache oder LiteSpeed Cache). (3) Prüfen Sie, ob Ihr Hosting-Paket ausreichend Leistung hat — bei sehr günstigen Paketen kann ein Upgrade auf SSD-Hosting helfen.",
+            "impact":   "Crawlbarkeit & User Experience",
+            "category": "Technische Basis",
+        },
+        {
+            "name":     "Komprimierte Übertragung (gzip/Brotli)",
+            "ok":       None if kompression is None else bool(kompression),
+            "detail":   kompression_detail,
+            "quickwin": "Kompression aktivieren — Ihre Startseite wird unkomprimiert ausgeliefert und braucht dadurch ein Vielfaches an Übertragungszeit.",
+            "howto":    "Kompression ist eine Server-Einstellung, keine Änderung an Ihrer Website. Bitten Sie Ihren Webhoster, gzip oder Brotli für HTML, CSS und JavaScript zu aktivieren — bei den meisten Hostern ist das ein Schalter im Kundenmenü. Bei Apache-Servern genügt oft ein Eintrag in der .htaccess (mod_deflate), bei WordPress erledigen Caching-Plugins wie WP Rocket oder LiteSpeed Cache das mit. Typische Ersparnis: 70–80 % der Datenmenge.",
+            "impact":   "Ladezeit & Crawl-Effizienz",
+            "category": "Technische Basis",
+        },
+        {
+            "name":     "Mobile Viewport-Tag",
+            "ok":       facts.get("viewport", False),
+            "detail":   "Vorhanden" if facts.get("viewport") else "Fehlt",
+            "quickwin": "Viewport-Tag fehlt — Ihre Seite wird auf Smartphones nicht korrekt dargestellt.",
+            "howto":    "Ihr Webentwickler muss eine Zeile im HTML-Kopfbereich (Head) ergänzen: <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">. Bei WordPress-Themes ist das normalerweise automatisch enthalten — prüfen Sie, ob Ihr Theme aktuell ist. Falls Sie einen Baukastensystem wie Jimdo oder Wix nutzen, ist es meist automatisch gesetzt.",
+            "impact":   "Mobile Sichtbarkeit",
+            "category": "Technische Basis",
+        },
+        {
+            "name":     "Indexierbarkeit (Meta Robots)",
+            "ok":       facts.get("indexable_ok", True),
+            "detail":   "Indexierung erlaubt" if facts.get("indexable_ok", True) else f"BLOCKIERT — {facts.get('meta_robots', '')}",
+            "quickwin": "ACHTUNG: Ihre Seite blockiert aktiv die Indexierung! Suchmaschinen UND KI-Systeme dürfen Ihre Seite nicht anzeigen.",
+            "howto":    "Das passiert oft, wenn die Website nach einem Relaunch versehentlich auf 'noindex' steht. Bei WordPress: Gehen Sie zu Einstellungen → Lesen und deaktivieren Sie 'Suchmaschinen davon abhalten, diese Website zu indexieren'. Bei anderen Systemen: Bitten Sie Ihren Webentwickler, den noindex-Tag aus dem HTML-Head zu entfernen. Das ist die wichtigste Maßnahme — ohne diese Änderung sind alle anderen Optimierungen wirkungslos!",
+            "impact":   "Sichtbarkeit — kritisch",
+            "category": "Technische Basis",
+        },
+        # ── SECTION: Crawlbarkeit & Indexierung ──
+        # (robots.txt/KI-Bots wird jetzt von Signal 1 geprüft — siehe Ampel oben)
+        {
+            "name":     "sitemap.xml vorhanden",
+            "ok":       facts.get("sitemap_exists", False),
+            "detail":   (("Gefunden" + (" (laut robots.txt)" if facts.get("sitemap_quelle") == "robots.txt"
+                                         else "")) if facts.get("sitemap_exists") else
+                         "Nicht gefunden" if facts.get("sitemap_exists") is not None else
+                         "Nicht geprüft (Website antwortet nicht)" if facts.get("sitemap_unerreichbar") else
+                         f"Nicht geprüft ({ZEITBUDGET_UEBERSCHRITTEN})"),
+            "quickwin": "sitemap.xml erstellen — das ist wie ein Inhaltsverzeichnis Ihrer Website für KI-Crawler.",
+            "howto":    "Bei WordPress: Installieren Sie das Plugin 'Yoast SEO' oder 'Rank Math' — beide erstellen automatisch eine Sitemap unter IhreWebsite.at/sitemap.xml. Bei anderen Systemen: Nutzen Sie xml-sitemaps.com, um kostenlos eine Sitemap zu erzeugen, und laden Sie die Datei ins Hauptverzeichnis Ihrer Website hoch. Danach in der robots.txt ergänzen: Sitemap: https://www.ihre-website.at/sitemap.xml",
+            "impact":   "Vollständige Indexierung",
+            "category": "Crawlbarkeit & Indexierung",
+        },
+        {
+            "name":     "Canonical Tag gesetzt",
+            "ok":       facts.get("canonical_ok", False),
+            "detail":   "Vorhanden" if facts.get("canonical_ok") else "Fehlt",
+            "quickwin": "Canonical Tag ergänzen — das verhindert, dass KI-Systeme Ihre Inhalte doppelt oder falsch zuordnen.",
+            "howto":    "Der Canonical Tag sagt Suchmaschinen und KI: 'Das ist die Original-Adresse dieser Seite.' Bei WordPress: Yoast SEO oder Rank Math setzen diesen Tag automatisch. Bei anderen Systemen: Ihr Webentwickler muss im HTML-Head jeder Seite ergänzen: <link rel=\"canonical\" href=\"https://www.ihre-website.at/aktuelle-seite/\">. Die URL muss jeweils die aktuelle Seitenadresse sein.",
+            "impact":   "Technische SEO & KI-Indexierung",
+            "category": "Crawlbarkeit & Indexierung",
+        },
+        {
+            "name":     "Interne Verlinkung (min. 3 Links)",
+            "ok":       facts.get("internal_links_ok", False),
+            "detail":   f'{facts.get("internal_link_count", 0)} interne Links gefunden' if facts.get("internal_links_ok") else f'Nur {facts.get("internal_link_count", 0)} interne Links',
+            "quickwin": "Mehr interne Links setzen — KI-Crawler folgen diesen Links, um Ihren Betrieb besser zu verstehen.",
+            "howto":    "Verlinken Sie auf Ihrer Startseite zu den wichtigsten Unterseiten: Zimmer/Wohnungen, Preise, Lage/Anreise, Aktivitäten, Kontakt. Jeder Link hilft KI-Systemen, mehr über Ihr Angebot zu erfahren. Konkret: Schreiben Sie z.B. 'Entdecken Sie unsere Zimmer' und verlinken Sie den Text auf die Zimmer-Seite. Mindestens 3-5 interne Links auf der Startseite sind empfohlen.",
+            "impact":   "Crawl-Tiefe & Kontext",
+            "category": "Crawlbarkeit & Indexierung",
+        },
+        # ── SECTION: KI-Zitierbarkeit & Inhalte ──
+        {
+            "name":     "Meta-Description vorhanden",
+            "ok":       facts.get("meta_desc_ok", False),
+            "detail":   f'"{facts["meta_desc"][:60]}…"' if facts.get("meta_desc_ok") else "Fehlt",
+            "quickwin": "Meta-Description fehlt — das ist der kurze Vorschautext, den KI-Systeme als Zusammenfassung nutzen.",
+            "howto":    "Schreiben Sie eine kurze, ansprechende Beschreibung Ihres Betriebs in max. 155 Zeichen. Beispiel: '4-Sterne Wellnesshotel in Kitzbühel mit Panorama-Spa, regionaler Küche und direktem Zugang zu 170 km Skipisten.' Bei WordPress: Im Yoast SEO Plugin unter jeder Seite die 'Meta-Beschreibung' ausfüllen. Bei anderen Systemen: Ihr Webentwickler fügt im HTML-Head ein: <meta name=\"description\" content=\"Ihr Text hier\">",
+            "impact":   "KI-Zitierbarkeit & Klickrate",
+            "category": "KI-Zitierbarkeit & Inhalte",
+        },
+        {
+            "name":     "Page Title vorhanden",
+            "ok":       facts.get("title_ok", False),
+            "detail":   f'"{facts["page_title"][:50]}…"' if facts.get("title_ok") else "Fehlt",
+            "quickwin": "Page Title fehlt oder ist unzureichend — der Seitentitel ist Ihre 'Visitenkarte' für KI-Systeme.",
+            "howto":    "Der Seitentitel sollte Ihren Betriebsnamen, den Ort und Ihr Alleinstellungsmerkmal enthalten. Beispiel: 'Hotel Alpenstern Kitzbühel | 4-Sterne Wellness & Ski'. Maximum 60 Zeichen. Bei WordPress: Den Titel im Yoast SEO Plugin bearbeiten. Bei anderen Systemen: Im HTML-Head den <title>-Tag anpassen. Jede Seite braucht einen eigenen, einzigartigen Titel!",
+            "impact":   "KI-Zitierbarkeit & Auffindbarkeit",
+            "category": "KI-Zitierbarkeit & Inhalte",
+        },
+        {
+            "name":     "H1-Überschrift vorhanden",
+            "ok":       facts.get("h1_ok", False),
+            "detail":   (f'"{facts["h1_text"][:50]}…"' if facts.get("h1_ok")
+                         else (f'{facts.get("h1_count", 0)} H1-Tags gefunden (genau 1 empfohlen)' if facts.get("h1_count", 0) > 1
+                               else "Keine H1-Überschrift gefunden")),
+            "quickwin": "Die H1-Überschrift ist die 'Hauptüberschrift' Ihrer Seite — KI-Systeme nutzen sie, um den Kerninhalt zu erkennen.",
+            "howto":    "Jede Seite braucht genau eine H1-Überschrift (die größte Überschrift). Sie sollte klar beschreiben, worum es auf der Seite geht. Beispiel für die Startseite: 'Willkommen im Hotel Alpenstern — Ihr 4-Sterne Wellnesshotel in Kitzbühel'. Bei WordPress: Die erste Überschrift im Editor als 'Überschrift 1' formatieren. Wichtig: Nur EINE H1 pro Seite, weitere Überschriften als H2 oder H3.",
+            "impact":   "Inhaltsstruktur & KI-Verständnis",
+            "category": "KI-Zitierbarkeit & Inhalte",
+        },
+        # (Textsubstanz der Startseite wird jetzt von Signal 3 geprüft,
+        #  Schema.org/JSON-LD inkl. Lodging-Entität von Signal 2 — siehe Ampel oben)
+        # ── SECTION: Social & Sharing ──
+        {
+            "name":     "Open Graph Tags (og:title, og:description, og:image)",
+            "ok":       facts.get("og_ok", False),
+            "detail":   f'Gefunden: {", ".join(og_found)}' if og_found else "Keine OG-Tags gefunden",
+            "quickwin": "Open Graph Tags fehlen — diese steuern, wie Ihr Betrieb auf Social Media UND in KI-Systemen dargestellt wird.",
+            "howto":    "Open Graph Tags bestimmen Titel, Beschreibung und Vorschaubild, wenn jemand Ihre Website auf Facebook, WhatsApp oder LinkedIn teilt — und KI-Systeme nutzen sie ebenfalls. Bei WordPress: Yoast SEO → unter jeder Seite den Tab 'Social' öffnen und Titel, Beschreibung und Bild eintragen. Ohne WordPress: Ihr Webentwickler fügt im HTML-Head ein: og:title (Betriebsname), og:description (kurze Beschreibung), og:image (ein ansprechendes Foto, mind. 1200×630 Pixel).",
+            "impact":   "KI-Kontext & Social Sharing",
+            "category": "Social & Sharing",
+        },
+        # ── SECTION: Sprache & International ──
+        {
+            "name":     "Sprach-Attribut (lang=)",
+            "ok":       facts.get("lang_ok", False),
+            "detail":   f'lang="{facts["lang"]}"' if facts.get("lang_ok") else "Fehlt",
+            "quickwin": "Sprach-Attribut fehlt — KI-Systeme wissen nicht, in welcher Sprache Ihre Seite geschrieben ist.",
+            "howto":    "Das Sprach-Attribut ist eine kleine Ergänzung ganz am Anfang Ihres HTML-Codes. Ihr Webentwickler muss nur sicherstellen, dass der HTML-Tag so aussieht: <html lang=\"de\"> (für Deutsch) oder <html lang=\"de-AT\"> (für österreichisches Deutsch). Bei WordPress: Die meisten Themes setzen das automatisch — prüfen Sie unter Einstellungen → Allgemein, ob die richtige Sprache eingestellt ist.",
+            "impact":   "Sprachliche Einordnung",
+            "category": "Sprache & International",
+        },
+        {
+            "name":     "Hreflang-Tags (Mehrsprachigkeit)",
+            "ok":       facts.get("hreflang_ok", False),
+            "detail":   f'Sprachen: {", ".join(facts.get("hreflang_langs", []))}' if facts.get("hreflang_ok") else "Keine Hreflang-Tags — nur einsprachig",
+            "quickwin": "Hreflang-Tags fehlen — für internationale Gäste wissen KI-Systeme nicht, ob es Ihre Seite in anderen Sprachen gibt.",
+            "howto":    "Hreflang-Tags sind relevant, wenn Sie Ihre Website in mehreren Sprachen anbieten (z.B. Deutsch + Englisch). Sie signalisieren KI-Systemen: 'Diese Seite gibt es auch auf Englisch unter dieser URL.' Bei WordPress: Das Plugin 'WPML' oder 'Polylang' setzt Hreflang-Tags automatisch. Falls Ihre Website nur auf Deutsch existiert und Sie keine internationalen Gäste ansprechen, ist dieser Punkt weniger wichtig — aber für Tourismusbetriebe mit internationaler Kundschaft sehr empfohlen.",
+            "impact":   "Internationale KI-Sichtbarkeit",
+            "category": "Sprache & International",
+        },
+        # ── SECTION: Barrierefreiheit & Medien ──
+        {
+            "name":     "Bilder mit Alt-Texten (min. 80%)",
+            "ok":       facts.get("img_alt_ok", True),
+            "detail":   f'{img_alt} von {img_total} Bildern mit Alt-Text ({img_pct}%)' if img_total > 0 else "Keine Bilder gefunden",
+            "quickwin": f"Alt-Texte für Bilder ergänzen ({img_pct}% vorhanden) — KI-Systeme können Bilder ohne Beschreibung nicht 'sehen'.",
+            "howto":    "Alt-Texte sind kurze Beschreibungen, die jedem Bild zugeordnet werden. Beispiel: Statt leer → 'Panoramablick vom Balkon des Hotel Alpenstern auf die Kitzbüheler Alpen'. Bei WordPress: Klicken Sie auf ein Bild in der Mediathek und füllen Sie das Feld 'Alternativer Text' aus. Beschreiben Sie, was auf dem Bild zu sehen ist — kurz, sachlich, mit Ortsbezug. Das hilft nicht nur KI-Systemen, sondern auch sehbehinderten Gästen und verbessert Ihre Barrierefreiheit.",
+            "impact":   "KI-Bildverständnis & Barrierefreiheit",
+            "category": "Barrierefreiheit & Medien",
+        },
+    ]
+
+
+# Bewertet wird mit der Ampel der Signal-Module (GRÜN/GELB/ROT/UNBEKANNT),
+# nicht mehr mit einem Punkte-Score. Logik: signals/__init__.py + befund.py.
+ANZAHL_ZUSATZ_CHECKS = 15
+
+